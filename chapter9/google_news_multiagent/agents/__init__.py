@@ -1,11 +1,17 @@
 from .collector import RSSCollectorAgent
+from .deduplicator import NewsDeduplicatorAgent
+from .clusterer import NewsClusterAgent
 from .summarizer import NewsSummarizerAgent
 from .organizer import NewsOrganizerAgent
+from .analyzer import NewsAnalyzerAgent
 from .reporter import ReportGeneratorAgent
 
 __all__ = [
     "RSSCollectorAgent",
+    "NewsDeduplicatorAgent",
+    "NewsClusterAgent",
     "NewsSummarizerAgent",
     "NewsOrganizerAgent",
+    "NewsAnalyzerAgent",
     "ReportGeneratorAgent",
 ]
@@ -0,0 +1,194 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
+
+from state import NewsState
+from articles import Article, LLM_LABEL
+from config import Config
+from cache import SQLiteCache, content_key, model_name
+from llm_scheduler import LLMScheduler, estimate_tokens
+from compression import prepare_content, prepare_sources
+from metrics import MetricsCollector
+from model_router import ModelRouter
+from agents.organizer import NewsOrganizerAgent
+
+class NewsAnalysis(BaseModel):
+    """뉴스 한 건의 요약과 분류 결과"""
+    summary: str = Field(description="두세 문장 요약")
+    category: str = Field(description="카테고리")
+
+class NewsAnalyzerAgent:
+    """한 번의 LLM 호출로 뉴스 요약과 카테고리 분류를 함께 수행하는 에이전트"""
+
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        organizer: NewsOrganizerAgent,
+        scheduler: LLMScheduler = None,
+        analysis_cache: Optional[SQLiteCache] = None,
+        metrics: Optional[MetricsCollector] = None,
+        router: Optional[ModelRouter] = None,
+    ):
+        self.name = "News Analyzer"
+        self.llm = llm
+        # router가 있으면 기사마다 fast/strong 단계 모델 중 하나로 분석
+        self.router = router
+        self.organizer = organizer
+        self.scheduler = scheduler or LLMScheduler()
+        self.metrics = metrics or MetricsCollector()
+        self.analysis_cache = analysis_cache
+        if analysis_cache is None and Config.LLM_CACHE_ENABLED:
+            self.analysis_cache = SQLiteCache(
+                Config.CACHE_DB_PATH,
+                namespace="analysis",
+                ttl=Config.SUMMARY_CACHE_TTL,
+                max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES,
+            )
+
+        self.prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    f"""당신은 뉴스 요약 및 분류 전문가입니다.
+                    주어진 뉴스를 핵심만 간결하게 두세 문장으로 요약하고, 카테고리를 분류해주세요.
+                    - 사실만을 전달하고 추측은 피하세요
+                    - 중요한 숫자나 날짜는 포함하세요
+                    - 카테고리는 다음 중 하나만 선택하세요: {", ".join(Config.NEWS_CATEGORIES)}""",
+                ),
+                ("human", "제목: {title}\n내용: {content}"),
+            ]
+        )
+        self._chains = {}
+        self.stats = {"requests": 0, "cached": 0, "fallbacks": 0}
+
+    def chain_for(self, llm: BaseChatModel):
+        """구조화된 출력을 사용하는 요약+분류 체인 (모델마다 처음 사용할 때 생성)"""
+        if id(llm) not in self._chains:
+            self._chains[id(llm)] = self.prompt | llm.with_structured_output(NewsAnalysis)
+        return self._chains[id(llm)]
+
+    def select_model(self, news_item: Article, sources: List[Article]) -> BaseChatModel:
+        """라우터가 있으면 원문 길이와 출처 수로 고른 단계의 모델, 없으면 기본 모델"""
+        if not self.router:
+            return self.llm
+        return self.router.route_summary(news_item.title, [news.content for news in sources])
+
+    def cache_key(self, inputs: Dict[str, str], llm: BaseChatModel = None) -> str:
+        """제목/본문/프롬프트/모델이 모두 같을 때만 같은 키"""
+        return content_key(
+            inputs["title"],
+            inputs["content"],
+            self.prompt.pretty_repr(),
+            model_name(llm or self.llm),
+        )
+
+    async def request_analysis(
+            self, inputs: Dict[str, str], llm: BaseChatModel = None
+    ) -> Optional[Dict[str, str]]:
+        """캐시를 먼저 확인하고, 없으면 LLM에 요약과 분류를 요청합니다."""
+        llm = llm or self.llm
+        key = self.cache_key(inputs, llm)
+        if self.analysis_cache and (cached := self.analysis_cache.get(key)):
+            self.stats["cached"] += 1
+            return cached
+
+        self.stats["requests"] += 1
+        chain = self.chain_for(llm)
+        try:
+            with self.metrics.timer("analyze"):
+                response = await self.scheduler.submit(
+                    lambda: chain.ainvoke(inputs, {"callbacks": self.metrics.callbacks}),
+                    estimate_tokens(inputs["title"], inputs["content"]),
+                )
+        except Exception as e:
+            self.metrics.count_error("analyze")
+            print(f" [{self.name}] 분석 오류 (Title: {inputs['title']}): {str(e)[:50]}...")
+            return None
+
+        analysis = {
+            "summary": response.summary.strip(),
+            "category": response.category.strip(),
+        }
+        valid = analysis["summary"] and analysis["category"] in Config.NEWS_CATEGORIES
+        if self.analysis_cache and valid:
+            self.analysis_cache.set(key, analysis)
+        return analysis
+
+    async def analyze_single_news(
+            self, news_item: Article, related: Optional[List[Article]] = None
+    ) -> Tuple[Optional[str], Article]:
+        """
+        단일 뉴스 요약+분류 (related가 있으면 같은 사건의 기사를 종합해 요약)
+        카테고리가 목록에 없거나 호출이 실패하면 분류 에이전트의 개별 분류로 대신합니다.
+        """
+        sources = [news for news in [news_item, *(related or [])] if news.content]
+        if len(sources) > 1:
+            content = prepare_sources([(news.source, news.title, news.content) for news in sources])
+        else:
+            content = prepare_content(news_item.title, news_item.content)
+        analysis = await self.request_analysis(
+            {"title": news_item.title, "content": content}, self.select_model(news_item, sources)
+        )
+
+        if analysis and analysis["summary"] and sum(len(news.content) for news in sources) >= 50:
+            news_item.ai_summary = analysis["summary"]
+
+        if analysis and analysis["category"] in Config.NEWS_CATEGORIES:
+            return analysis["category"], news_item
+
+        self.stats["fallbacks"] += 1
+        try:
+            category, news_item = await self.organizer.categorize_single_news(news_item)
+        except Exception as e:
+            self.metrics.count_error("classify")
+            print(f"  분류 작업 실패: {e}")
+            return None, news_item
+        return category, news_item
+
+    async def analyze_news(self, state: NewsState) -> NewsState:
+        """모든 뉴스를 한 단계에서 요약하고 분류"""
+        print(f"\n[{self.name}] 뉴스 요약/분류 시작...")
+        self.stats = {"requests": 0, "cached": 0, "fallbacks": 0}
+        self.scheduler.reset_stats()
+        if self.router:
+            self.router.reset()
+
+        results = await asyncio.gather(
+            *(
+                self.analyze_single_news(news, state.articles.get(news.related))
+                for news in state.articles.get(state.raw_news)
+            )
+        )
+
+        categorized = defaultdict(list)
+        for category, news_item in results:
+            if category is not None:
+                news_item.category = self.organizer.normalize_category(category)
+                news_item.category_source = LLM_LABEL
+                categorized[news_item.category].append(news_item.id)
+
+        print(
+            f"  LLM 요청 {self.stats['requests']}회, 캐시 적중 {self.stats['cached']}건, "
+            f"개별 분류 대체 {self.stats['fallbacks']}건"
+        )
+        state.metrics["analysis"] = dict(self.stats)
+        state.metrics["llm_scheduler"] = self.scheduler.metrics()
+        if self.router:
+            state.metrics["routing"] = self.router.print_stats(self.metrics)
+        self.organizer.print_distribution(categorized)
+
+        state.summarized_news = [news_item.id for _, news_item in results]
+        state.categorized_news = dict(categorized)
+        state.messages.append(
+            AIMessage(
+                content=f"{len(results)}개의 뉴스를 요약하고 "
+                f"{len(categorized)}개 카테고리로 분류했습니다."
+            )
+        )
+        print(f"[{self.name}] 요약/분류 완료\n")
+        return state
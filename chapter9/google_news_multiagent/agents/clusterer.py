@@ -0,0 +1,83 @@
+from typing import Optional
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage
+from langchain_openai import OpenAIEmbeddings
+
+from state import NewsState
+from config import Config
+from articles import Article
+from clustering import IncrementalClusterer, SparseVector, dense_vector, tfidf_vectors
+from dedup import alternate_source, normalize_title
+
+class NewsClusterAgent:
+    """같은 사건을 다룬 여러 언론사 기사를 하나의 사건으로 묶어 사건마다 한 번만 요약하게 하는 에이전트"""
+
+    def __init__(self, embeddings: Optional[Embeddings] = None):
+        self.name = "News Clusterer"
+        self.embeddings = embeddings
+        if embeddings is None and Config.CLUSTER_EMBEDDINGS:
+            self.embeddings = OpenAIEmbeddings(model=Config.EMBEDDING_MODEL)
+
+    @staticmethod
+    def cluster_text(news: Article) -> str:
+        """제목(두 번 넣어 가중)과 본문 앞부분"""
+        title = normalize_title(news.title, news.source)
+        return f"{title}\n{title}\n{news.content[: Config.CLUSTER_CONTENT_CHARS]}"
+
+    async def vectorize(self, texts: list[str]) -> tuple[list[SparseVector], float, str]:
+        """임베딩을 쓸 수 있으면 임베딩, 아니면 로컬 TF-IDF 벡터와 그에 맞는 유사도 임계값"""
+        if self.embeddings:
+            try:
+                embeddings = await self.embeddings.aembed_documents(texts)
+                vectors = [dense_vector(embedding) for embedding in embeddings]
+                return vectors, Config.CLUSTER_EMBEDDING_SIMILARITY, "embeddings"
+            except Exception as e:
+                print(f"  임베딩 요청 실패, 로컬 TF-IDF로 대체: {str(e)[:50]}")
+        return tfidf_vectors(texts), Config.CLUSTER_SIMILARITY, "tfidf"
+
+    async def cluster_news(self, state: NewsState) -> NewsState:
+        """기사를 사건별로 묶고, 사건마다 대표 기사(피드에서 가장 앞선 기사)만 남깁니다."""
+        print(f"\n[{self.name}] 사건 군집화 시작...")
+        try:
+            news_list = state.articles.get(state.raw_news)
+            vectors, threshold, method = await self.vectorize(
+                [self.cluster_text(news) for news in news_list]
+            )
+
+            clusterer = IncrementalClusterer(threshold)
+            for i, vector in enumerate(vectors):
+                clusterer.add(i, vector)
+
+            representatives, clustered = [], 0
+            for members in clusterer.clusters:
+                lead, *related = (news_list[i] for i in members)
+                lead.related = [news.id for news in related]
+                lead.related_sources = [alternate_source(news) for news in related]
+                representatives.append(lead.id)
+                clustered += len(related)
+
+            multi_source = sum(1 for members in clusterer.clusters if len(members) > 1)
+            state.metrics["clustering"] = {
+                "method": method,
+                "articles": len(news_list),
+                "clusters": len(representatives),
+                "multi_source_clusters": multi_source,
+                "clustered": clustered,
+                # 대표 기사의 요약에 출처로만 들어가고 따로 요약/분류하지 않는 기사 수
+                "articles_skipped": clustered,
+            }
+            state.raw_news = representatives
+            print(
+                f"  {len(news_list)}건 -> 사건 {len(representatives)}개 "
+                f"(여러 출처 사건 {multi_source}개, 개별 요약/분류 생략 {clustered}건, {method})"
+            )
+            state.messages.append(
+                AIMessage(content=f"기사 {clustered}건을 같은 사건의 다른 보도로 묶었습니다.")
+            )
+        except Exception as e:
+            print(f"사건 군집화 중 오류 발생: {e}")
+            state.error_log.append(f"NewsClusterAgent: {str(e)}")
+
+        print(f"[{self.name}] 군집화 완료")
+        return state
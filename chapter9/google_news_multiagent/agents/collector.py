@@ -1,51 +1,207 @@
 import json
-import re
 import asyncio
-from typing import Optional
+import hashlib
+import calendar
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
 
-import httpx
 import feedparser
-import trafilatura
-from bs4 import BeautifulSoup
 from utils import convert_gmt_to_kst
 from state import NewsState
+from articles import Article
+from config import Config
+from http_client import PooledHttpClient
+from cache import SQLiteCache
+from ledger import NewsLedger
+from metrics import MetricsCollector
+from extractors import extract_chosun_content, extract_content, find_extractor
+from redirect_parsers import find_data_p, get_parser
 
 GOOGLE_NEWS_BASE_URL = "https://news.google.com"
 GOOGLE_NEWS_API_URL = f"{GOOGLE_NEWS_BASE_URL}/_/DotsSplashUi/data/batchexecute"
 KOREA_PARAMS = "&hl=ko&gl=KR&ceid=KR:ko"
 
+
+def entry_id(entry) -> str:
+    """RSS 항목의 고유 ID"""
+    return entry.get("id") or entry.link
+
+
+def entry_timestamp(entry) -> float:
+    """피드 항목의 발행 시각 (UTC epoch 초)"""
+    published = entry.get("published_parsed") or entry.get("updated_parsed")
+    return calendar.timegm(published) if published else 0.0
+
+
+def entry_fingerprint(entry) -> str:
+    """제목이나 갱신 시각이 바뀌면 달라지는 항목 지문"""
+    raw = "|".join([entry.title, entry.get("published", ""), entry.get("updated", "")])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
 class RSSCollectorAgent:
     """RSS 피드를 수집하는 에이전트"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[PooledHttpClient] = None,
+        url_cache: Optional[SQLiteCache] = None,
+        ledger: Optional[NewsLedger] = None,
+        incremental: Optional[bool] = None,
+        feed_urls: Optional[list[str]] = None,
+        metrics: Optional[MetricsCollector] = None,
+    ):
         self.name = "RSS Collector"
-        self.rss_url = f"{GOOGLE_NEWS_BASE_URL}/rss?{KOREA_PARAMS[1:]}"
-        self.feed = None
-    
-    def load_feed(self) -> None:
-        """RSS 피드를 로드합니다."""
-        self.feed = feedparser.parse(self.rss_url)
-
-    @staticmethod
-    def extract_chosun_content(html_content):
-        """조선일보 기사 내용을 특별 처리합니다."""
-        pattern = r"Fusion\.globalContent\s*=\s*({.*?});"
-        match = re.search(pattern, html_content, re.DOTALL)
-
-        if match:
-            try:
-                content_data = json.loads(match.group(1))
-                texts = []
-
-                if "content_elements" in content_data:
-                    for element in content_data["content_elements"]:
-                        if element.get("type") == "text" and "content" in element:
-                            texts.append(element["content"])
-                return "\n\n".join(texts)
-            except json.JSONDecodeError:
-                pass
-        return ""
+        self.feed_urls = feed_urls or Config.RSS_URLS
+        self.incremental = Config.INCREMENTAL if incremental is None else incremental
+        self.http = http_client or PooledHttpClient()
+        self.url_cache = url_cache or SQLiteCache(
+            Config.CACHE_DB_PATH,
+            "article_url",
+            ttl=Config.URL_CACHE_TTL,
+            max_entries=Config.URL_CACHE_MAX_ENTRIES,
+        )
+        self.ledger = ledger or NewsLedger(
+            Config.LEDGER_DB_PATH, retention=Config.LEDGER_RETENTION
+        )
+        self.metrics = metrics or MetricsCollector()
+        self._pending_feed_states: dict[str, tuple] = {}
+        self.errors: list[str] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트, 캐시, 장부, 추출용 프로세스 풀을 닫습니다."""
+        await self.http.aclose()
+        self.url_cache.close()
+        self.ledger.close()
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    @property
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        """본문 추출/리디렉션 파싱용 프로세스 풀 (EXTRACT_WORKERS가 0이면 이벤트 루프 밖 스레드에서 실행)"""
+        if self._executor is None and Config.EXTRACT_WORKERS > 0:
+            self._executor = ProcessPoolExecutor(max_workers=Config.EXTRACT_WORKERS)
+        return self._executor
     
+    async def load_feed(
+        self, url: str, previous: Optional[dict[str, Any]] = None
+    ) -> Optional[list]:
+        """RSS 피드를 로드합니다. 조건부 요청 결과 변경이 없으면(304) None"""
+        headers = {}
+        if previous:
+            if previous["etag"]:
+                headers["if-none-match"] = previous["etag"]
+            if previous["last_modified"]:
+                headers["if-modified-since"] = previous["last_modified"]
+
+        response = await self.http.get(url, headers=headers)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        feed = feedparser.parse(response.content)
+        self._pending_feed_states[url] = (
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+            [entry_id(entry) for entry in feed.entries],
+        )
+        return feed.entries
+
+    async def load_feed_items(self, url: str) -> tuple[list, list[dict[str, Any]]]:
+        """
+        피드 하나의 항목을 가져옵니다.
+        증분 모드에서 피드가 바뀌지 않았으면(304) 장부에 기록된 기사로 대신합니다.
+        """
+        if not self.incremental:
+            return await self.load_feed(url), []
+
+        previous = self.ledger.get_feed_state(url)
+        entries = await self.load_feed(url, previous)
+        if entries is None:
+            recorded = [self.ledger.lookup(news_id) for news_id in previous["entry_ids"]]
+            if all(recorded):
+                print(f"피드 변경 없음 (304 Not Modified): {url}")
+                return [], recorded
+            # 장부에 없는 항목이 있으면 조건 없이 피드를 다시 받음
+            entries = await self.load_feed(url)
+        return entries, []
+
+    def keep_selected_feed_states(self, selected_ids: set[str]) -> None:
+        """
+        피드 상태에는 이번 실행에서 선택된(장부에 기록될) 항목 ID만 남깁니다.
+        잘려 나간 항목까지 남기면 다음 실행의 304 응답에서 장부 조회가 실패해 피드를 다시 받게 됩니다.
+        """
+        for url, (etag, last_modified, entry_ids) in self._pending_feed_states.items():
+            self._pending_feed_states[url] = (
+                etag,
+                last_modified,
+                [news_id for news_id in entry_ids if news_id in selected_ids],
+            )
+
+    async def select_entries(self) -> tuple[list, list[dict[str, Any]]]:
+        """
+        모든 피드를 동시에 받아 항목 ID로 병합하고, 최신순으로 MAX_NEWS_COUNT개만 남긴 뒤
+        새로 처리할 피드 항목과 장부에서 재사용할 기사를 나눕니다.
+        기사 페이지를 내려받기 전에 잘라내므로 구독 피드 수와 무관하게 기사 단위 작업량이 제한됩니다.
+        """
+        self._pending_feed_states = {}
+        results = await asyncio.gather(
+            *(self.load_feed_items(url) for url in self.feed_urls),
+            return_exceptions=True,
+        )
+
+        merged: dict[str, tuple[float, Any, Optional[dict[str, Any]]]] = {}
+        for url, result in zip(self.feed_urls, results):
+            if isinstance(result, Exception):
+                self.errors.append(f"피드 로드 실패 ({url}): {str(result)[:100]}")
+                continue
+            entries, recorded = result
+            for entry in entries:
+                merged.setdefault(entry_id(entry), (entry_timestamp(entry), entry, None))
+            for news in recorded:
+                # 중복으로 묶였던 기사는 대표 기사의 다른 출처로 함께 재사용됨
+                if not news.get("duplicate_of"):
+                    merged.setdefault(news["entry_id"], (news.get("published_ts", 0), None, news))
+
+        if not merged and len(self.errors) == len(self.feed_urls):
+            raise RuntimeError("모든 RSS 피드 로드에 실패했습니다.")
+
+        latest = sorted(merged.values(), key=lambda item: item[0], reverse=True)
+        selected = latest[: Config.MAX_NEWS_COUNT]
+        self.keep_selected_feed_states(
+            {entry_id(entry) if news is None else news["entry_id"] for _, entry, news in selected}
+        )
+        entries, reused_news = [], []
+        for _, entry, news in selected:
+            if news is None and self.incremental:
+                news = self.ledger.lookup(entry_id(entry), entry_fingerprint(entry))
+            if news is None:
+                entries.append(entry)
+            elif not news.get("duplicate_of"):
+                reused_news.append(news)
+
+        print(
+            f"피드 {len(self.feed_urls)}개에서 고유 항목 {len(merged)}건 -> "
+            f"최신 {min(len(merged), Config.MAX_NEWS_COUNT)}건 선택"
+        )
+        return entries, reused_news
+
+    extract_chosun_content = staticmethod(extract_chosun_content)
+
+    async def find_data_p(self, page: str) -> Optional[str]:
+        """
+        리디렉션 페이지에서 data-p 값을 꺼냅니다.
+        트리를 만드는 파서는 본문 추출과 같은 프로세스 풀에 나눠 실행하고, scan은 바로 실행합니다.
+        """
+        parser = get_parser()
+        with self.metrics.timer("redirect_parse"):
+            if not parser.builds_tree:
+                return parser.parse(page)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, find_data_p, page, parser.name)
+
     async def extract_article_url(self, google_news_url: str) -> Optional[str]:
         """
         Stack Overflow 솔루션 활용
@@ -53,93 +209,195 @@ class RSSCollectorAgent:
         79388987#79388987
         Google News는 JavaScript를 사용하여 페이지를 리다이렉션 시키므로 내부 API를 직접 호출하여 우회
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(google_news_url)
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                data_element = soup.select_one("c-wiz[data-p]")
-                if not data_element:
-                    return None
-                
-                raw_data = data_element.get("data-p")
-                json_data = json.loads(raw_data.replace("%.@.", '["garturlreq"]'))
-                payload = {
-                    "f.req": json.dumps(
+        try:
+            response = await self.http.get(google_news_url)
+            response.raise_for_status()
+            raw_data = await self.find_data_p(response.text)
+            if not raw_data:
+                raise ValueError("c-wiz[data-p] 요소를 찾을 수 없습니다")
+
+            json_data = json.loads(raw_data.replace("%.@.", '["garturlreq",'))
+            payload = {
+                "f.req": json.dumps(
+                    [
                         [
                             [
-                                [
-                                    "Fbv4je",
-                                    json.dumps(json_data[:-6] + json_data[-2:]),
-                                    "null",
-                                    "generic", 
-                                ]
+                                "Fbv4je",
+                                json.dumps(json_data[:-6] + json_data[-2:]),
+                                "null",
+                                "generic", 
                             ]
                         ]
-                    )
-                }
+                    ]
+                )
+            }
 
-                headers = {
-                    "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
-                    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)AppleWebKit/537.36",
-                }
+            headers = {
+                "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
+                "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)AppleWebKit/537.36",
+            }
 
-                api_response = await client.post(
-                    GOOGLE_NEWS_API_URL, headers=headers, data=payload
-                )
-                cleaned_response = api_response.text.replace(")]}", "")
-                response_data = json.loads(cleaned_response)
-                article_url = json.loads(response_data[0][2])[1]
-                return article_url
-            
-            except Exception:
-                return None
-            
-    async def parse_entry(self, entry) -> dict[str, Optional[str]]:
-        """RSS 피드 항목을 파싱합니다."""
+            api_response = await self.http.post(
+                GOOGLE_NEWS_API_URL, headers=headers, data=payload
+            )
+            api_response.raise_for_status()
+            cleaned_response = api_response.text.replace(")]}'", "")
+            response_data = json.loads(cleaned_response)
+            article_url = json.loads(response_data[0][2])[1]
+            return article_url
+        
+        except Exception as e:
+            self.errors.append(f"원문 URL 디코딩 실패 ({google_news_url}): {str(e)[:100]}")
+            return None
+        
+    async def download_article(self, url: str) -> Optional[str]:
+        """
+        공유 클라이언트로 기사 HTML을 스트리밍으로 내려받습니다.
+        빠른 추출기가 있는 언론사는 본문 데이터가 나타나면 다운로드를 멈춥니다.
+        """
+        extractor = find_extractor(url)
+        try:
+            return await self.http.fetch_html(
+                url,
+                max_bytes=Config.MAX_ARTICLE_BYTES,
+                content_types=Config.ARTICLE_CONTENT_TYPES,
+                stop_marker=extractor.marker if extractor else None,
+            )
+        except Exception as e:
+            self.errors.append(f"기사 다운로드 실패 ({url}): {str(e)[:100]}")
+            return None
+
+    async def extract(self, html_content: str, url: str) -> str:
+        """CPU를 많이 쓰는 본문 추출을 이벤트 루프 밖에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self.executor, extract_content, html_content, url
+            )
+        except Exception:
+            return ""
+
+    async def parse_entry(self, entry) -> Article:
+        """RSS 피드 항목을 파싱합니다. (저장소에 넣기 전이라 ID는 없음)"""
         google_news_url = entry.link + KOREA_PARAMS
 
-        original_url = await self.extract_article_url(google_news_url)
+        # Google News 링크 -> 원문 URL 매핑은 변하지 않으므로 캐시를 먼저 확인
+        original_url = self.url_cache.get(entry.link)
+        if original_url is None:
+            with self.metrics.timer("resolve"):
+                original_url = await self.extract_article_url(google_news_url)
+            if original_url:
+                self.url_cache.set(entry.link, original_url)
+
         content = ""
 
         if original_url:
-            downloaded = trafilatura.fetch_url(original_url)
+            with self.metrics.timer("fetch"):
+                downloaded = await self.download_article(original_url)
 
             if downloaded:
-                if "chosun.com" in original_url:
-                    content = self.extract_chosun_content(downloaded)
-                else:
-                    content = trafilatura.extract(
-                        downloaded,
-                        include_comments=False,
-                        include_images=False,
-                        include_links=False,
-                        target_language="ko",
-                    )
-        return {
-            "title": entry.title,
-            "published_kst": convert_gmt_to_kst(entry.published),
-            "source": entry.source.get("title", "Unknown"),
-            "google_news_url": google_news_url,
-            "original_url": original_url,
-            "content": content or "",
-        }
+                with self.metrics.timer("extract"):
+                    content = await self.extract(downloaded, original_url)
+        return Article(
+            title=entry.title,
+            published_kst=convert_gmt_to_kst(entry.published),
+            source=entry.source.get("title", "Unknown"),
+            google_news_url=google_news_url,
+            original_url=original_url,
+            content=content or "",
+            published_ts=entry_timestamp(entry),
+            entry_id=entry_id(entry),
+            fingerprint=entry_fingerprint(entry),
+        )
     
+    def reset_stats(self) -> None:
+        """연결 풀, 캐시, 호스트별 요청 통계를 이번 실행 기준으로 초기화합니다."""
+        self.http.reset_stats()
+        self.url_cache.reset_stats()
+
+    def report_stats(self, state: NewsState) -> None:
+        """연결 풀, 캐시, 호스트별 요청 통계와 수집 오류를 상태에 기록합니다."""
+        stats = self.http.stats()
+        print(
+            f"연결 풀: 요청 {stats['requests']}건, "
+            f"새 연결 {stats['new_connections']}건, "
+            f"재사용 {stats['reused_connections']}건, "
+            f"TLS 핸드셰이크 {stats['tls_handshakes']}건"
+        )
+        print(
+            f"기사 다운로드: {stats['bytes_read'] / 1024:.0f}KB, "
+            f"조기 종료 {stats['early_stops']}건, 용량 제한 {stats['truncated']}건, "
+            f"HTML 아님 {stats['rejected']}건"
+        )
+        cache_stats = self.url_cache.stats()
+        print(
+            f"URL 캐시: 적중 {cache_stats['hits']}건, "
+            f"미스 {cache_stats['misses']}건 ({cache_stats['hit_rate']:.0%})"
+        )
+
+        fetch_metrics = self.http.scheduler.metrics()
+        for host, host_metrics in fetch_metrics.items():
+            print(
+                f"  {host}: 성공 {host_metrics['success']}/{host_metrics['requests']}, "
+                f"4xx {host_metrics['client_errors']}, "
+                f"재시도 {host_metrics['retries']}, 제한 {host_metrics['throttled']}, "
+                f"평균 {host_metrics['avg_latency'] * 1000:.0f}ms"
+            )
+        state.metrics["fetch"] = fetch_metrics
+        state.metrics["http_pool"] = stats
+        state.metrics["url_cache"] = cache_stats
+
+        if self.errors:
+            print(f"수집 실패 {len(self.errors)}건 (오류 로그 참조)")
+            state.error_log.extend(f"RSSCollectorAgent: {error}" for error in self.errors)
+
     async def collect_rss(self, state: NewsState) -> NewsState:
         """RSS 피드를 수집하고 상태를 업데이트합니다."""
         print("--- RSS 피드 수집 시작 ---")
 
+        self.errors = []
+        self.reset_stats()
         try:
-            if not self.feed:
-                self.load_feed()
+            entries, reused_news = await self.select_entries()
 
-            tasks = [self.parse_entry(entry) for entry in self.feed.entries]
+            tasks = [self.parse_entry(entry) for entry in entries]
             raw_news = await asyncio.gather(*tasks)
 
-            state.raw_news = raw_news
+            state.raw_news = [state.articles.add(article) for article in raw_news]
+            state.reused_news = [
+                state.articles.add(Article.from_record(news)) for news in reused_news
+            ]
             print(f"총 {len(raw_news)}개의 뉴스 기사 수집 완료")
+            if reused_news:
+                print(f"이전 실행 요약 재사용: {len(reused_news)}건")
+
+            self.report_stats(state)
 
         except Exception as e:
             print(f"RSS피드 수집 중 오류 발생: {e}")
             state.error_log.append(f"RSSCollectorAgent: {str(e)}")
-        return state
\ No newline at end of file
+        return state
+
+    async def record_ledger(self, state: NewsState) -> NewsState:
+        """분류까지 끝난 기사와 피드 조건부 요청 정보를 장부에 기록합니다."""
+        try:
+            processed = []
+            for category, news_ids in state.categorized_news.items():
+                for news in state.articles.get(news_ids):
+                    processed.append({**news.to_record(), "category": category})
+                    # 중복 기사와 같은 사건의 다른 기사는 대표 기사와 함께 재사용되도록 기록
+                    processed.extend(
+                        {**alternate, "category": category, "duplicate_of": news.entry_id}
+                        for alternate in news.alternate_sources + news.related_sources
+                    )
+            self.ledger.record(processed)
+
+            # 기사 기록이 끝난 뒤에 ETag를 저장해야 다음 실행의 304 응답을 신뢰할 수 있음
+            for url, feed_state in self._pending_feed_states.items():
+                self.ledger.save_feed_state(url, *feed_state)
+            self._pending_feed_states = {}
+
+        except Exception as e:
+            print(f"장부 기록 중 오류 발생: {e}")
+            state.error_log.append(f"RSSCollectorAgent: {str(e)}")
+        return state
@@ -0,0 +1,55 @@
+from langchain_core.messages import AIMessage
+
+from state import NewsState
+from config import Config
+from dedup import NearDuplicateDetector, attach_duplicate
+
+class NewsDeduplicatorAgent:
+    """여러 언론사가 보도한 같은 기사를 묶어 대표 기사만 LLM 단계로 보내는 에이전트"""
+
+    def __init__(self):
+        self.name = "News Deduplicator"
+
+    @staticmethod
+    def create_detector() -> NearDuplicateDetector:
+        return NearDuplicateDetector(
+            similarity=Config.DEDUP_SIMILARITY, content_chars=Config.DEDUP_CONTENT_CHARS
+        )
+
+    @staticmethod
+    def record_metrics(state: NewsState, total: int, duplicates: int) -> None:
+        """
+        중복 제거 결과를 기록합니다.
+        실제로 아낀 LLM 호출 수는 분류 방식(일괄/통합/로컬)과 캐시 적중에 따라 달라지므로
+        요약/분류 단계에 보내지 않은 기사 수(articles_skipped)로 기록합니다.
+        """
+        state.metrics["dedup"] = {
+            "articles": total,
+            "unique": total - duplicates,
+            "duplicates": duplicates,
+            "articles_skipped": duplicates,
+        }
+        print(f"  중복 기사 {duplicates}건 묶음 -> 요약/분류 대상에서 {duplicates}건 제외")
+
+    async def deduplicate_news(self, state: NewsState) -> NewsState:
+        """유사 기사를 묶고 대표 기사만 남깁니다."""
+        print(f"\n[{self.name}] 중복 기사 탐지 시작...")
+
+        detector = self.create_detector()
+        unique_news = []
+        for news in state.articles.get(state.raw_news):
+            representative = detector.add(news)
+            if representative is None:
+                unique_news.append(news.id)
+            else:
+                attach_duplicate(representative, news)
+
+        duplicates = len(state.raw_news) - len(unique_news)
+        self.record_metrics(state, len(state.raw_news), duplicates)
+
+        state.raw_news = unique_news
+        state.messages.append(
+            AIMessage(content=f"중복 기사 {duplicates}건을 대표 기사로 묶었습니다.")
+        )
+        print(f"[{self.name}] 중복 탐지 완료")
+        return state
@@ -1,19 +1,57 @@
 import asyncio
-from typing import Dict, Any, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, Field
 
 from state import NewsState
+from articles import Article, LLM_LABEL, LOCAL_LABEL
 from config import Config
+from cache import SQLiteCache, content_key, model_name
+from llm_scheduler import LLMScheduler, estimate_tokens
+from metrics import MetricsCollector
+from local_classifier import LocalNewsClassifier, should_audit
+from ledger import NewsLedger
+from batch_api import BatchJobClient, chat_request_body, response_text, usage_metadata
+
+class CategoryAssignment(BaseModel):
+    """뉴스 한 건의 분류 결과"""
+    index: int = Field(description="뉴스 번호")
+    category: str = Field(description="카테고리")
+
+class BatchCategorization(BaseModel):
+    """여러 뉴스의 분류 결과 목록"""
+    assignments: list[CategoryAssignment] = Field(description="뉴스 번호별 카테고리")
 
 class NewsOrganizerAgent:
     """뉴스를 카테고리별로 정리하는 에이전트"""
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        scheduler: LLMScheduler = None,
+        category_cache: Optional[SQLiteCache] = None,
+        metrics: Optional[MetricsCollector] = None,
+        batch_client: Optional[BatchJobClient] = None,
+        ledger: Optional[NewsLedger] = None,
+    ):
         self.name = "News Organizer"
         self.llm = llm
+        # batch_client가 있으면 LLM 분류 요청을 기사당 한 줄씩 일괄 작업으로 제출
+        self.batch_client = batch_client
+        self.scheduler = scheduler or LLMScheduler()
+        self.metrics = metrics or MetricsCollector()
+        self.category_cache = category_cache
+        if category_cache is None and Config.LLM_CACHE_ENABLED:
+            self.category_cache = SQLiteCache(
+                Config.CACHE_DB_PATH,
+                namespace="category",
+                ttl=Config.CATEGORY_CACHE_TTL,
+                max_entries=Config.CATEGORY_CACHE_MAX_ENTRIES,
+            )
         self.categories = Config.NEWS_CATEGORIES + ["기타"]
 
         system_prompt = f"""당신은 뉴스 분류 전문가입니다.
@@ -29,60 +67,323 @@ class NewsOrganizerAgent:
         )
         self.chain = self.categorize_prompt | self.llm
 
-    async def categorize_single_news(
-            self, news_item: Dict[str, Any]
-    ) -> Tuple[str, Dict[str, Any]]:
-        """단일 뉴스의 카테고리 판단"""
-        response = await self.chain.ainvoke(
-            {
-                "title": news_item["title"],
-                "summary": news_item.get("ai_summary", news_item["content"]),
-            }
+        self.batch_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", system_prompt + """
+        여러 뉴스가 번호와 함께 주어지면 모든 뉴스에 대해 번호(index)와 카테고리를 반환하세요."""),
+                ("human", "{news_list}\n\n각 뉴스의 카테고리:"),
+            ]
         )
+        self._batch_chain = None
+        self.stats = {"requests": 0, "batch_requests": 0, "retried": 0}
 
-        category = response.content.strip()
-        return category, news_item
-    
-    async def organize_news(self, state: NewsState) -> NewsState:
-        """뉴스를 카테고리별로 정리"""
-        print(f"\n[{self.name}] 뉴스 분류 시작...")
+        # 장부에 남은 LLM 분류 결과로 실행마다 다시 학습하는 로컬 분류기
+        self.ledger = ledger
+        if ledger is None and Config.LOCAL_CLASSIFIER_ENABLED:
+            self.ledger = NewsLedger(Config.LEDGER_DB_PATH, retention=Config.LEDGER_RETENTION)
+        self.local_classifier = None
 
-        summarized_news = state.summarized_news
-        total_news = len(summarized_news)
-        batch_size = Config.BATCH_SIZE
-        categorized = defaultdict(list)
+    @property
+    def batch_chain(self):
+        """구조화된 출력을 사용하는 일괄 분류 체인 (처음 사용할 때 생성)"""
+        if self._batch_chain is None:
+            self._batch_chain = self.batch_prompt | self.llm.with_structured_output(
+                BatchCategorization
+            )
+        return self._batch_chain
+
+    def cache_key(self, news_item: Article) -> str:
+        """제목/요약/분류 프롬프트/모델이 모두 같을 때만 같은 키"""
+        return content_key(
+            news_item.title,
+            news_item.summary,
+            self.categorize_prompt.pretty_repr(),
+            model_name(self.llm),
+        )
+
+    def lookup_category(self, news_item: Article) -> Optional[str]:
+        """이전에 LLM이 분류한 같은 뉴스의 카테고리 (없으면 None)"""
+        if not self.category_cache:
+            return None
+        return self.category_cache.get(self.cache_key(news_item))
 
-        for i in range(0, total_news, batch_size):
-            batch = summarized_news[i : i + batch_size]
-            batch_num = i
-            total_batches = (total_news + batch_size - 1)
+    def store_category(self, news_item: Article, category: str) -> None:
+        """유효한 카테고리만 캐시에 저장"""
+        if self.category_cache and category in Config.NEWS_CATEGORIES:
+            self.category_cache.set(self.cache_key(news_item), category)
 
-            print(f" 배치 {batch_num}/{total_batches} 분류 중...")
+    async def categorize_single_news(
+            self, news_item: Article
+    ) -> Tuple[str, Article]:
+        """단일 뉴스의 카테고리 판단"""
+        self.stats["requests"] += 1
+        inputs = {"title": news_item.title, "summary": news_item.summary}
+        with self.metrics.timer("classify"):
+            response = await self.scheduler.submit(
+                lambda: self.chain.ainvoke(inputs, {"callbacks": self.metrics.callbacks}),
+                estimate_tokens(inputs["title"], inputs["summary"]),
+            )
 
-            tasks = [self.categorize_single_news(news) for news in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        category = response.content.strip()
+        self.store_category(news_item, category)
+        return category, news_item
+    
+    async def categorize_batch(
+            self, news_items: List[Article]
+    ) -> List[Tuple[str, Article] | Exception]:
+        """
+        여러 뉴스를 한 번의 LLM 호출로 분류합니다.
+        결과는 항목별로 검증하며, 누락되거나 카테고리가 잘못된 항목만 개별 분류로 다시 시도합니다.
+        """
+        news_list = "\n\n".join(
+            f"[{i}] 제목: {news.title}\n요약: {news.summary}"
+            for i, news in enumerate(news_items)
+        )
+        categories: Dict[int, str] = {}
+        try:
+            self.stats["requests"] += 1
+            self.stats["batch_requests"] += 1
+            start = time.perf_counter()
+            response = await self.scheduler.submit(
+                lambda: self.batch_chain.ainvoke(
+                    {"news_list": news_list}, {"callbacks": self.metrics.callbacks}
+                ),
+                estimate_tokens(news_list),
+            )
+            # 일괄 호출의 지연 시간은 묶인 기사 모두가 겪으므로 기사마다 기록
+            for _ in news_items:
+                self.metrics.observe("classify", time.perf_counter() - start)
+            for assignment in response.assignments:
+                category = assignment.category.strip()
+                if 0 <= assignment.index < len(news_items) and category in Config.NEWS_CATEGORIES:
+                    categories.setdefault(assignment.index, category)
+        except Exception as e:
+            self.metrics.count_error("classify")
+            print(f"  일괄 분류 실패, 개별 분류로 전환: {str(e)[:50]}")
 
-            for result in results:
-                if isinstance(result, Exception):
-                    print(f"  분류 작업 실패: {result}")
-                    continue
-                category, news_item = result
+        failed = [i for i in range(len(news_items)) if i not in categories]
+        self.stats["retried"] += len(failed)
+        retried = await asyncio.gather(
+            *(self.categorize_single_news(news_items[i]) for i in failed),
+            return_exceptions=True,
+        )
+        results: Dict[int, Tuple[str, Article] | Exception] = dict(zip(failed, retried))
+        for i, category in categories.items():
+            self.store_category(news_items[i], category)
+            results[i] = (category, news_items[i])
+        return [results[i] for i in range(len(news_items))]
 
-                if category in Config.NEWS_CATEGORIES:
-                    categorized[category].append(news_item)
-                else:
-                    categorized["기타"].append(news_item)
+    @staticmethod
+    def normalize_category(category: str) -> str:
+        """정의되지 않은 카테고리는 '기타'로 처리"""
+        return category if category in Config.NEWS_CATEGORIES else "기타"
 
+    def print_distribution(self, categorized: Dict[str, list]) -> None:
+        """카테고리별 분포 출력"""
         print("\n 카테고리별 분포:")
         for category in self.categories:
             count = len(categorized.get(category, []))
             if count > 0:
                 print(f"   {category}: {count}건")
+
+    def add_results(
+            self,
+            categorized: Dict[str, list],
+            results: List[Tuple[str, Article] | Exception],
+            source: str = LLM_LABEL,
+    ) -> None:
+        """분류 결과와 분류한 주체(source)를 기사에 기록하고 카테고리별로 모읍니다."""
+        for result in results:
+            if isinstance(result, Exception):
+                self.metrics.count_error("classify")
+                print(f"  분류 작업 실패: {result}")
+                continue
+            category, news_item = result
+            news_item.category = self.normalize_category(category)
+            news_item.category_source = source
+            categorized[news_item.category].append(news_item)
+
+    def refresh_local_classifier(self) -> None:
+        """
+        LLM이 분류한 기사만으로 로컬 분류기를 다시 학습합니다. (학습 예제가 부족하면 사용하지 않음)
+        로컬 분류기 자신의 결과로 학습하면 오분류가 굳어지므로 local 기록은 쓰지 않습니다.
+        """
+        self.local_classifier = None
+        if not Config.LOCAL_CLASSIFIER_ENABLED:
+            return
+        examples = [
+            (title, category)
+            for title, category in self.ledger.category_labels(LLM_LABEL)
+            if category in Config.NEWS_CATEGORIES
+        ]
+        if len(examples) >= Config.LOCAL_CLASSIFIER_MIN_EXAMPLES:
+            self.local_classifier = LocalNewsClassifier().fit(examples)
+        status = "" if self.local_classifier else " (부족해 사용 안 함)"
+        print(f"  로컬 분류기 학습 예제 {len(examples)}건{status}")
+
+    def classify_locally(self, news_item: Article) -> Optional[str]:
+        """로컬 분류기의 신뢰도가 임계값 이상이면 해당 카테고리를 반환합니다."""
+        if not self.local_classifier:
+            return None
+        prediction = self.local_classifier.predict(news_item.title)
+        if prediction and prediction[1] >= Config.LOCAL_CLASSIFIER_THRESHOLD:
+            return prediction[0]
+        return None
+
+    async def categorize_with_llm(
+            self, news_list: List[Article]
+    ) -> List[Tuple[str, Article] | Exception]:
+        """
+        LLM으로 분류합니다. 입력 순서대로 결과(또는 예외)를 반환합니다.
+        캐시에 있는 뉴스는 LLM에 보내지 않습니다.
+        """
+        results: Dict[int, Tuple[str, Article] | Exception] = {}
+        for i, news in enumerate(news_list):
+            if (category := self.lookup_category(news)) is not None:
+                results[i] = (category, news)
+        misses = [i for i in range(len(news_list)) if i not in results]
+        if misses:
+            llm_results = await self.request_categories([news_list[i] for i in misses])
+            results.update(zip(misses, llm_results))
+        return [results[i] for i in range(len(news_list))]
+
+    async def request_categories_in_batch(
+            self, news_list: List[Article]
+    ) -> List[Tuple[str, Article] | Exception]:
+        """
+        기사마다 개별 분류 요청 한 줄씩 일괄 작업으로 제출합니다.
+        한 줄이 실패해도 그 기사만 다시 제출되도록 여러 기사를 한 요청에 묶지 않습니다.
+        """
+        requests = {
+            f"category-{news.id}": chat_request_body(
+                self.llm,
+                self.categorize_prompt.format_messages(title=news.title, summary=news.summary),
+            )
+            for news in news_list
+        }
+        print(f" {len(news_list)}건 분류 요청을 일괄 작업으로 제출...")
+        self.stats["requests"] += len(requests)
+        completed = await self.batch_client.run(f"category_{model_name(self.llm)}", requests)
+
+        results = []
+        for news in news_list:
+            body = completed.get(f"category-{news.id}")
+            if body is None:
+                results.append(RuntimeError(f"일괄 분류 실패 (Title: {news.title})"))
+                continue
+            self.metrics.add_tokens(usage_metadata(body))
+            category = response_text(body)
+            self.store_category(news, category)
+            results.append((category, news))
+        return results
+
+    async def request_categories(
+            self, news_list: List[Article]
+    ) -> List[Tuple[str, Article] | Exception]:
+        """일괄 또는 개별 요청으로 LLM 분류 결과를 받습니다."""
+        total_news = len(news_list)
+        results = []
+
+        if self.batch_client:
+            return await self.request_categories_in_batch(news_list)
+        if Config.BATCHED_CLASSIFICATION:
+            chunk_size = Config.CLASSIFY_BATCH_SIZE
+            print(f" {total_news}건을 {chunk_size}건씩 묶어 일괄 분류 중...")
+
+            chunks = await asyncio.gather(
+                *(
+                    self.categorize_batch(news_list[i : i + chunk_size])
+                    for i in range(0, total_news, chunk_size)
+                )
+            )
+            for chunk in chunks:
+                results.extend(chunk)
+        else:
+            print(f" {total_news}건 개별 분류 중...")
+            results = await asyncio.gather(
+                *(self.categorize_single_news(news) for news in news_list),
+                return_exceptions=True,
+            )
+        return list(results)
+
+    async def organize_news(self, state: NewsState) -> NewsState:
+        """뉴스를 카테고리별로 정리 (확실한 기사는 로컬 분류, 나머지만 LLM 분류)"""
+        print(f"\n[{self.name}] 뉴스 분류 시작...")
+        self.stats = {"requests": 0, "batch_requests": 0, "retried": 0}
+        if self.category_cache:
+            self.category_cache.reset_stats()
+        self.refresh_local_classifier()
+
+        summarized_news = state.articles.get(state.summarized_news)
+        categorized = defaultdict(list)
+
+        local_results, llm_news, audit_news = [], [], []
+        for news in summarized_news:
+            category = self.classify_locally(news)
+            if category is None:
+                llm_news.append(news)
+                continue
+            local_results.append((category, news))
+            if should_audit(news.title, Config.LOCAL_CLASSIFIER_AUDIT_RATE):
+                audit_news.append((category, news))
+
+        results = await self.categorize_with_llm(llm_news + [news for _, news in audit_news])
+        # 로컬 분류 표본을 LLM 결과와 비교해 일치율을 측정하고, 표본은 LLM 결과를 따름
+        audited = [
+            (local_category, result)
+            for (local_category, _), result in zip(audit_news, results[len(llm_news) :])
+            if not isinstance(result, Exception)
+        ]
+        agreed = sum(
+            self.normalize_category(result[0]) == local_category
+            for local_category, result in audited
+        )
+        audited_ids = {news.id for _, (_, news) in audited}
+        self.add_results(categorized, results[: len(llm_news)] + [result for _, result in audited])
+        self.add_results(
+            categorized,
+            [(category, news) for category, news in local_results if news.id not in audited_ids],
+            source=LOCAL_LABEL,
+        )
+        for news_list in categorized.values():
+            news_list.sort(key=lambda news: news.id)
+
+        self.stats.update(
+            {
+                "local": len(local_results),
+                "escalated": len(llm_news),
+                "audited": len(audited),
+                "agreement_rate": agreed / len(audited) if audited else None,
+            }
+        )
+        print(
+            f"  로컬 분류 {len(local_results)}건, LLM 분류 {len(llm_news)}건, "
+            f"LLM 요청 {self.stats['requests']}회 "
+            f"(일괄 {self.stats['batch_requests']}회, 개별 재시도 {self.stats['retried']}건)"
+        )
+        if audited:
+            print(f"  로컬/LLM 일치율: {agreed}/{len(audited)} ({agreed / len(audited):.0%})")
+        state.metrics["classification"] = dict(self.stats)
+        if self.batch_client:
+            state.metrics["batch"] = dict(self.batch_client.stats)
+        state.metrics["llm_scheduler"] = self.scheduler.metrics()
+        if self.category_cache:
+            cache_stats = self.category_cache.stats()
+            print(
+                f"  분류 캐시: 적중 {cache_stats['hits']}건, "
+                f"미스 {cache_stats['misses']}건 ({cache_stats['hit_rate']:.0%})"
+            )
+            state.metrics["category_cache"] = cache_stats
+
+        self.print_distribution(categorized)
         
-        state.categorized_news = dict(categorized)
+        state.categorized_news = {
+            category: [news.id for news in news_list]
+            for category, news_list in categorized.items()
+        }
         state.messages.append(
             AIMessage(content=f"뉴스를 {len(categorized)}개 카테고리로 분류했습니다.")
         )
 
         print(f"[{self.name}] 분류 완료 \n")
-        return state
\ No newline at end of file
+        return state
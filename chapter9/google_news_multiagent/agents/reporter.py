@@ -2,6 +2,8 @@ from datetime import datetime
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 from state import NewsState
+from articles import Article
+from dedup import normalize_title
 from config import Config
 
 class ReportGeneratorAgent:
@@ -11,25 +13,79 @@ class ReportGeneratorAgent:
         self.name = "Report Generator"
         self.llm = llm
     
+    @staticmethod
+    def format_alternates(news: Article) -> str:
+        """같은 기사를 보도한 다른 언론사 링크"""
+        alternates = news.alternate_sources
+        if not alternates:
+            return ""
+        links = ", ".join(
+            f"[{alternate['source']}]({alternate['original_url']})"
+            for alternate in alternates
+        )
+        return f"\n- **다른 출처**: {links}"
+
+    @staticmethod
+    def format_related(news: Article) -> str:
+        """같은 사건을 다룬 다른 언론사 기사 (사건 하나를 한 항목으로 표시)"""
+        related = news.related_sources
+        if not related:
+            return ""
+        links = "\n".join(
+            f"  - {item['source']}: [{normalize_title(item['title'], item['source'])}]"
+            f"({item['original_url']})"
+            for item in related
+        )
+        return f"\n- **관련 보도 {len(related)}건**:\n{links}"
+
+    @staticmethod
+    def format_source(news: Article) -> str:
+        if news.related_sources:
+            return f"{news.source} 외 {len(news.related_sources)}곳"
+        return news.source
+
     async def generate_report(self, state: NewsState) -> NewsState:
         """최종 보고서 생성"""
         print(f"\n[{self.name}] 보고서 생성 시작...")
         report_parts = []
 
+        # 증분 수집 시 이전 실행에서 요약/분류된 기사를 함께 보고서에 포함
+        categorized_news = {
+            cat: state.articles.get(news_ids) for cat, news_ids in state.categorized_news.items()
+        }
+        for news in state.articles.get(state.reused_news):
+            categorized_news.setdefault(news.category or "기타", []).append(news)
+
         current_time = datetime.now().strftime("%Y년 %m월 %d일 %H:%M:%S")
-        total_processed = sum(len(v) for v in state.categorized_news.values())
+        total_processed = sum(len(v) for v in categorized_news.values())
+        dedup = state.metrics.get("dedup")
+        clustering = state.metrics.get("clustering")
+        collected = (dedup or clustering or {}).get("articles", len(state.raw_news))
         header = f"""# Google News 한국 뉴스 AI 요약 리포트
         
         ## 기본 정보
         - **수집 시간**: {current_time}
         - **RSS 소스**: Google News Korea
-        - **수집 뉴스**: {len(state.raw_news)}건
+        - **수집 뉴스**: {collected + len(state.reused_news)}건
         - **처리 완료**: {total_processed}건"""
+        if state.reused_news:
+            header += f"\n        - **이전 요약 재사용**: {len(state.reused_news)}건"
+        if dedup:
+            header += (
+                f"\n        - **중복 기사 묶음**: {dedup['duplicates']}건 "
+                f"(요약/분류 {dedup['articles_skipped']}건 생략)"
+            )
+        if clustering and clustering["clustered"]:
+            header += (
+                f"\n        - **사건 묶음**: {clustering['clustered']}건을 "
+                f"{clustering['multi_source_clusters']}개 사건에 통합 "
+                f"(개별 요약/분류 {clustering['articles_skipped']}건 생략)"
+            )
 
         report_parts.append(header)
 
         category_stats = {
-            cat: len(news) for cat, news in state.categorized_news.items()
+            cat: len(news) for cat, news in categorized_news.items()
         }
         total_news = sum(category_stats.values())
 
@@ -48,42 +104,42 @@ class ReportGeneratorAgent:
         
         news_sections = []
         for category in Config.NEWS_CATEGORIES:
-            if news_list := state.categorized_news.get(category):
+            if news_list := categorized_news.get(category):
                 section_header = f"### {category} ({len(news_list)}건)\n"
                 display_count = min(len(news_list), Config.NEWS_PER_CATEGORY)
 
                 news_items_str = "\n".join(
-                    f"""#### {i}. {news["title"]}
-- **출처**: {news["source"]}
-- **발행**: {news.get("published_kst", "")}
-- **요약**: {news.get("ai_summary", news["content"])}
-- **링크**: [기사 보기]({news["original_url"]})"""
+                    f"""#### {i}. {news.title}
+- **출처**: {self.format_source(news)}
+- **발행**: {news.published_kst}
+- **요약**: {news.summary}
+- **링크**: [기사 보기]({news.original_url}){self.format_alternates(news)}{self.format_related(news)}"""
                     for i, news in enumerate(news_list[:display_count], 1)
                 )
                 remaining = len(news_list) - display_count
                 footer = f"\n*... 외 {remaining}건의 뉴스 *\n" if remaining > 0 else ""
                 news_sections.append(f"{section_header}\n{news_items_str}{footer}")
 
-            if news_sections:
-                report_parts.append(
-                    "## 카테고리별 주요 뉴스 \n\n" + "\n\n---\n\n".join(news_sections)
-                )
-            if state.error_log:
-                errors = "\n".join([f"- {error}" for error in state.error_log])
-                report_parts.append(f"## 처리 중 발생한 오류 \n\n{errors}")
+        if news_sections:
+            report_parts.append(
+                "## 카테고리별 주요 뉴스 \n\n" + "\n\n---\n\n".join(news_sections)
+            )
+        if state.error_log:
+            errors = "\n".join([f"- {error}" for error in state.error_log])
+            report_parts.append(f"## 처리 중 발생한 오류 \n\n{errors}")
 
-            footer = """## 참고사항
+        footer = """## 참고사항
 - 이 보고서는 AI(LangGraph + Langchain)를 활용하여 자동으로 생성되었습니다.
 - 뉴스 요약은 OpenAI GPT 모델을 사용하여 작성되었습니다.
 - 카테고리 분류는 AI가 제목과 내용을 분석하여 자동으로 수행했습니다.
 - 상세한 내용은 각 뉴스의 원문 링크를 참조하시기 바랍니다."""
-            report_parts.append(footer)
+        report_parts.append(footer)
 
-            final_report = "\n\n---\n\n".join(filter(None, report_parts))
+        final_report = "\n\n---\n\n".join(filter(None, report_parts))
 
-            state.final_report = final_report
-            state.messages.append(AIMessage(content="최종 보고서가 생성되었습니다."))
+        state.final_report = final_report
+        state.messages.append(AIMessage(content="최종 보고서가 생성되었습니다."))
 
-            print(f"[{self.name}] 보고서 생성 완료")
-            return state
-            
\ No newline at end of file
+        print(f"[{self.name}] 보고서 생성 완료")
+        return state
+        
\ No newline at end of file
@@ -1,18 +1,48 @@
 import asyncio
-from typing import Dict, Any
+from typing import Dict, List, Optional, Tuple
+from langchain_core.language_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 from state import NewsState
+from articles import Article
 from config import Config
+from cache import SQLiteCache, content_key, model_name
+from llm_scheduler import LLMScheduler, estimate_tokens
+from compression import prepare_content, prepare_sources
+from metrics import MetricsCollector
+from model_router import ModelRouter
+from batch_api import BatchJobClient, chat_request_body, response_text, usage_metadata
 
 class NewsSummarizerAgent:
     """뉴스를 요약하는 에이전트"""
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        scheduler: LLMScheduler = None,
+        summary_cache: Optional[SQLiteCache] = None,
+        metrics: Optional[MetricsCollector] = None,
+        router: Optional[ModelRouter] = None,
+        batch_client: Optional[BatchJobClient] = None,
+    ):
         self.name = "News Summarizer"
         self.llm = llm
+        # router가 있으면 기사마다 fast/strong 단계 모델 중 하나로 요약
+        self.router = router
+        # batch_client가 있으면 모든 요약 요청을 일괄 작업으로 제출
+        self.batch_client = batch_client
+        self.scheduler = scheduler or LLMScheduler()
+        self.metrics = metrics or MetricsCollector()
+        self.summary_cache = summary_cache
+        if summary_cache is None and Config.LLM_CACHE_ENABLED:
+            self.summary_cache = SQLiteCache(
+                Config.CACHE_DB_PATH,
+                namespace="summary",
+                ttl=Config.SUMMARY_CACHE_TTL,
+                max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES,
+            )
 
         self.prompt = ChatPromptTemplate.from_messages(
             [
@@ -31,49 +61,179 @@ class NewsSummarizerAgent:
             ]
         )
 
-    async def summarize_single_news(self, news_item: Dict[str, Any]) -> Dict[str, Any]:
-        """단일 뉴스 요약 (오류 발생 시 원본 내용 반환)"""
-        content = news_item.get("content", "")
+        # 같은 사건을 다룬 여러 기사를 한 번에 요약하는 프롬프트
+        self.cluster_prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    """당신은 전문 뉴스 요약 전문가입니다.
+                    같은 사건을 다룬 여러 언론사의 기사를 종합해 두세 문장으로 요약해주세요.
+                    - 여러 기사에 공통된 사실을 중심으로 전달하고 추측은 피하세요
+                    - 중요한 숫자나 날짜는 포함하세요
+                    - 언론사마다 수치나 주장이 다르면 그 차이를 짧게 밝혀주세요""",
+                ),
+                (
+                    "human",
+                    "제목: {title}\n기사:\n{content}\n\n위 기사들을 두세 문장으로 종합 요약해주세요:",
+                ),
+            ]
+        )
+
+    def cache_key(
+        self,
+        inputs: Dict[str, str],
+        prompt: ChatPromptTemplate = None,
+        llm: BaseChatModel = None,
+    ) -> str:
+        """제목/본문/프롬프트/모델이 모두 같을 때만 같은 키"""
+        prompt = prompt or self.prompt
+        return content_key(
+            inputs["title"], inputs["content"], prompt.pretty_repr(), model_name(llm or self.llm)
+        )
+
+    def select_model(self, news_item: Article, sources: List[Article]) -> BaseChatModel:
+        """라우터가 있으면 원문 길이와 출처 수로 고른 단계의 모델, 없으면 기본 모델"""
+        if not self.router:
+            return self.llm
+        return self.router.route_summary(news_item.title, [news.content for news in sources])
+
+    def build_request(
+        self, news_item: Article, related: Optional[List[Article]] = None
+    ) -> Optional[Tuple[ChatPromptTemplate, BaseChatModel, Dict[str, str]]]:
+        """
+        요약 요청의 프롬프트, 모델, 입력 (요약할 본문이 50자 미만이면 None)
+        related(같은 사건의 다른 기사)가 있으면 모든 기사를 종합하는 프롬프트를 씁니다.
+        """
+        sources = [news for news in [news_item, *(related or [])] if news.content]
+        if sum(len(news.content) for news in sources) < 50:
+            return None
+        if len(sources) > 1:
+            prompt = self.cluster_prompt
+            content = prepare_sources([(news.source, news.title, news.content) for news in sources])
+        else:
+            prompt = self.prompt
+            content = prepare_content(news_item.title, sources[0].content)
+        llm = self.select_model(news_item, sources)
+        return prompt, llm, {"title": news_item.title, "content": content}
+
+    def lookup_summary(self, key: str) -> Optional[str]:
+        return self.summary_cache.get(key) if self.summary_cache else None
+
+    def store_summary(self, news_item: Article, key: str, summary: str) -> None:
+        """비어 있지 않은 요약만 기사에 기록하고 캐시에 저장"""
+        if not summary:
+            return
+        news_item.ai_summary = summary
+        if self.summary_cache:
+            self.summary_cache.set(key, summary)
+
+    async def summarize_single_news(
+        self, news_item: Article, related: Optional[List[Article]] = None
+    ) -> Article:
+        """
+        단일 뉴스 요약을 기사 레코드에 기록 (오류 발생 시 요약 없이 원본 내용 사용)
+        related(같은 사건의 다른 기사)가 있으면 모든 기사를 종합한 요약 한 건을 만듭니다.
+        """
         try:
-            if not content or len(content) < 50:
-                return {**news_item, "ai_summary": content}
-            chain = self.prompt | self.llm
-            summary_response = await chain.ainvoke(
-                {
-                    "title": news_item["title"],
-                    "content": content[:500],
-                }
-            )
-            summary = summary_response.content.strip()
-            return {**news_item, "ai_summary": summary or content}
+            request = self.build_request(news_item, related)
+            if request is None:
+                return news_item
+            prompt, llm, inputs = request
+            chain = prompt | llm
+            key = self.cache_key(inputs, prompt, llm)
+            if summary := self.lookup_summary(key):
+                news_item.ai_summary = summary
+                return news_item
+
+            with self.metrics.timer("summarize"):
+                summary_response = await self.scheduler.submit(
+                    lambda: chain.ainvoke(inputs, {"callbacks": self.metrics.callbacks}),
+                    estimate_tokens(inputs["title"], inputs["content"]),
+                )
+            self.store_summary(news_item, key, summary_response.content.strip())
+            return news_item
         
         except Exception as e:
-            print(f" [{self.name}] 요약 오류 (Title: {news_item['title']}): {str(e)[:50]}...")
-            return {**news_item, "ai_summary": content}
+            self.metrics.count_error("summarize")
+            print(f" [{self.name}] 요약 오류 (Title: {news_item.title}): {str(e)[:50]}...")
+            return news_item
         
+    async def summarize_in_batch(self, state: NewsState, news_list: List[Article]) -> None:
+        """
+        캐시에 없는 요약 요청을 모델별 일괄 작업 하나씩으로 제출하고 결과를 기사 레코드에 기록합니다.
+        끝내 실패한 기사는 요약 없이 원본 내용을 사용합니다.
+        """
+        jobs: Dict[str, Dict[str, dict]] = {}
+        pending: Dict[str, Tuple[Article, str]] = {}
+        for news in news_list:
+            request = self.build_request(news, state.articles.get(news.related))
+            if request is None:
+                continue
+            prompt, llm, inputs = request
+            key = self.cache_key(inputs, prompt, llm)
+            if summary := self.lookup_summary(key):
+                news.ai_summary = summary
+                continue
+            custom_id = f"summary-{news.id}"
+            body = chat_request_body(llm, prompt.format_messages(**inputs))
+            jobs.setdefault(model_name(llm), {})[custom_id] = body
+            pending[custom_id] = (news, key)
+
+        print(f"  요약 요청 {len(pending)}건을 일괄 작업 {len(jobs)}개로 제출...")
+        results = await asyncio.gather(
+            *(self.batch_client.run(f"summary_{model}", requests) for model, requests in jobs.items())
+        )
+        completed = {custom_id: body for result in results for custom_id, body in result.items()}
+        for custom_id, (news, key) in pending.items():
+            if body := completed.get(custom_id):
+                self.metrics.add_tokens(usage_metadata(body))
+                self.store_summary(news, key, response_text(body))
+        if failed := len(pending) - len(completed):
+            self.metrics.count_error("summarize", failed)
+            print(f"  일괄 요약 실패 {failed}건은 원본 내용을 사용합니다.")
+        state.metrics["batch"] = dict(self.batch_client.stats)
+
     async def summarize_news(self, state: NewsState) -> NewsState:
         """모든 뉴스를 비동기로 요약"""
         print(f"\n[{self.name}] 뉴스 요약 시작...")
 
-        batch_size = Config.BATCH_SIZE
-        summarized_news = []
-        raw_news = state.raw_news
-        total_news = len(raw_news)
-
-        for i in range(0, total_news, batch_size):
-            batch = raw_news[i : i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total_news + batch_size - 1) // batch_size
-
-            print(f"  배치 {batch_num}/{total_batches} 처리 중...")
-
-            tasks = [self.summarize_single_news(news) for news in batch]
-            batch_results = await asyncio.gather(*tasks)
-            summarized_news.extend(batch_results)
+        # 호출 수 제한은 공유 스케줄러가 맡으므로 배치로 나누지 않고 한 번에 제출
+        raw_news = state.articles.get(state.raw_news)
+        # 요약은 첫 LLM 단계이므로 분류와 공유하는 스케줄러의 통계도 여기서 초기화
+        self.scheduler.reset_stats()
+        if self.summary_cache:
+            self.summary_cache.reset_stats()
+        if self.router:
+            self.router.reset()
+        if self.batch_client:
+            self.batch_client.reset()
+            try:
+                await self.summarize_in_batch(state, raw_news)
+            except Exception as e:
+                self.metrics.count_error("summarize")
+                print(f"일괄 요약 작업 중 오류 발생: {e}")
+                state.error_log.append(f"NewsSummarizerAgent: {str(e)}")
+        else:
+            print(f"  {len(raw_news)}건 요약 중 (동시 호출 최대 {self.scheduler.max_concurrency}건)...")
+            await asyncio.gather(
+                *(
+                    self.summarize_single_news(news, state.articles.get(news.related))
+                    for news in raw_news
+                )
+            )
 
-        state.summarized_news = summarized_news
+        state.summarized_news = [news.id for news in raw_news]
+        if self.summary_cache:
+            cache_stats = self.summary_cache.stats()
+            print(
+                f"  요약 캐시: 적중 {cache_stats['hits']}건, "
+                f"미스 {cache_stats['misses']}건 ({cache_stats['hit_rate']:.0%})"
+            )
+            state.metrics["summary_cache"] = cache_stats
+        if self.router:
+            state.metrics["routing"] = self.router.print_stats(self.metrics)
         state.messages.append(
-            AIMessage(content=f"{len(summarized_news)}개의 뉴스 요약을 완료했습니다.")
+            AIMessage(content=f"{len(raw_news)}개의 뉴스 요약을 완료했습니다.")
         )
         print(f"[{self.name}] 요약 완료")
         return state
\ No newline at end of file
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterable, Optional
+
+# 장부(NewsLedger)에 기록하지 않는 필드 - 본문은 크고, ID는 실행마다 다름
+UNRECORDED_FIELDS = ("id", "content", "related")
+# category_source 값
+LLM_LABEL, LOCAL_LABEL = "llm", "local"
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    기사 한 건의 레코드
+    단계마다 복사하지 않고 같은 레코드에 요약/분류 결과를 기록하며, 상태에는 ID만 전달합니다.
+    """
+
+    title: str
+    source: str = "Unknown"
+    published_kst: str = ""
+    published_ts: float = 0.0
+    google_news_url: str = ""
+    original_url: Optional[str] = None
+    content: str = ""
+    entry_id: str = ""
+    fingerprint: str = ""
+    ai_summary: Optional[str] = None
+    category: Optional[str] = None
+    # 카테고리를 정한 주체 (llm: LLM 호출 또는 LLM 결과 캐시, local: 로컬 분류기)
+    category_source: Optional[str] = None
+    alternate_sources: list[dict[str, Any]] = field(default_factory=list)
+    # 같은 사건을 다룬 다른 기사 (related는 이번 실행의 기사 ID, related_sources는 출처 정보)
+    related: list[int] = field(default_factory=list)
+    related_sources: list[dict[str, Any]] = field(default_factory=list)
+    id: int = -1
+
+    @property
+    def summary(self) -> str:
+        """요약이 없으면 본문"""
+        return self.content if self.ai_summary is None else self.ai_summary
+
+    def to_record(self) -> dict[str, Any]:
+        """장부에 기록할 필드 (본문 없이도 보고서에 쓸 수 있도록 요약은 항상 채움)"""
+        record = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in UNRECORDED_FIELDS
+        }
+        record["ai_summary"] = self.summary
+        return record
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "Article":
+        """장부 기록에서 복원합니다. 알 수 없는 키(duplicate_of 등)는 무시합니다."""
+        names = {f.name for f in fields(cls)} - set(UNRECORDED_FIELDS)
+        return cls(**{key: value for key, value in record.items() if key in names})
+
+
+@dataclass(slots=True)
+class ArticleStore:
+    """실행 하나의 기사 저장소 - 기사 ID는 저장 순서(목록 위치)입니다."""
+
+    articles: list[Article] = field(default_factory=list)
+
+    def add(self, article: Article) -> int:
+        """기사를 저장하고 새 ID를 반환합니다."""
+        article.id = len(self.articles)
+        self.articles.append(article)
+        return article.id
+
+    def get(self, ids: Iterable[int]) -> list[Article]:
+        return [self.articles[i] for i in ids]
+
+    def __getitem__(self, article_id: int) -> Article:
+        return self.articles[article_id]
+
+    def __len__(self) -> int:
+        return len(self.articles)
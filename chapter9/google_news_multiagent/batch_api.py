@@ -0,0 +1,186 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, convert_to_openai_messages
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from config import Config
+from cache import model_name
+
+CHAT_ENDPOINT = "/v1/chat/completions"
+# 더 기다려도 상태가 바뀌지 않는 일괄 작업 상태
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def response_format(schema: Any) -> dict[str, Any]:
+    """bind(response_format=...)로 묶인 pydantic 모델/JSON 스키마를 chat.completions 형식으로 변환"""
+    if isinstance(schema, dict) and "type" in schema:
+        return schema
+    function = convert_to_openai_tool(schema)["function"]
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": function["name"], "schema": function["parameters"]},
+    }
+
+
+def chat_request_body(llm: BaseChatModel, messages: list[BaseMessage]) -> dict[str, Any]:
+    """
+    대화형 호출에서 모델이 보낼 것과 같은 chat.completions 요청 본문
+    ChatOpenAI 내부 메서드에 기대지 않고 공개 필드(model_name, max_tokens, reasoning_effort,
+    temperature)와 bind()로 묶인 response_format으로 만듭니다.
+    """
+    bound_kwargs = getattr(llm, "kwargs", {})  # RunnableBinding이면 bind()로 묶인 호출 인자
+    llm = getattr(llm, "bound", llm)
+    body = {
+        "model": model_name(llm),
+        "messages": convert_to_openai_messages(messages),
+        "max_completion_tokens": getattr(llm, "max_tokens", None) or Config.MAX_TOKENS,
+    }
+    for field in ("reasoning_effort", "temperature"):
+        if (value := getattr(llm, field, None)) is not None:
+            body[field] = value
+    if (schema := bound_kwargs.get("response_format")) is not None:
+        body["response_format"] = response_format(schema)
+    return body
+
+
+def response_text(body: dict[str, Any]) -> str:
+    """chat.completions 응답 본문의 첫 번째 답변"""
+    return (body["choices"][0]["message"].get("content") or "").strip()
+
+
+def usage_metadata(body: dict[str, Any]) -> dict[str, int]:
+    """chat.completions 응답의 usage를 MetricsCollector.add_tokens 형식으로 변환"""
+    usage = body.get("usage") or {}
+    return {
+        "input_tokens": usage.get("prompt_tokens", 0),
+        "output_tokens": usage.get("completion_tokens", 0),
+        "total_tokens": usage.get("total_tokens", 0),
+    }
+
+
+class BatchJobClient:
+    """
+    OpenAI Batch API 클라이언트
+    요청을 JSONL 작업 파일로 써서 올리고, 일괄 작업이 끝날 때까지 상태를 조회한 뒤 결과 파일을 읽습니다.
+    실패하거나 결과가 없는 줄만 모아 BATCH_MAX_ATTEMPTS회까지 다시 제출합니다.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        poll_interval: float = None,
+        max_attempts: int = None,
+    ):
+        self.client = httpx.AsyncClient(
+            base_url=Config.BATCH_API_BASE,
+            headers={"authorization": f"Bearer {Config.OPENAI_API_KEY}"},
+            timeout=Config.HTTP_TIMEOUT,
+            transport=transport,
+        )
+        self.poll_interval = Config.BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.max_attempts = max_attempts or Config.BATCH_MAX_ATTEMPTS
+        self.reset()
+
+    def reset(self) -> None:
+        """새 실행을 시작할 때 통계를 초기화합니다."""
+        self.stats = {"jobs": 0, "lines": 0, "succeeded": 0, "requeued": 0, "failed": 0}
+
+    def write_job(self, name: str, requests: dict[str, dict[str, Any]]) -> str:
+        """custom_id -> 요청 본문을 Batch API 입력 형식의 JSONL 파일로 저장합니다."""
+        os.makedirs(Config.BATCH_JOB_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = os.path.join(Config.BATCH_JOB_DIR, f"{name}_{timestamp}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for custom_id, body in requests.items():
+                line = {"custom_id": custom_id, "method": "POST", "url": CHAT_ENDPOINT, "body": body}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        return path
+
+    async def submit(self, name: str, path: str) -> dict[str, Any]:
+        """작업 파일을 올리고 일괄 작업을 만듭니다."""
+        with open(path, "rb") as f:
+            response = await self.client.post(
+                "files",
+                data={"purpose": "batch"},
+                files={"file": (os.path.basename(path), f.read(), "application/jsonl")},
+            )
+        response.raise_for_status()
+        response = await self.client.post(
+            "batches",
+            json={
+                "input_file_id": response.json()["id"],
+                "endpoint": CHAT_ENDPOINT,
+                "completion_window": Config.BATCH_COMPLETION_WINDOW,
+                "metadata": {"job": name},
+            },
+        )
+        response.raise_for_status()
+        self.stats["jobs"] += 1
+        return response.json()
+
+    async def wait(self, batch: dict[str, Any]) -> dict[str, Any]:
+        """일괄 작업이 끝날(완료/실패/만료/취소) 때까지 주기적으로 상태를 조회합니다."""
+        while batch["status"] not in TERMINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval)
+            response = await self.client.get(f"batches/{batch['id']}")
+            response.raise_for_status()
+            batch = response.json()
+        return batch
+
+    async def read_lines(self, file_id: Optional[str]) -> list[dict[str, Any]]:
+        if not file_id:
+            return []
+        response = await self.client.get(f"files/{file_id}/content")
+        response.raise_for_status()
+        return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+    async def collect(self, batch: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """결과 파일에서 성공한 줄의 응답 본문만 모읍니다. (오류 파일의 줄과 결과가 없는 줄은 실패)"""
+        results = {}
+        for line in await self.read_lines(batch.get("output_file_id")):
+            response = line.get("response") or {}
+            if not line.get("error") and response.get("status_code") == 200:
+                results[line["custom_id"]] = response["body"]
+        return results
+
+    async def run(self, name: str, requests: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """
+        requests(custom_id -> 요청 본문)를 일괄 작업으로 처리하고 성공한 줄의 응답 본문을 반환합니다.
+        끝내 실패한 줄은 결과에 포함되지 않습니다.
+        """
+        results: dict[str, dict[str, Any]] = {}
+        if not requests:
+            return results
+        pending = dict(requests)
+        self.stats["lines"] += len(requests)
+        for attempt in range(1, self.max_attempts + 1):
+            path = self.write_job(name, pending)
+            try:
+                batch = await self.wait(await self.submit(name, path))
+                completed = await self.collect(batch)
+            finally:
+                os.remove(path)
+
+            results.update(completed)
+            pending = {key: body for key, body in pending.items() if key not in completed}
+            print(
+                f"  일괄 작업 {name} ({attempt}회차, {batch['status']}): "
+                f"성공 {len(completed)}건, 실패 {len(pending)}건"
+            )
+            if not pending:
+                break
+            if attempt < self.max_attempts:
+                self.stats["requeued"] += len(pending)
+
+        self.stats["succeeded"] += len(results)
+        self.stats["failed"] += len(pending)
+        return results
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
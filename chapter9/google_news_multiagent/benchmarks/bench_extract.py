@@ -0,0 +1,124 @@
+"""
+parse_entry 다운로드/본문 추출 벤치마크
+
+저장된 기사 HTML(fixtures)을 60건으로 복제해 다음 두 방식을 비교합니다.
+- 이전: 동기 다운로드(time.sleep으로 지연 재현) + 이벤트 루프 안에서 변경 전 추출 코드
+  (조선일보는 정규식 + json.loads, 나머지는 trafilatura)
+- 이후: 공유 비동기 클라이언트 다운로드 + 프로세스 풀 추출
+
+실행: python benchmarks/bench_extract.py [--pages 60] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agents.collector import RSSCollectorAgent
+from extractors import extract_with_trafilatura
+from http_client import PooledHttpClient
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+FIXTURES = {
+    "https://www.example.co.kr/article/{i}": "article_generic.html",
+    "https://www.chosun.com/article/{i}": "article_chosun.html",
+}
+
+
+def extract_chosun_before(html_content: str) -> str:
+    """변경 전 조선일보 추출 (Fusion.globalContent 정규식 매칭 후 json.loads)"""
+    match = re.search(r"Fusion\.globalContent\s*=\s*({.*?});", html_content, re.DOTALL)
+    if match:
+        try:
+            content_data = json.loads(match.group(1))
+            texts = []
+            if "content_elements" in content_data:
+                for element in content_data["content_elements"]:
+                    if element.get("type") == "text" and "content" in element:
+                        texts.append(element["content"])
+            return "\n\n".join(texts)
+        except json.JSONDecodeError:
+            pass
+    return ""
+
+
+def extract_before(html_content: str, url: str) -> str:
+    """변경 전 parse_entry의 추출 분기 (빠른 추출기 등록부 없이)"""
+    if "chosun.com" in url:
+        return extract_chosun_before(html_content)
+    return extract_with_trafilatura(html_content)
+
+
+def load_pages(count: int) -> dict[str, str]:
+    """픽스처를 복제해 URL -> HTML 캐시를 만듭니다."""
+    templates = [
+        (url, (FIXTURE_DIR / name).read_text(encoding="utf-8"))
+        for url, name in FIXTURES.items()
+    ]
+    pages = {}
+    for i in range(count):
+        url, html = templates[i % len(templates)]
+        pages[url.format(i=i)] = html
+    return pages
+
+
+async def run_before(pages: dict[str, str], latency: float) -> float:
+    """기존 방식: async 함수 안에서 블로킹 다운로드와 추출"""
+
+    async def parse(url: str) -> str:
+        time.sleep(latency)
+        return extract_before(pages[url], url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(parse(url) for url in pages))
+    return time.perf_counter() - start
+
+
+async def run_after(pages: dict[str, str], latency: float) -> float:
+    """개선 방식: 비동기 다운로드 + 프로세스 풀 추출"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, text=pages[str(request.url)])
+
+    collector = RSSCollectorAgent(PooledHttpClient(httpx.MockTransport(handler)))
+    # 프로세스 풀 기동 비용은 장기 실행 시 한 번만 지불하므로 측정에서 제외
+    await collector.extract("", "")
+
+    async def parse(url: str) -> str:
+        html = await collector.download_article(url)
+        return await collector.extract(html, url)
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(parse(url) for url in pages))
+        return time.perf_counter() - start
+    finally:
+        await collector.aclose()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.05, help="다운로드 지연(초)")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    before = await run_before(pages, args.latency)
+    after = await run_after(pages, args.latency)
+
+    print(f"페이지 {len(pages)}건, 다운로드 지연 {args.latency:.3f}s, CPU {os.cpu_count()}개")
+    print(f"이전 (블로킹): {before:.3f}s")
+    print(f"이후 (비동기 + 프로세스 풀): {after:.3f}s")
+    print(f"속도 향상: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""
+빠른 본문 추출기 마이크로 벤치마크
+
+저장된 기사 HTML(fixtures)마다 등록된 빠른 추출기와 trafilatura의 페이지당 처리 시간을 비교합니다.
+
+실행: python benchmarks/bench_extractors.py [--repeat 200]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extractors import (
+    EXTRACTORS,
+    GENERIC_EXTRACTORS,
+    extract_with_trafilatura,
+)
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+# 추출기 이름 -> 해당 형식의 저장된 HTML
+FIXTURES = {
+    "extract_chosun_content": "article_chosun.html",
+    "extract_json_ld_body": "article_jsonld.html",
+}
+
+
+def time_per_page(func, html: str, repeat: int) -> float:
+    """페이지당 평균 처리 시간(ms)"""
+    return timeit.timeit(lambda: func(html), number=repeat) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    extractors = {e.name: e for e in list(EXTRACTORS.values()) + GENERIC_EXTRACTORS}
+    print(f"{'추출기':<26}{'빠른 경로':>12}{'trafilatura':>14}{'속도 향상':>10}  결과")
+
+    for name, extractor in extractors.items():
+        fixture = FIXTURES.get(name)
+        if not fixture:
+            print(f"{name:<26}  (fixture 없음)")
+            continue
+
+        html = (FIXTURE_DIR / fixture).read_text(encoding="utf-8")
+        fast_ms = time_per_page(extractor.extract, html, args.repeat)
+        slow_ms = time_per_page(extract_with_trafilatura, html, args.repeat)
+
+        # 임베디드 JSON만 있는 페이지는 trafilatura가 본문 대신 메뉴 등을 추출하기도 함
+        fast_text = extractor.extract(html)
+        slow_text = extract_with_trafilatura(html)
+        check = "일치" if fast_text.split() == slow_text.split() else (
+            f"다름 ({len(fast_text)}자 / {len(slow_text)}자)"
+        )
+        print(
+            f"{name:<26}{fast_ms:>10.3f}ms{slow_ms:>12.3f}ms"
+            f"{slow_ms / fast_ms:>9.0f}x  {check}"
+        )
+
+
+if __name__ == "__main__":
+    main()
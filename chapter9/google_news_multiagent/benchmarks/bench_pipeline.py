@@ -0,0 +1,162 @@
+"""
+전체 파이프라인 오프라인 벤치마크
+
+실제 Google News와 OpenAI 없이, 저장된 RSS/batchexecute/기사 HTML을 재생하는 전송 계층과
+지연 시간·토큰 수를 지정할 수 있는 가짜 LLM으로 워크플로 전체를 실행합니다.
+기사 수(기본 60/600/6000건)별로 단계별 처리량과 기사 단위 지연 시간을 비교해 확장성 회귀를 찾습니다.
+기본 설정(중복 제거, 사건 군집화, LLM 캐시, 로컬 분류, 모델 라우팅 등)을 그대로 측정하고,
+--baseline을 주면 이 기능을 모두 끈 기준 구성으로 측정합니다. (매 실행은 빈 캐시/장부에서 시작)
+
+모델 라우팅의 fast 모델 호출당 지연은 --fast-llm-latency(없으면 --llm-latency)로 정합니다.
+--batch를 주면 요약/분류를 로컬 Batch API 대역(LocalBatchServer)에 일괄 작업으로 제출하고,
+--batch-failure-rate 비율의 줄을 첫 제출에서 실패시켜 실패한 줄만 다시 제출되는지 확인합니다.
+
+실행: python benchmarks/bench_pipeline.py [--sizes 60 600 6000] [--llm-latency 0.05] [--streaming]
+                                        [--baseline] [--fast-llm-latency 0.01]
+                                        [--batch --batch-failure-rate 0.1]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+
+import httpx
+
+from offline import FakeChatModel, LocalBatchServer, ReplayTransport
+from config import Config
+from state import NewsState
+from http_client import PooledHttpClient
+from metrics import MetricsCollector
+from agents.collector import RSSCollectorAgent
+from model_router import ModelRouter
+from batch_api import BatchJobClient
+from workflow import create_news_workflow
+
+
+def configure(args: argparse.Namespace, cache_dir: str) -> None:
+    """
+    매 실행을 같은 조건에서 시작하도록 캐시/장부를 임시 디렉터리에 두고,
+    호스트 속도 제한과 RPM/TPM 예산은 측정 대상이 아니므로 충분히 크게 잡습니다.
+    baseline이면 처리량 최적화 기능을 모두 끕니다.
+    """
+    Config.CACHE_DIR = cache_dir
+    Config.CACHE_DB_PATH = f"{cache_dir}/cache.sqlite3"
+    Config.LEDGER_DB_PATH = f"{cache_dir}/ledger.sqlite3"
+    Config.BATCH_JOB_DIR = f"{cache_dir}/batch_jobs"
+    if args.baseline:
+        Config.INCREMENTAL = False
+        Config.DEDUP_ENABLED = False
+        Config.CLUSTER_ENABLED = False
+        Config.LLM_CACHE_ENABLED = False
+        Config.LOCAL_CLASSIFIER_ENABLED = False
+        Config.ROUTING_ENABLED = False
+        Config.COMPRESSION_ENABLED = False
+        Config.BATCHED_CLASSIFICATION = False
+    Config.FETCH_HOST_RATE = Config.FETCH_HOST_BURST = 1_000_000
+    Config.LLM_REQUESTS_PER_MINUTE = Config.LLM_TOKENS_PER_MINUTE = 1_000_000_000
+    if args.llm_concurrency:
+        Config.LLM_MAX_CONCURRENCY = args.llm_concurrency
+    if args.workers is not None:
+        Config.EXTRACT_WORKERS = args.workers
+
+
+async def run_once(args: argparse.Namespace, size: int) -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        configure(args, cache_dir)
+        Config.MAX_NEWS_COUNT = size
+
+        transport = ReplayTransport(size, latency=args.http_latency)
+        llm = FakeChatModel(latency=args.llm_latency, output_tokens=args.output_tokens)
+        metrics = MetricsCollector()
+        router = None
+        if Config.ROUTING_ENABLED:
+            fast_latency = args.llm_latency if args.fast_llm_latency is None else args.fast_llm_latency
+            fast = FakeChatModel(latency=fast_latency, output_tokens=args.output_tokens)
+            router = ModelRouter(fast, llm)
+        batch_server, batch_client = None, None
+        if args.batch:
+            batch_server = LocalBatchServer(llm, failure_rate=args.batch_failure_rate)
+            batch_client = BatchJobClient(httpx.MockTransport(batch_server), poll_interval=0.0)
+        collector = RSSCollectorAgent(
+            PooledHttpClient(httpx.MockTransport(transport)),
+            feed_urls=[Config.RSS_URL],
+            metrics=metrics,
+        )
+        app = create_news_workflow(
+            llm,
+            collector,
+            streaming=args.streaming,
+            metrics=metrics,
+            router=router,
+            batch_client=batch_client,
+        )
+
+        start = time.perf_counter()
+        try:
+            state = await app.ainvoke(NewsState())
+        finally:
+            await collector.aclose()
+            if batch_client:
+                await batch_client.aclose()
+        elapsed = time.perf_counter() - start
+
+    snapshot = metrics.snapshot(state["metrics"])
+    llm_calls = sum(model.calls for model in router.models.values()) if router else llm.calls
+    if batch_server:
+        llm_calls = batch_server.model.calls
+    processed = len(state["summarized_news"])
+    print(f"\n=== {size}건 ({'기준 구성' if args.baseline else '기본 설정'}) ===")
+    print(
+        f"전체 {elapsed:.2f}s ({processed / elapsed:.1f}건/s), "
+        f"수집 {len(state['raw_news'])}건, 처리 {processed}건, "
+        f"HTTP 요청 {transport.requests}회, LLM 호출 {llm_calls}회, "
+        f"토큰 {snapshot['tokens'].get('total_tokens', 0):,}, 오류 {sum(snapshot['errors'].values())}건"
+    )
+    print(f"{'단계':<12}{'시간(s)':>10}{'처리량(건/s)':>14}")
+    for stage, seconds in snapshot["stages"].items():
+        print(f"{stage:<12}{seconds:>10.3f}{processed / seconds if seconds else 0:>14.1f}")
+    print(f"{'작업':<12}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'건수':>8}")
+    for name, latency in snapshot["latency"].items():
+        print(
+            f"{name:<12}{latency['p50'] * 1000:>10.1f}{latency['p90'] * 1000:>10.1f}"
+            f"{latency['p99'] * 1000:>10.1f}{latency['count']:>8}"
+        )
+    if batch_server:
+        batch = state["metrics"].get("batch", {})
+        print(
+            f"일괄 작업 {batch.get('jobs', 0)}개, 줄 {batch.get('lines', 0)}건, "
+            f"서버 측 실패 {batch_server.failed_lines}건, 재제출 {batch.get('requeued', 0)}건, "
+            f"최종 실패 {batch.get('failed', 0)}건"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[60, 600, 6000])
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="LLM 호출당 지연(초)")
+    parser.add_argument("--output-tokens", type=int, default=80, help="LLM 응답당 출력 토큰 수")
+    parser.add_argument("--http-latency", type=float, default=0.0, help="HTTP 요청당 지연(초)")
+    parser.add_argument("--llm-concurrency", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="본문 추출 프로세스 수")
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument(
+        "--baseline", action="store_true", help="중복 제거/군집화/캐시/로컬 분류/라우팅 등을 모두 끈 구성"
+    )
+    parser.add_argument("--batch", action="store_true", help="로컬 Batch API 대역으로 일괄 처리")
+    parser.add_argument(
+        "--batch-failure-rate", type=float, default=0.0, help="첫 제출에서 실패시킬 줄의 비율"
+    )
+    parser.add_argument(
+        "--fast-llm-latency",
+        type=float,
+        default=None,
+        help="모델 라우팅 시 fast 모델 호출당 지연(초, 기본값은 --llm-latency)",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        await run_once(args, size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
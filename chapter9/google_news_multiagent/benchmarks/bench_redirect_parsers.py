@@ -0,0 +1,105 @@
+"""
+Google News 리디렉션 페이지 파서 벤치마크
+
+저장된 리디렉션 페이지(fixtures/google_news_article.html)로 등록된 파서 백엔드마다
+- 정확도: 저장된 형식, 엔티티로 인코딩된 속성, 다른 태그의 data-p가 섞인 큰 페이지에서 같은 값을 찾는지
+- 페이지당 처리 시간
+- 여러 페이지를 프로세스 풀에 나눠 처리할 때의 전체 시간
+을 비교합니다.
+
+실행: python benchmarks/bench_redirect_parsers.py [--repeat 50] [--page-kb 300] [--pages 600] [--workers 4]
+"""
+import argparse
+import html
+import os
+import re
+import sys
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from redirect_parsers import PARSERS, find_data_p
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+RECORDED_ID = "CBMiRECORDED00"
+RECORDED_ATTRIBUTE = re.compile(r"data-p='([^']*)'")
+
+
+def build_pages(page_kb: int) -> tuple[str, dict[str, str]]:
+    """기대값과 형식별 리디렉션 페이지"""
+    recorded = (FIXTURE_DIR / "google_news_article.html").read_text(encoding="utf-8")
+    expected = RECORDED_ATTRIBUTE.search(recorded).group(1)
+
+    # 실제 페이지처럼 큰따옴표 속성 안의 따옴표를 &quot;로 인코딩
+    encoded = RECORDED_ATTRIBUTE.sub(
+        lambda m: f'data-p="{html.escape(m.group(1), quote=True)}"', recorded
+    )
+    # 본문 앞에 큰 인라인 스크립트와 data-p를 가진 다른 태그를 넣어 실제 페이지 크기로 맞춤
+    script = "var AF_initDataChunkQueue=[];" * (page_kb * 512 // 30)
+    markup = '<div class="m9Lgqe" jsname="x"><span>뉴스</span></div>' * (page_kb * 512 // 60)
+    padded = encoded.replace(
+        "</head>", f'<script nonce="x">{script}</script></head>'
+    ).replace("<body>", f'<body>{markup}<div data-p="decoy"></div>')
+    return expected, {"recorded": recorded, "encoded": encoded, "padded": padded}
+
+
+def time_per_page(parse, page: str, repeat: int) -> float:
+    """페이지당 평균 처리 시간(ms)"""
+    return timeit.timeit(lambda: parse(page), number=repeat) / repeat * 1000
+
+
+def time_sharded(name: str, pages: list[str], workers: int) -> float:
+    """pages를 workers개 프로세스에 나눠 파싱하는 데 걸린 시간(s)"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 워커 기동 비용은 제외
+        list(executor.map(find_data_p, pages[:workers], [name] * workers))
+        start = time.perf_counter()
+        list(
+            executor.map(
+                find_data_p,
+                pages,
+                [name] * len(pages),
+                chunksize=max(1, len(pages) // (workers * 4)),
+            )
+        )
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--page-kb", type=int, default=300, help="padded 페이지 크기(KB)")
+    parser.add_argument("--pages", type=int, default=600, help="프로세스 풀 비교에 쓸 페이지 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    expected, variants = build_pages(args.page_kb)
+    padded = variants["padded"]
+    pages = [padded.replace(RECORDED_ID, f"CBMiBENCH{i:06d}") for i in range(args.pages)]
+    print(
+        f"페이지 크기 {len(padded.encode('utf-8')) / 1024:.0f}KB, "
+        f"풀 비교 {args.pages}건 / {args.workers}프로세스"
+    )
+    print(f"{'파서':<12}{'정확도':>10}{'페이지당(ms)':>14}{'직렬(s)':>10}{'풀(s)':>10}")
+
+    for name, redirect_parser in PARSERS.items():
+        correct = sum(redirect_parser.parse(page) == expected for page in variants.values())
+        per_page_ms = time_per_page(redirect_parser.parse, padded, args.repeat)
+
+        start = time.perf_counter()
+        for page in pages:
+            redirect_parser.parse(page)
+        serial = time.perf_counter() - start
+        sharded = time_sharded(name, pages, args.workers)
+
+        print(
+            f"{name:<12}{correct:>8}/{len(variants)}{per_page_ms:>14.3f}"
+            f"{serial:>10.3f}{sharded:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
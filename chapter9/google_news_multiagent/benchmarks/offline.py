@@ -0,0 +1,361 @@
+"""
+오프라인 벤치마크용 재생(replay) 전송 계층과 가짜 LLM
+
+- ReplayTransport: 저장된 Google News RSS, 리디렉션 페이지, batchexecute 응답, 기사 HTML을
+  httpx.MockTransport로 재생합니다. 기사 수에 맞춰 저장된 피드 항목을 복제해 ID를 바꾸고,
+  중복 제거/사건 군집화가 기사를 합치지 않도록 기사마다 다른 제목과 본문(synthetic_story)을 넣습니다.
+- FakeChatModel: ChatOpenAI 대신 쓰는 가짜 채팅 모델. 지정한 지연 시간 뒤에 결정적인 응답과
+  토큰 사용량(usage_metadata)을 돌려주며, with_structured_output도 지원합니다.
+- LocalBatchServer: OpenAI Batch API(파일 업로드, 일괄 작업 생성/조회, 결과 파일)를 흉내 내는
+  httpx.MockTransport 핸들러. 각 줄은 FakeChatModel로 답하고, 지정한 비율의 줄을 첫 제출에서 실패시킵니다.
+"""
+import asyncio
+import itertools
+import json
+import random
+import re
+import sys
+import time
+import zlib
+from pathlib import Path
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from typing import Any, Optional
+
+import httpx
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, convert_to_messages
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Config
+from compression import count_tokens
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+RECORDED_ID = "CBMiRECORDED00"
+RECORDED_ID_PATTERN = re.compile(r"CBMiRECORDED\d{2}")
+ITEM_PATTERN = re.compile(r"\s*<item>.*?</item>", re.DOTALL)
+BENCH_ID_PATTERN = re.compile(r"CBMiBENCH\d{6}")
+HEADLINE_PATTERN = re.compile(r"<description>(.*?)</description>")
+# 합성 본문의 조사/어미 (모든 기사에 공통으로 나오는 흔한 음절 쌍)
+PARTICLES = ("은", "는", "이", "가", "을", "를", "에서", "으로", "와", "의")
+
+# 원문 URL 형식 -> 해당 언론사 형식의 저장된 기사 HTML
+ARTICLE_URLS = {
+    "https://www.example.co.kr/article/{id}": "article_generic.html",
+    "https://www.chosun.com/national/{id}/": "article_chosun.html",
+    "https://news.example.com/{id}.html": "article_jsonld.html",
+}
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURE_DIR / name).read_text(encoding="utf-8")
+
+
+def synthetic_story(article_id: str, sentences: int) -> tuple[str, list[str]]:
+    """
+    기사 ID를 시드로 만든 제목과 본문 문장
+    단어는 한글 음절을 무작위로 조합하므로 조사/어미 외에는 다른 기사와 겹치지 않습니다.
+    """
+    rng = random.Random(article_id)
+
+    def word() -> str:
+        return "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 3)))
+
+    def sentence() -> str:
+        words = [word() + rng.choice(PARTICLES) for _ in range(rng.randint(6, 10))]
+        return " ".join(words) + f" {word()}했다."
+
+    title = " ".join(word() for _ in range(rng.randint(4, 6)))
+    return title, [sentence() for _ in range(sentences)]
+
+
+class ReplayTransport:
+    """저장된 응답을 재생하는 httpx.MockTransport 핸들러"""
+
+    def __init__(self, count: int, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self.redirect_page = read_fixture("google_news_article.html")
+        self.batch_response = read_fixture("batchexecute_response.txt")
+        self.article_urls = list(ARTICLE_URLS)
+        self.articles = {
+            httpx.URL(url.format(id="x")).host: read_fixture(name)
+            for url, name in ARTICLE_URLS.items()
+        }
+        # 저장된 기사 HTML은 모두 같은 기사이므로, 그 제목과 문장을 기사마다 합성한 것으로 바꿔 재생
+        generic = read_fixture("article_generic.html")
+        self.recorded_title = re.search(r'og:title" content="(.*?)"', generic).group(1)
+        self.recorded_sentences = re.findall(
+            r"<p>(.*?)</p>", re.search(r'article-body">(.*?)</div>', generic).group(1)
+        )
+        self.feed = self.build_feed(read_fixture("google_news_rss.xml"), count)
+
+    def build_feed(self, recorded: str, count: int) -> str:
+        """저장된 피드 항목을 count개가 되도록 복제하고 기사 ID와 합성한 제목을 새로 붙입니다."""
+        items = ITEM_PATTERN.findall(recorded)
+        cloned = []
+        for i in range(count):
+            article_id = f"CBMiBENCH{i:06d}"
+            item = RECORDED_ID_PATTERN.sub(article_id, items[i % len(items)])
+            headline = HEADLINE_PATTERN.search(item).group(1)
+            cloned.append(item.replace(headline, self.story(article_id)[0]))
+        head = recorded[: recorded.index(items[0])]
+        tail = recorded[recorded.index(items[-1]) + len(items[-1]) :]
+        return head + "".join(cloned) + tail
+
+    def story(self, article_id: str) -> tuple[str, list[str]]:
+        return synthetic_story(article_id, len(self.recorded_sentences))
+
+    def article_html(self, template: str, article_id: str) -> str:
+        """저장된 기사 HTML의 제목과 본문 문장(HTML/JSON 표기 모두)을 합성한 것으로 바꿉니다."""
+        title, sentences = self.story(article_id)
+        html = template.replace(self.recorded_title, title)
+        for recorded, sentence in zip(self.recorded_sentences, sentences):
+            escaped = json.dumps(recorded, ensure_ascii=False)[1:-1]
+            html = html.replace(recorded, sentence).replace(escaped, sentence)
+        return html
+
+    def article_url(self, article_id: str) -> str:
+        template = self.article_urls[zlib.crc32(article_id.encode()) % len(self.article_urls)]
+        return template.format(id=article_id)
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+        if request.url.host == "news.google.com":
+            if path.startswith("/rss/articles/"):
+                article_id = path.rsplit("/", 1)[1]
+                return httpx.Response(200, text=self.redirect_page.replace(RECORDED_ID, article_id))
+            if path.endswith("/batchexecute"):
+                f_req = json.loads(httpx.QueryParams(request.content.decode())["f.req"])
+                article_id = json.loads(f_req[0][0][1])[2]
+                recorded_url = "https://www.example.co.kr/article/" + RECORDED_ID
+                return httpx.Response(
+                    200,
+                    text=self.batch_response.replace(recorded_url, self.article_url(article_id)),
+                )
+            return httpx.Response(
+                200, text=self.feed, headers={"content-type": "application/rss+xml"}
+            )
+
+        template = self.articles.get(request.url.host)
+        article_id = BENCH_ID_PATTERN.search(path)
+        if template is None or article_id is None:
+            return httpx.Response(404)
+        return httpx.Response(
+            200,
+            text=self.article_html(template, article_id.group()),
+            headers={"content-type": "text/html; charset=utf-8"},
+        )
+
+
+class FakeChatModel(BaseChatModel):
+    """ChatOpenAI와 같은 방식으로 호출할 수 있는 가짜 채팅 모델"""
+
+    model_name: str = "fake-chat"
+    latency: float = 0.05
+    output_tokens: int = 80
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @staticmethod
+    def category_for(title: str) -> str:
+        """제목 해시로 고른 고정 카테고리"""
+        categories = Config.NEWS_CATEGORIES
+        return categories[zlib.crc32(title.encode("utf-8")) % len(categories)]
+
+    def respond(self, messages: list[BaseMessage], schema: Optional[type]) -> str:
+        prompt = messages[-1].content
+        title = re.search(r"제목: (.*)", prompt)
+        title = title.group(1) if title else ""
+
+        if schema is None:
+            if "분류" in messages[0].content:
+                return self.category_for(title)
+            return f"{title} 관련 보도입니다. 주요 내용을 두세 문장으로 요약했습니다."
+
+        if "assignments" in schema.model_fields:
+            assignments = [
+                {"index": int(index), "category": self.category_for(item_title)}
+                for index, item_title in re.findall(r"^\[(\d+)\] 제목: (.*)$", prompt, re.M)
+            ]
+            return json.dumps({"assignments": assignments}, ensure_ascii=False)
+        return json.dumps(
+            {"summary": f"{title} 관련 보도입니다.", "category": self.category_for(title)},
+            ensure_ascii=False,
+        )
+
+    def _result(self, messages: list[BaseMessage], schema: Optional[type]) -> ChatResult:
+        self.calls += 1
+        input_tokens = count_tokens("".join(str(message.content) for message in messages))
+        message = AIMessage(
+            content=self.respond(messages, schema),
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": self.output_tokens,
+                "total_tokens": input_tokens + self.output_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        return self._result(messages, kwargs.get("structured_schema"))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._result(messages, kwargs.get("structured_schema"))
+
+    def with_structured_output(self, schema: type, **kwargs: Any):
+        """JSON으로 응답하고 pydantic 모델로 파싱하는 체인"""
+        return self.bind(structured_schema=schema) | PydanticOutputParser(pydantic_object=schema)
+
+
+class LocalBatchServer:
+    """OpenAI Batch API를 흉내 내는 httpx.MockTransport 핸들러 (BatchJobClient 시험용)"""
+
+    def __init__(
+        self,
+        model: Optional[FakeChatModel] = None,
+        failure_rate: float = 0.0,
+        polls_to_complete: int = 1,
+    ):
+        self.model = model or FakeChatModel(latency=0.0)
+        self.failure_rate = failure_rate
+        self.polls_to_complete = polls_to_complete
+        self.files: dict[str, str] = {}
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.polls: dict[str, int] = {}
+        self.seen: set[str] = set()
+        self.ids = itertools.count(1)
+        self.failed_lines = 0
+
+    def should_fail(self, custom_id: str) -> bool:
+        """failure_rate 비율의 줄을 첫 제출에서만 실패시킵니다. (다시 제출하면 성공)"""
+        first = custom_id not in self.seen
+        self.seen.add(custom_id)
+        return first and zlib.crc32(custom_id.encode()) % 1000 < self.failure_rate * 1000
+
+    def answer(self, line: dict[str, Any]) -> dict[str, Any]:
+        """입력 한 줄에 대한 결과 줄 (chat.completions 응답 본문 또는 오류)"""
+        custom_id = line["custom_id"]
+        if self.should_fail(custom_id):
+            self.failed_lines += 1
+            return {
+                "id": f"batch_req_{next(self.ids)}",
+                "custom_id": custom_id,
+                "response": {"status_code": 500, "body": {"error": {"message": "server error"}}},
+                "error": None,
+            }
+
+        body = line["body"]
+        result = self.model._result(convert_to_messages(body["messages"]), None)
+        message = result.generations[0].message
+        usage = message.usage_metadata
+        return {
+            "id": f"batch_req_{next(self.ids)}",
+            "custom_id": custom_id,
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "object": "chat.completion",
+                    "model": body["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": message.content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": usage["input_tokens"],
+                        "completion_tokens": usage["output_tokens"],
+                        "total_tokens": usage["total_tokens"],
+                    },
+                },
+            },
+            "error": None,
+        }
+
+    def upload(self, request: httpx.Request) -> httpx.Response:
+        content_type = request.headers["content-type"].encode()
+        form = BytesParser(policy=default_policy).parsebytes(
+            b"content-type: " + content_type + b"\r\n\r\n" + request.content
+        )
+        part = next(part for part in form.iter_parts() if part.get_filename())
+        file_id = f"file-{next(self.ids)}"
+        self.files[file_id] = part.get_payload(decode=True).decode("utf-8")
+        return httpx.Response(200, json={"id": file_id, "object": "file", "purpose": "batch"})
+
+    def create_batch(self, request: httpx.Request) -> httpx.Response:
+        params = json.loads(request.content)
+        batch_id = f"batch_{next(self.ids)}"
+        self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": params["endpoint"],
+            "input_file_id": params["input_file_id"],
+            "completion_window": params["completion_window"],
+            "status": "validating",
+            "output_file_id": None,
+            "error_file_id": None,
+            "metadata": params.get("metadata"),
+        }
+        self.polls[batch_id] = 0
+        return httpx.Response(200, json=self.batches[batch_id])
+
+    def poll_batch(self, batch_id: str) -> httpx.Response:
+        """polls_to_complete번째 조회에서 모든 줄을 처리하고 결과/오류 파일을 만듭니다."""
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            return httpx.Response(404)
+        self.polls[batch_id] += 1
+        if batch["status"] != "completed":
+            if self.polls[batch_id] < self.polls_to_complete:
+                batch["status"] = "in_progress"
+            else:
+                lines = [
+                    json.loads(line)
+                    for line in self.files[batch["input_file_id"]].splitlines()
+                    if line.strip()
+                ]
+                results = [self.answer(line) for line in lines]
+                batch["output_file_id"] = self.store_results(
+                    [r for r in results if r["response"]["status_code"] == 200]
+                )
+                batch["error_file_id"] = self.store_results(
+                    [r for r in results if r["response"]["status_code"] != 200]
+                )
+                batch["status"] = "completed"
+        return httpx.Response(200, json=batch)
+
+    def store_results(self, lines: list[dict[str, Any]]) -> Optional[str]:
+        if not lines:
+            return None
+        file_id = f"file-{next(self.ids)}"
+        self.files[file_id] = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+        return file_id
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v1")
+        if request.method == "POST" and path == "/files":
+            return self.upload(request)
+        if request.method == "POST" and path == "/batches":
+            return self.create_batch(request)
+        if request.method == "GET" and path.startswith("/batches/"):
+            return self.poll_batch(path.rsplit("/", 1)[1])
+        if request.method == "GET" and path.startswith("/files/") and path.endswith("/content"):
+            content = self.files.get(path.split("/")[2])
+            if content is None:
+                return httpx.Response(404)
+            return httpx.Response(200, text=content)
+        return httpx.Response(404)
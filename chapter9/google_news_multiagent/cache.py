@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Optional
+
+
+def content_key(*parts: str) -> str:
+    """여러 값을 구분자로 이어 만든 SHA-256 해시 (내용 기반 캐시 키)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def model_name(llm: Any) -> str:
+    """캐시 키에 넣을 모델 이름"""
+    return getattr(llm, "model_name", None) or type(llm).__name__
+
+
+class SQLiteCache:
+    """TTL과 최대 개수 제한이 있는 SQLite 기반 영속 캐시"""
+
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, namespace: str, ttl: float, max_entries: int):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._writes = 0
+        self.reset_stats()
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )"""
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (namespace, accessed_at)"
+        )
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 값을 조회합니다. 만료되었거나 없으면 None"""
+        row = self.conn.execute(
+            "SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        now = time.time()
+
+        if row is None or now - row[1] > self.ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.conn.execute(
+            "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+            (now, self.namespace, key),
+        )
+        self.conn.commit()
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 값을 저장하고 주기적으로 만료/초과 항목을 정리합니다."""
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+            (self.namespace, key, json.dumps(value, ensure_ascii=False), now, now),
+        )
+        self.conn.commit()
+
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self.evict()
+
+    def touch(self, key: str) -> bool:
+        """
+        만료되지 않은 항목의 생성/사용 시각을 지금으로 갱신합니다. (적중률 통계에는 넣지 않음)
+        항목이 없거나 만료되었으면 False
+        """
+        now = time.time()
+        cursor = self.conn.execute(
+            """UPDATE cache SET created_at = ?, accessed_at = ?
+            WHERE namespace = ? AND key = ? AND created_at >= ?""",
+            (now, now, self.namespace, key, now - self.ttl),
+        )
+        self.conn.commit()
+        return cursor.rowcount > 0
+
+    def evict(self) -> None:
+        """만료된 항목을 지우고, 최대 개수를 넘으면 오래 안 쓴 항목부터 지웁니다."""
+        self.conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND created_at < ?",
+            (self.namespace, time.time() - self.ttl),
+        )
+        self.conn.execute(
+            """DELETE FROM cache WHERE namespace = ? AND key IN (
+                SELECT key FROM cache WHERE namespace = ?
+                ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (self.namespace, self.namespace, self.max_entries),
+        )
+        self.conn.commit()
+
+    def reset_stats(self) -> None:
+        """적중/실패 횟수를 0으로 되돌립니다. (상주 모드에서 실행마다 새로 집계)"""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """적중/실패 횟수와 적중률"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        self.evict()
+        self.conn.close()
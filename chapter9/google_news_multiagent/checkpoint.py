@@ -0,0 +1,106 @@
+import dataclasses
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from config import Config
+from cache import SQLiteCache, content_key
+from articles import Article, ArticleStore
+
+try:
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+except ImportError:  # langgraph-checkpoint-sqlite 미설치
+    AsyncSqliteSaver = None
+
+CONTENT_REF = "__content_ref__"
+# 체크포인트에서 복원할 수 있는 이 프로젝트의 상태 타입
+CHECKPOINT_TYPES = [("state", "NewsState"), ("articles", "Article"), ("articles", "ArticleStore")]
+
+
+class ExternalContentSerializer(JsonPlusSerializer):
+    """
+    체크포인트에 기사 본문 대신 참조(해시)만 저장하는 직렬화기
+    본문은 내용 해시를 키로 별도 저장소에 한 번만 기록되므로,
+    단계마다 체크포인트를 남겨도 같은 본문을 반복해서 쓰지 않습니다.
+    저장소의 TTL/개수 제한으로 지워진 본문은 다음 체크포인트에서 다시 기록합니다.
+    """
+
+    def __init__(self, store: SQLiteCache, min_chars: int = None):
+        # 체크포인트에 들어가는 상태 타입을 명시해 LANGGRAPH_STRICT_MSGPACK 모드에서도 복원되도록 함
+        super().__init__(allowed_msgpack_modules=CHECKPOINT_TYPES)
+        self.store = store
+        self.min_chars = min_chars or Config.CHECKPOINT_CONTENT_MIN_CHARS
+
+    def externalize(self, obj: Any) -> Any:
+        if isinstance(obj, list):
+            return [self.externalize(item) for item in obj]
+        if isinstance(obj, dict):
+            return {key: self.externalize(value) for key, value in obj.items()}
+        if isinstance(obj, ArticleStore):
+            return ArticleStore(self.externalize(obj.articles))
+        if not isinstance(obj, Article):
+            return obj
+
+        content = obj.content
+        if isinstance(content, str) and len(content) >= self.min_chars:
+            key = content_key(content)
+            # 이미 있으면 보관 기한만 갱신하고, 없거나 만료되었으면 다시 기록
+            if not self.store.touch(key):
+                self.store.set(key, content)
+            obj = dataclasses.replace(obj, content={CONTENT_REF: key})
+        return obj
+
+    def resolve(self, obj: Any) -> Any:
+        if isinstance(obj, list):
+            return [self.resolve(item) for item in obj]
+        if isinstance(obj, dict):
+            return {key: self.resolve(value) for key, value in obj.items()}
+        if isinstance(obj, ArticleStore):
+            obj.articles = self.resolve(obj.articles)
+            return obj
+        if isinstance(obj, Article) and isinstance(obj.content, dict):
+            content = self.store.get(obj.content[CONTENT_REF])
+            if content is None:
+                # 빈 본문으로 이어서 실행하면 요약이 조용히 틀어지므로 재개를 중단
+                raise ValueError(
+                    f"체크포인트가 참조하는 기사 본문이 없어 이어서 실행할 수 없습니다: {obj.title}"
+                )
+            obj.content = content
+        return obj
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        return super().dumps_typed(self.externalize(obj))
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.resolve(super().loads_typed(data))
+
+
+@asynccontextmanager
+async def open_checkpointer() -> AsyncIterator[Optional[Any]]:
+    """
+    SQLite 체크포인터를 엽니다.
+    비활성화되어 있거나 langgraph-checkpoint-sqlite가 없으면 None을 돌려줍니다.
+    """
+    if not Config.CHECKPOINT_ENABLED:
+        yield None
+        return
+    if AsyncSqliteSaver is None:
+        print("langgraph-checkpoint-sqlite가 설치되지 않아 체크포인트 없이 실행합니다.")
+        yield None
+        return
+
+    store = SQLiteCache(
+        Config.CACHE_DB_PATH,
+        namespace="checkpoint_content",
+        ttl=Config.CHECKPOINT_RETENTION,
+        max_entries=Config.CHECKPOINT_MAX_CONTENTS,
+    )
+    os.makedirs(os.path.dirname(Config.CHECKPOINT_DB_PATH), exist_ok=True)
+    try:
+        async with aiosqlite.connect(Config.CHECKPOINT_DB_PATH) as conn:
+            yield AsyncSqliteSaver(conn, serde=ExternalContentSerializer(store))
+    finally:
+        store.close()
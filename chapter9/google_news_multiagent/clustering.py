@@ -0,0 +1,101 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Hashable, Iterable
+
+# 특징(문자 n-gram, 어절 또는 임베딩 차원) -> 가중치
+SparseVector = dict[Hashable, float]
+
+# 후보 군집을 찾을 때 쓰는 문서의 상위 가중치 특징 수
+CANDIDATE_TERMS = 24
+
+
+def terms(text: str) -> list[str]:
+    """공백을 제거한 문자 2-gram과 두 글자 이상 어절 (형태소 분석기 없이 한국어 기사를 비교)"""
+    text = text.lower()
+    compact = re.sub(r"\s+", "", text)
+    return [compact[i : i + 2] for i in range(len(compact) - 1)] + re.findall(r"\w{2,}", text)
+
+
+def normalize(vector: SparseVector) -> SparseVector:
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return vector
+    return {key: weight / norm for key, weight in vector.items()}
+
+
+def tfidf_vectors(texts: list[str]) -> list[SparseVector]:
+    """문서 집합 안에서 계산한 L2 정규화 TF-IDF 벡터 (sublinear tf, smooth idf)"""
+    counts = [Counter(terms(text)) for text in texts]
+    document_frequency = Counter(term for count in counts for term in count)
+    total = len(texts)
+    return [
+        normalize(
+            {
+                term: (1 + math.log(tf))
+                * (math.log((1 + total) / (1 + document_frequency[term])) + 1)
+                for term, tf in count.items()
+            }
+        )
+        for count in counts
+    ]
+
+
+def dense_vector(embedding: Iterable[float]) -> SparseVector:
+    """임베딩을 같은 유사도 계산에 쓸 수 있도록 정규화된 희소 벡터로 변환"""
+    return normalize({i: weight for i, weight in enumerate(embedding) if weight})
+
+
+def dot(a: SparseVector, b: SparseVector) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(key, 0.0) for key, weight in a.items())
+
+
+class IncrementalClusterer:
+    """
+    증분 병합 군집화 (중심 연결, centroid linkage)
+    문서를 하나씩 넣으면서 가장 가까운 군집 중심과의 코사인 유사도가 threshold 이상이면 합치고,
+    아니면 새 군집을 만듭니다. 군집 중심은 구성원 벡터의 합으로 유지하고,
+    특징 -> 군집 역색인으로 후보 군집만 비교합니다.
+    중심은 구성원이 늘수록 흔한 특징 쪽으로 넓어지므로, 군집의 첫 문서(대표 기사)와의 유사도도
+    threshold 이상이어야 합칩니다. (다른 주제가 중간 문서를 거쳐 사슬처럼 이어 붙는 것을 방지)
+    """
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self.clusters: list[list[int]] = []
+        self._sums: list[SparseVector] = []
+        self._norms: list[float] = []
+        self._leads: list[SparseVector] = []
+        self._postings: dict[Hashable, set[int]] = {}
+
+    def candidates(self, vector: SparseVector) -> set[int]:
+        top_terms = heapq.nlargest(CANDIDATE_TERMS, vector, key=vector.get)
+        return {
+            cluster for term in top_terms for cluster in self._postings.get(term, ())
+        }
+
+    def add(self, item: int, vector: SparseVector) -> int:
+        """문서를 추가하고 속한 군집 번호를 반환합니다."""
+        best, best_similarity = None, self.threshold
+        for cluster in self.candidates(vector):
+            similarity = dot(vector, self._sums[cluster]) / self._norms[cluster]
+            if similarity >= best_similarity and dot(vector, self._leads[cluster]) >= self.threshold:
+                best, best_similarity = cluster, similarity
+
+        if best is None:
+            best = len(self.clusters)
+            self.clusters.append([])
+            self._sums.append({})
+            self._norms.append(0.0)
+            self._leads.append(vector)
+
+        self.clusters[best].append(item)
+        total = self._sums[best]
+        for term, weight in vector.items():
+            total[term] = total.get(term, 0.0) + weight
+            self._postings.setdefault(term, set()).add(best)
+        self._norms[best] = math.sqrt(sum(weight * weight for weight in total.values()))
+        return best
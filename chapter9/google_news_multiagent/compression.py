@@ -0,0 +1,163 @@
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Optional
+
+from config import Config
+from dedup import normalize_title
+
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?。])\s+|(?<=다\.)|\n+")
+# "(서울=연합뉴스) 홍길동 기자 =" 같은 발신지/기자명 머리말 (문장은 남기고 머리말만 제거)
+BYLINE_PATTERN = re.compile(
+    r"^\s*(?:[(\[][^)\]]*=[^)\]]*[)\]]\s*)?(?:[\w·\s]{1,20}?(?:기자|특파원)\s*=\s*)?"
+)
+NOISE_PATTERN = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.]+|ⓒ|©|무단\s*전재|재배포|저작권|▶|사진\s*=|\[사진|"
+    r"제공\s*[=\]]|\w+\s*(?:기자|특파원)\s*$"
+)
+NUMBER_PATTERN = re.compile(r"\d")
+
+POSITION_WEIGHT = 1.0
+TITLE_WEIGHT = 2.0
+CENTRALITY_WEIGHT = 1.0
+NUMBER_BONUS = 0.3
+MIN_SENTENCE_CHARS = 10
+MAX_REDUNDANCY = 0.7
+
+
+@lru_cache(maxsize=1)
+def get_encoding():
+    """모델 토크나이저 (tiktoken이 없거나 인코딩 파일을 받을 수 없으면 None)"""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(Config.MODEL_NAME)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """토큰 수 (토크나이저가 없으면 한국어 기준 2자당 1토큰으로 추정)"""
+    encoding = get_encoding()
+    if encoding is None:
+        return (len(text) + 1) // 2
+    return len(encoding.encode(text))
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """앞에서부터 budget 토큰까지만 남깁니다."""
+    encoding = get_encoding()
+    if encoding is None:
+        return text[: budget * 2]
+    return encoding.decode(encoding.encode(text)[:budget])
+
+
+def split_sentences(text: str) -> list[str]:
+    """한국어 기사 본문을 문장 단위로 나눕니다. (줄바꿈과 '다.', 문장 부호 기준)"""
+    return [sentence.strip() for sentence in SENTENCE_PATTERN.split(text) if sentence.strip()]
+
+
+def clean_sentences(text: str) -> list[str]:
+    """머리말을 지우고, 너무 짧거나 잡음인 문장과 반복된 문장을 제외합니다."""
+    sentences, seen = [], set()
+    for sentence in split_sentences(text):
+        sentence = BYLINE_PATTERN.sub("", sentence, count=1)
+        if len(sentence) < MIN_SENTENCE_CHARS or NOISE_PATTERN.search(sentence):
+            continue
+        if sentence not in seen:
+            seen.add(sentence)
+            sentences.append(sentence)
+    return sentences
+
+
+def bigrams(text: str) -> set[str]:
+    """공백을 제거한 문자 2-gram (조사가 붙어도 같은 낱말이 겹치도록)"""
+    compact = re.sub(r"\W+", "", text)
+    return {compact[i : i + 2] for i in range(len(compact) - 1)}
+
+
+def score_sentences(title: str, sentences: list[str]) -> list[float]:
+    """
+    문장별 중요도 점수
+    - 위치: 앞 문장일수록 높음 (역피라미드 구조)
+    - 제목 키워드: 제목 2-gram과 겹치는 비율
+    - 중심성: 본문 전체에서 자주 나오는 2-gram을 많이 포함할수록 높음
+    - 숫자나 날짜가 있으면 가산점
+    """
+    title_grams = bigrams(title)
+    sentence_grams = [bigrams(sentence) for sentence in sentences]
+    document_frequency = Counter(gram for grams in sentence_grams for gram in grams)
+
+    centrality = [
+        sum(document_frequency[gram] for gram in grams) / len(grams) if grams else 0.0
+        for grams in sentence_grams
+    ]
+    max_centrality = max(centrality, default=0.0) or 1.0
+
+    scores = []
+    for i, (sentence, grams) in enumerate(zip(sentences, sentence_grams)):
+        title_overlap = len(grams & title_grams) / len(title_grams) if title_grams else 0.0
+        score = (
+            POSITION_WEIGHT / math.sqrt(i + 1)
+            + TITLE_WEIGHT * title_overlap
+            + CENTRALITY_WEIGHT * centrality[i] / max_centrality
+        )
+        if NUMBER_PATTERN.search(sentence):
+            score += NUMBER_BONUS
+        scores.append(score)
+    return scores
+
+
+def compress_article(title: str, content: str, budget: Optional[int] = None) -> str:
+    """
+    토큰 예산 안에서 가장 정보가 많은 문장을 골라 원래 순서대로 이어 붙입니다.
+    기자명/이메일/사진 설명/저작권 문구와 이미 고른 문장과 거의 같은 문장은 제외합니다.
+    """
+    budget = budget or Config.SUMMARY_INPUT_TOKENS
+    if count_tokens(content) <= budget:
+        return content
+
+    sentences = clean_sentences(content)
+    scores = score_sentences(title, sentences)
+    sentence_grams = [bigrams(sentence) for sentence in sentences]
+
+    selected, used = [], 0
+    for i in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+        tokens = count_tokens(sentences[i])
+        if used + tokens > budget:
+            continue
+        if any(
+            len(sentence_grams[i] & sentence_grams[j])
+            > MAX_REDUNDANCY * min(len(sentence_grams[i]), len(sentence_grams[j]))
+            for j in selected
+        ):
+            continue
+        selected.append(i)
+        used += tokens
+
+    if not selected:
+        return truncate_tokens(sentences[0] if sentences else content, budget)
+    return " ".join(sentences[i] for i in sorted(selected))
+
+
+def prepare_content(title: str, content: str, budget: Optional[int] = None) -> str:
+    """LLM 프롬프트에 넣을 본문 (압축을 끄면 기존처럼 앞부분만 자름)"""
+    if Config.COMPRESSION_ENABLED:
+        return compress_article(title, content, budget)
+    return content[: budget * 2 if budget else Config.SUMMARY_CONTENT_CHARS]
+
+
+def prepare_sources(sources: list[tuple[str, str, str]]) -> str:
+    """
+    같은 사건을 다룬 여러 기사((언론사, 제목, 본문))를 하나의 프롬프트 본문으로 만듭니다.
+    기사마다 CLUSTER_SOURCE_TOKENS 예산으로 압축합니다.
+    """
+    return "\n\n".join(
+        f"[{i}] {source}: {normalize_title(title, source)}\n"
+        f"{prepare_content(title, content, Config.CLUSTER_SOURCE_TOKENS)}"
+        for i, (source, title, content) in enumerate(sources[: Config.CLUSTER_MAX_SOURCES], 1)
+    )
@@ -1,16 +1,81 @@
 import os
+from typing import Optional
 
 class Config:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     MODEL_NAME: str = "gpt-5-mini"
     MAX_TOKENS: int = 300
 
+    # 모델 라우팅: 짧은 기사 요약과 모든 분류는 fast, 길거나 여러 출처를 종합하는 요약만 strong
+    ROUTING_ENABLED: bool = True
+    FAST_MODEL_NAME: str = "gpt-5-nano"
+    FAST_REASONING_EFFORT: str = "minimal"
+    STRONG_MODEL_NAME: str = MODEL_NAME
+    STRONG_REASONING_EFFORT: Optional[str] = None
+    # 원문(같은 사건 기사 합산)이 이 글자 수 이상이거나 출처가 이 수 이상이면 strong
+    ROUTING_LONG_ARTICLE_CHARS: int = 2000
+    ROUTING_STRONG_SOURCES: int = 3
+
     ROOT_DIR: str = os.path.dirname(os.path.abspath(__file__))
 
     RSS_URL: str = "https://news.google.com/rss?hl=ko&gl=KR&ceid=KR:ko"
+    RSS_TOPICS: list[str] = [
+        "NATION",
+        "WORLD",
+        "BUSINESS",
+        "TECHNOLOGY",
+        "ENTERTAINMENT",
+        "SPORTS",
+        "SCIENCE",
+        "HEALTH",
+    ]
+    RSS_URLS: list[str] = [RSS_URL] + [
+        f"https://news.google.com/rss/headlines/section/topic/{topic}?hl=ko&gl=KR&ceid=KR:ko"
+        for topic in RSS_TOPICS
+    ]
     MAX_NEWS_COUNT: int = 60
     BATCH_SIZE: int = 10
 
+    HTTP_TIMEOUT: float = 10.0
+    HTTP2: bool = True
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+
+    FETCH_MAX_CONCURRENCY: int = 32
+    FETCH_HOST_RATE: float = 20.0
+    FETCH_HOST_BURST: int = 20
+    FETCH_MIN_HOST_RATE: float = 0.5
+    FETCH_MAX_RETRIES: int = 3
+    FETCH_BACKOFF_BASE: float = 0.5
+    FETCH_BACKOFF_MAX: float = 30.0
+
+    EXTRACT_WORKERS: int = os.cpu_count() or 1
+    # 리디렉션 페이지 data-p 파서: scan(속성만 탐색) | lxml | selectolax | bs4
+    REDIRECT_PARSER: str = "scan"
+    MAX_ARTICLE_BYTES: int = 2 * 1024 * 1024
+    ARTICLE_CONTENT_TYPES: tuple[str, ...] = ("text/html", "application/xhtml+xml")
+
+    STREAMING: bool = False
+    STREAM_QUEUE_SIZE: int = 100
+
+    DEDUP_ENABLED: bool = True
+    DEDUP_SIMILARITY: float = 0.9
+    DEDUP_CONTENT_CHARS: int = 1000
+
+    # 같은 사건을 다룬 기사를 묶어 군집마다 한 번만 요약 (스트리밍 모드 제외)
+    CLUSTER_ENABLED: bool = True
+    CLUSTER_SIMILARITY: float = 0.3
+    CLUSTER_CONTENT_CHARS: int = 500
+    # True면 로컬 TF-IDF 대신 OpenAI 임베딩 사용 (호출 실패 시 TF-IDF로 대체)
+    CLUSTER_EMBEDDINGS: bool = False
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    CLUSTER_EMBEDDING_SIMILARITY: float = 0.8
+    # 군집 요약 프롬프트에 넣을 최대 기사 수와 기사당 토큰 예산
+    CLUSTER_MAX_SOURCES: int = 5
+    CLUSTER_SOURCE_TOKENS: int = 150
+
     NEWS_CATEGORIES: list[str] = [
         "정치",
         "경제",
@@ -24,7 +89,67 @@ class Config:
     ]
     NEWS_PER_CATEGORY: int = 30
 
+    # 요약 프롬프트에 넣을 본문: 토큰 예산 안에서 중요한 문장을 골라 압축
+    COMPRESSION_ENABLED: bool = True
+    SUMMARY_INPUT_TOKENS: int = 300
+    SUMMARY_CONTENT_CHARS: int = 500
+
+    # True면 요약과 분류를 한 번의 구조화 출력 호출로 처리 (스트리밍 모드 제외)
+    FUSED_ANALYSIS: bool = False
+
+    BATCHED_CLASSIFICATION: bool = True
+    CLASSIFY_BATCH_SIZE: int = 10
+
+    LLM_MAX_CONCURRENCY: int = BATCH_SIZE
+    LLM_REQUESTS_PER_MINUTE: int = 500
+    LLM_TOKENS_PER_MINUTE: int = 200_000
+    LLM_MAX_RETRIES: int = 5
+    LLM_BACKOFF_BASE: float = 1.0
+    LLM_BACKOFF_MAX: float = 60.0
+
+    LOCAL_CLASSIFIER_ENABLED: bool = True
+    LOCAL_CLASSIFIER_THRESHOLD: float = 0.9
+    LOCAL_CLASSIFIER_MIN_EXAMPLES: int = 100
+    LOCAL_CLASSIFIER_AUDIT_RATE: float = 0.1
+
     OUTPUT_DIR: str = f"{ROOT_DIR}/outputs"
+    # 보고서 옆에 계측 결과(.metrics.json)와 함께 Prometheus 텍스트(.prom)도 저장
+    METRICS_PROMETHEUS: bool = False
+
+    CACHE_DIR: str = f"{ROOT_DIR}/.cache"
+    CACHE_DB_PATH: str = f"{CACHE_DIR}/cache.sqlite3"
+    URL_CACHE_TTL: float = 30 * 24 * 60 * 60
+    URL_CACHE_MAX_ENTRIES: int = 50_000
+    LLM_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_TTL: float = 7 * 24 * 60 * 60
+    SUMMARY_CACHE_MAX_ENTRIES: int = 20_000
+    CATEGORY_CACHE_TTL: float = 7 * 24 * 60 * 60
+    CATEGORY_CACHE_MAX_ENTRIES: int = 20_000
+
+    # 일괄 작업 모드 (main.py --batch): 요약/분류 요청을 JSONL 작업 파일로 만들어 Batch API로 처리
+    BATCH_MODE: bool = False
+    BATCH_API_BASE: str = "https://api.openai.com/v1"
+    BATCH_JOB_DIR: str = f"{CACHE_DIR}/batch_jobs"
+    BATCH_COMPLETION_WINDOW: str = "24h"
+    BATCH_POLL_INTERVAL: float = 60.0
+    # 실패한 줄만 다시 제출하는 최대 횟수 (첫 제출 포함)
+    BATCH_MAX_ATTEMPTS: int = 3
+
+    INCREMENTAL: bool = False
+    LEDGER_DB_PATH: str = f"{CACHE_DIR}/ledger.sqlite3"
+    LEDGER_RETENTION: float = 7 * 24 * 60 * 60
+
+    # 상주 모드 (main.py --serve)
+    SERVE_INTERVAL: float = 10 * 60
+    SERVE_HOST: str = "127.0.0.1"
+    SERVE_PORT: int = 8765
+
+    # 단계별 상태 저장 (중단된 실행은 main.py --resume <run_id>로 이어서 실행)
+    CHECKPOINT_ENABLED: bool = True
+    CHECKPOINT_DB_PATH: str = f"{CACHE_DIR}/checkpoints.sqlite3"
+    CHECKPOINT_RETENTION: float = 7 * 24 * 60 * 60
+    CHECKPOINT_MAX_CONTENTS: int = 50_000
+    CHECKPOINT_CONTENT_MIN_CHARS: int = 200
 
     @classmethod
     def validate(cls) -> bool:
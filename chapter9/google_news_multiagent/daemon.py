@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+from config import Config
+from metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+# 실행 ID를 받아 워크플로를 한 번 실행하고 (최종 상태, 보고서 경로)를 돌려주는 함수
+RunFunction = Callable[[str], Awaitable[tuple[dict[str, Any], Optional[str]]]]
+
+
+class NewsDaemon:
+    """
+    컴파일된 워크플로, LLM 클라이언트, HTTP 연결 풀을 유지한 채 주기적으로 실행하는 상주 모드
+    - 이전 실행이 끝나지 않았으면 이번 주기는 건너뜁니다.
+    - /health, /metrics 로컬 HTTP 엔드포인트로 상태를 확인할 수 있습니다.
+    """
+
+    def __init__(self, run: RunFunction, metrics: MetricsCollector, interval: float = None):
+        self.run = run
+        self.metrics = metrics
+        self.interval = interval or Config.SERVE_INTERVAL
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+        self.last_prometheus = ""
+        self.status: dict[str, Any] = {
+            "started_at": time.time(),
+            "running": False,
+            "runs": 0,
+            "failures": 0,
+            "skipped": 0,
+            "last_run_id": None,
+            "last_finished_at": None,
+            "last_success_at": None,
+            "last_duration": None,
+            "last_report": None,
+            "last_error": None,
+        }
+
+    async def run_once(self) -> None:
+        """워크플로를 한 번 실행합니다. 이미 실행 중이면 건너뜁니다."""
+        if self._lock.locked():
+            self.status["skipped"] += 1
+            print("이전 실행이 아직 진행 중이라 이번 주기는 건너뜁니다.")
+            return
+
+        async with self._lock:
+            run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.status.update(running=True, last_run_id=run_id)
+            self.metrics.reset()
+            start = time.monotonic()
+            try:
+                final_state, report = await self.run(run_id)
+                self.last_prometheus = self.metrics.to_prometheus(final_state.get("metrics"))
+                self.status.update(
+                    last_success_at=time.time(), last_report=report, last_error=None
+                )
+            except Exception as e:
+                logger.exception("주기 실행 중 오류 발생")
+                self.status["failures"] += 1
+                self.status["last_error"] = str(e)[:200]
+            finally:
+                self.status["runs"] += 1
+                self.status.update(
+                    running=False,
+                    last_finished_at=time.time(),
+                    last_duration=time.monotonic() - start,
+                )
+
+    def daemon_prometheus(self) -> str:
+        """상주 모드 자체의 실행/건너뜀/실패 횟수"""
+        lines = []
+        for key in ("runs", "failures", "skipped"):
+            lines.append(f"# TYPE news_daemon_{key}_total counter")
+            lines.append(f"news_daemon_{key}_total {self.status[key]}")
+        lines.append("# TYPE news_daemon_running gauge")
+        lines.append(f"news_daemon_running {int(self.status['running'])}")
+        return "\n".join(lines) + "\n"
+
+    async def handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """GET /health(JSON), GET /metrics(Prometheus 텍스트)만 처리하는 최소 HTTP 핸들러"""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            path = request_line[1] if len(request_line) > 1 else ""
+            if path == "/health":
+                healthy = self.status["last_error"] is None
+                code, content_type = (200 if healthy else 503), "application/json"
+                body = json.dumps({"status": "ok" if healthy else "error", **self.status})
+            elif path == "/metrics":
+                code, content_type = 200, "text/plain; version=0.0.4"
+                body = self.last_prometheus + self.daemon_prometheus()
+            else:
+                code, content_type, body = 404, "text/plain", "not found"
+
+            payload = body.encode("utf-8")
+            reason = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}[code]
+            writer.write(
+                f"HTTP/1.1 {code} {reason}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+                + payload
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        """interval초마다 실행을 시작하고, 상태 엔드포인트를 엽니다."""
+        server = await asyncio.start_server(
+            self.handle_request, Config.SERVE_HOST, Config.SERVE_PORT
+        )
+        print(
+            f"상주 모드 시작: {self.interval:.0f}초 주기, "
+            f"상태 확인 http://{Config.SERVE_HOST}:{Config.SERVE_PORT}/health"
+        )
+        async with server:
+            while True:
+                # 실행 시간과 관계없이 일정한 주기로 시작 (겹치는 실행은 run_once에서 건너뜀)
+                task = asyncio.create_task(self.run_once())
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                await asyncio.sleep(self.interval)
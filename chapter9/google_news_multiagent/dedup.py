@@ -0,0 +1,115 @@
+import hashlib
+import re
+from collections import defaultdict
+from typing import Any, Optional
+
+from articles import Article
+
+SIMHASH_BITS = 64
+# 지문에서 제목이 차지하는 비중 - 본문 길이와 관계없이 제목과 본문 특징의 가중치 합을 이 비율로 나눔
+# (같은 머리말로 시작하는 다른 기사가 본문만으로 중복 판정되지 않도록)
+TITLE_WEIGHT = 0.5
+
+
+def normalize_title(title: str, source: str = "") -> str:
+    """Google News 제목 끝의 ' - 언론사' 표기를 제거합니다."""
+    if source and title.endswith(f" - {source}"):
+        return title[: -len(source) - 3]
+    return title.rsplit(" - ", 1)[0] if " - " in title else title
+
+
+def shingles(text: str, size: int = 3) -> list[str]:
+    """공백을 정리한 문자 n-gram (한국어는 어절보다 문자 단위가 안정적)"""
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) <= size:
+        return [text] if text else []
+    return [text[i : i + size] for i in range(len(text) - size + 1)]
+
+
+def simhash(features: dict[str, float]) -> int:
+    """특징 -> 가중치로 계산한 64비트 SimHash"""
+    weights = [0.0] * SIMHASH_BITS
+    for feature, weight in features.items():
+        value = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+
+
+def weighted_shingles(text: str, total: float, prefix: str) -> dict[str, float]:
+    """문자 n-gram마다 total을 나눠 준 가중치 (prefix로 제목/본문 특징을 구분)"""
+    grams = shingles(text)
+    features: dict[str, float] = defaultdict(float)
+    for gram in grams:
+        features[prefix + gram] += total / len(grams)
+    return features
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateDetector:
+    """
+    SimHash로 유사 기사를 묶는 탐지기
+    허용 거리 k에 대해 해시를 k+1개 구간으로 나누면 중복 후보는 적어도 한 구간이 일치하므로(비둘기집 원리)
+    구간 인덱스로 후보만 비교합니다.
+    """
+
+    def __init__(self, similarity: float, content_chars: int = 1000):
+        self.max_distance = int(SIMHASH_BITS * (1 - similarity))
+        self.content_chars = content_chars
+        self._bands = self.max_distance + 1
+        self._band_bits = -(-SIMHASH_BITS // self._bands)
+        self._index: list[dict[int, list[int]]] = [{} for _ in range(self._bands)]
+        self._hashes: list[int] = []
+        self._items: list[Article] = []
+
+    def fingerprint(self, news: Article) -> int:
+        """제목과 본문 앞부분을 따로 가중해 합친 SimHash (본문이 없으면 제목만)"""
+        title = weighted_shingles(normalize_title(news.title, news.source), TITLE_WEIGHT, "t:")
+        content = weighted_shingles(news.content[: self.content_chars], 1 - TITLE_WEIGHT, "c:")
+        return simhash({**title, **content})
+
+    def _band_keys(self, value: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [value >> (i * self._band_bits) & mask for i in range(self._bands)]
+
+    def add(self, news: Article) -> Optional[Article]:
+        """
+        기사를 추가합니다. 이미 본 기사와 유사하면 대표 기사를 반환하고,
+        새 기사면 대표 기사로 등록한 뒤 None을 반환합니다.
+        """
+        value = self.fingerprint(news)
+        keys = self._band_keys(value)
+
+        candidates = {i for band, key in enumerate(keys) for i in self._index[band].get(key, [])}
+        for i in sorted(candidates):
+            if hamming_distance(value, self._hashes[i]) <= self.max_distance:
+                return self._items[i]
+
+        position = len(self._items)
+        self._hashes.append(value)
+        self._items.append(news)
+        for band, key in enumerate(keys):
+            self._index[band].setdefault(key, []).append(position)
+        return None
+
+
+def alternate_source(news: Article) -> dict[str, Any]:
+    """대표 기사에 붙일 다른 출처 정보"""
+    return {
+        "title": news.title,
+        "source": news.source,
+        "original_url": news.original_url,
+        "published_kst": news.published_kst,
+        "entry_id": news.entry_id,
+        "fingerprint": news.fingerprint,
+    }
+
+
+def attach_duplicate(representative: Article, duplicate: Article) -> None:
+    """중복 기사를 대표 기사의 다른 출처로 붙입니다."""
+    representative.alternate_sources.append(alternate_source(duplicate))
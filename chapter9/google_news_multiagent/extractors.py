@@ -0,0 +1,147 @@
+import json
+import logging
+import re
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+import trafilatura
+
+logger = logging.getLogger(__name__)
+
+FUSION_PATTERN = re.compile(r"Fusion\.globalContent\s*=\s*")
+JSON_LD_PATTERN = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+JSON_DECODER = json.JSONDecoder()
+
+
+class FastExtractor:
+    """
+    trafilatura 전체 파이프라인을 거치지 않는 빠른 본문 추출기
+    marker는 본문 데이터가 들어 있는 위치를 나타내며, 스트리밍 다운로드의 조기 종료에도 쓰입니다.
+    """
+
+    def __init__(self, name: str, extract: Callable[[str], str], marker: str):
+        self.name = name
+        self.extract = extract
+        self.marker = marker
+
+
+EXTRACTORS: dict[str, FastExtractor] = {}
+GENERIC_EXTRACTORS: list[FastExtractor] = []
+
+
+def register_extractor(
+    domains: list[str], marker: str
+) -> Callable[[Callable[[str], str]], Callable[[str], str]]:
+    """
+    도메인별 빠른 추출기를 등록하는 데코레이터
+    domains가 비어 있으면 모든 사이트에 먼저 시도하는 범용 추출기로 등록합니다.
+    """
+
+    def decorator(func: Callable[[str], str]) -> Callable[[str], str]:
+        extractor = FastExtractor(func.__name__, func, marker)
+        if domains:
+            for domain in domains:
+                EXTRACTORS[domain] = extractor
+        else:
+            GENERIC_EXTRACTORS.append(extractor)
+        return func
+
+    return decorator
+
+
+def find_extractor(url: str) -> Optional[FastExtractor]:
+    """URL 호스트와 상위 도메인 순으로 등록된 추출기를 찾습니다."""
+    host = urlsplit(url).hostname or ""
+    parts = host.split(".")
+    for i in range(len(parts) - 1):
+        if extractor := EXTRACTORS.get(".".join(parts[i:])):
+            return extractor
+    return None
+
+
+@register_extractor(["chosun.com"], marker="Fusion.globalContent")
+def extract_chosun_content(html_content: str) -> str:
+    """조선일보(Arc Fusion) 기사 내용을 특별 처리합니다."""
+    match = FUSION_PATTERN.search(html_content)
+    if not match:
+        return ""
+
+    try:
+        content_data, _ = JSON_DECODER.raw_decode(html_content, match.end())
+    except json.JSONDecodeError:
+        return ""
+    if not isinstance(content_data, dict):
+        return ""
+
+    texts = [
+        element["content"]
+        for element in content_data.get("content_elements", [])
+        if element.get("type") == "text" and "content" in element
+    ]
+    return "\n\n".join(texts)
+
+
+def _find_article_body(data: Any) -> str:
+    """JSON-LD 객체(@graph, 배열 포함)에서 articleBody를 찾습니다."""
+    if isinstance(data, list):
+        for item in data:
+            if body := _find_article_body(item):
+                return body
+    elif isinstance(data, dict):
+        if isinstance(data.get("articleBody"), str):
+            return data["articleBody"]
+        if "@graph" in data:
+            return _find_article_body(data["@graph"])
+    return ""
+
+
+@register_extractor([], marker="articleBody")
+def extract_json_ld_body(html_content: str) -> str:
+    """JSON-LD(NewsArticle)의 articleBody를 본문으로 사용합니다."""
+    if "articleBody" not in html_content:
+        return ""
+
+    for match in JSON_LD_PATTERN.finditer(html_content):
+        if "articleBody" not in match.group(1):
+            continue
+        try:
+            body = _find_article_body(json.loads(match.group(1)))
+        except json.JSONDecodeError:
+            continue
+        if body:
+            return body.strip()
+    return ""
+
+
+def extract_with_trafilatura(html_content: str) -> str:
+    """빠른 경로가 없을 때 쓰는 trafilatura 범용 추출"""
+    content = trafilatura.extract(
+        html_content,
+        include_comments=False,
+        include_images=False,
+        include_links=False,
+        target_language="ko",
+    )
+    return content or ""
+
+
+def extract_content(html_content: str, url: str) -> str:
+    """
+    기사 HTML에서 본문을 추출합니다.
+    도메인 전용 추출기 -> 범용 임베디드 JSON 추출기 -> trafilatura 순으로 시도합니다.
+    빠른 추출기가 예상과 다른 페이지 구조로 실패하면 다음 단계로 넘어갑니다.
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 유지합니다.
+    """
+    site_extractor = find_extractor(url)
+    for extractor in ([site_extractor] if site_extractor else []) + GENERIC_EXTRACTORS:
+        try:
+            content = extractor.extract(html_content)
+        except Exception as e:
+            logger.debug("빠른 추출기 %s 실패 (%s): %s", extractor.name, url, e)
+            continue
+        if content:
+            return content
+    return extract_with_trafilatura(html_content)
@@ -0,0 +1,180 @@
+import asyncio
+import random
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+
+from config import Config
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """호스트별 요청 속도를 제한하는 토큰 버킷 (rate: 초당 토큰 수)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """토큰 하나를 얻을 때까지 기다립니다."""
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self.blocked_until - time.monotonic()
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep(max(wait, (1 - self.tokens) / self.rate))
+
+    def slow_down(self, retry_after: Optional[float] = None) -> None:
+        """429/5xx 응답 시 속도를 절반으로 줄이고 Retry-After 동안 요청을 멈춥니다."""
+        self.rate = max(self.rate / 2, Config.FETCH_MIN_HOST_RATE)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def speed_up(self) -> None:
+        """성공 응답마다 설정된 속도까지 조금씩 회복합니다."""
+        self.rate = min(self.rate + self.max_rate * 0.1, self.max_rate)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초 단위)를 읽습니다."""
+    try:
+        return float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
+
+class FetchScheduler:
+    """
+    전역 동시성 제한, 호스트별 동시 연결 제한과 토큰 버킷, 429/5xx 적응형 백오프를 적용하는 요청 스케줄러
+    호스트 슬롯을 먼저 얻은 뒤 전역 슬롯을 얻으므로, 느린 호스트에 밀린 요청이 전역 슬롯을 붙잡고
+    다른 호스트의 요청을 막지 않습니다.
+    """
+
+    def __init__(self):
+        self._slots = asyncio.Semaphore(Config.FETCH_MAX_CONCURRENCY)
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """호스트별 집계를 초기화합니다. (호스트별 적응 속도는 실행 간에도 유지)"""
+        self._counters: dict[str, dict[str, float]] = defaultdict(
+            lambda: {
+                "requests": 0,
+                "success": 0,
+                "client_errors": 0,
+                "failures": 0,
+                "retries": 0,
+                "throttled": 0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+            }
+        )
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(
+                Config.FETCH_HOST_RATE, Config.FETCH_HOST_BURST
+            )
+        return self._buckets[host]
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        """호스트별 동시 연결 수를 제한하는 세마포어"""
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(Config.HTTP_MAX_CONNECTIONS_PER_HOST)
+        return self._host_slots[host]
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """지수 백오프 + 지터"""
+        delay = min(Config.FETCH_BACKOFF_BASE * 2**attempt, Config.FETCH_BACKOFF_MAX)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def run(
+        self,
+        host: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        consume: Optional[Callable[[httpx.Response], Awaitable[Any]]] = None,
+    ) -> Any:
+        """
+        요청을 스케줄링해 실행합니다.
+        429/5xx와 네트워크 오류는 재시도하고, 재시도가 모두 실패하면 마지막 응답을 반환하거나 예외를 올립니다.
+        consume을 주면 최종 응답을 슬롯을 쥔 채로 넘겨 그 결과를 반환하므로,
+        스트리밍 응답의 본문을 읽는 동안에도 호스트별/전역 동시 연결 제한이 유지됩니다.
+        """
+        bucket = self._bucket(host)
+        counters = self._counters[host]
+
+        for attempt in range(Config.FETCH_MAX_RETRIES + 1):
+            await bucket.acquire()
+            counters["requests"] += 1
+            if attempt:
+                counters["retries"] += 1
+
+            retry_after = None
+            async with self._host_slot(host), self._slots:
+                start = time.perf_counter()
+                try:
+                    response = await send()
+                except httpx.TransportError:
+                    counters["failures"] += 1
+                    if attempt == Config.FETCH_MAX_RETRIES:
+                        raise
+                    response = None
+                finally:
+                    latency = time.perf_counter() - start
+                    counters["latency_total"] += latency
+                    counters["latency_max"] = max(counters["latency_max"], latency)
+
+                if response is not None and response.status_code in RETRY_STATUS:
+                    counters["throttled"] += 1
+                    retry_after = parse_retry_after(response)
+                    bucket.slow_down(retry_after)
+                    if attempt == Config.FETCH_MAX_RETRIES:
+                        counters["failures"] += 1
+                        return await consume(response) if consume else response
+                    await response.aclose()
+                elif response is not None:
+                    # 4xx는 호스트가 정상 응답한 것이지만 성공은 아니므로 속도를 올리지 않음
+                    if response.status_code >= 400:
+                        counters["client_errors"] += 1
+                    else:
+                        counters["success"] += 1
+                        bucket.speed_up()
+                    return await consume(response) if consume else response
+
+            # 재시도 대기 중에는 슬롯을 놓아 다른 요청이 쓰도록 함
+            await asyncio.sleep(retry_after or self._backoff(attempt))
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """호스트별 성공/실패 횟수와 지연 시간 통계"""
+        result = {}
+        for host, counters in self._counters.items():
+            requests = counters["requests"]
+            result[host] = {
+                "requests": requests,
+                "success": counters["success"],
+                "client_errors": counters["client_errors"],
+                "failures": counters["failures"],
+                "retries": counters["retries"],
+                "throttled": counters["throttled"],
+                "avg_latency": counters["latency_total"] / requests if requests else 0.0,
+                "max_latency": counters["latency_max"],
+                "rate": self._buckets[host].rate,
+            }
+        return result
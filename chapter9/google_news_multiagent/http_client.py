@@ -0,0 +1,153 @@
+import importlib.util
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config import Config
+from fetch_scheduler import FetchScheduler
+
+DEFAULT_HEADERS = {
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)AppleWebKit/537.36",
+}
+
+
+class PooledHttpClient:
+    """수집기 수명 동안 연결을 재사용하는 공유 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        scheduler: Optional[FetchScheduler] = None,
+    ):
+        limits = httpx.Limits(
+            max_connections=Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY,
+        )
+        # h2 패키지가 없으면 HTTP/1.1 keep-alive로 동작
+        http2 = Config.HTTP2 and importlib.util.find_spec("h2") is not None
+
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            limits=limits,
+            timeout=Config.HTTP_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            transport=transport,
+        )
+        self.scheduler = scheduler or FetchScheduler()
+        self.http2 = http2
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """연결 풀과 요청 스케줄러의 실행별 통계를 초기화합니다. (연결은 그대로 재사용)"""
+        self._stats = {
+            "requests": 0,
+            "new_connections": 0,
+            "tls_handshakes": 0,
+            "http2": self.http2,
+            "bytes_read": 0,
+            "early_stops": 0,
+            "truncated": 0,
+            "rejected": 0,
+        }
+        self.scheduler.reset_stats()
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """httpcore 트레이스 이벤트로 새 연결과 TLS 핸드셰이크를 집계"""
+        if event_name == "connection.connect_tcp.complete":
+            self._stats["new_connections"] += 1
+        elif event_name == "connection.start_tls.complete":
+            self._stats["tls_handshakes"] += 1
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        stream: bool = False,
+        consume: Optional[Callable[[httpx.Response], Awaitable[Any]]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        스케줄러(호스트별/전역 동시성 제한, 속도 제한, 재시도) 안에서 요청을 보냅니다.
+        stream=True이면 본문을 읽지 않은 응답을 반환하며, 호출자가 닫아야 합니다.
+        consume을 주면 동시성 슬롯을 쥔 채로 응답을 넘기고 그 결과를 반환합니다. (스트리밍 본문 읽기용)
+        """
+        extensions = kwargs.pop("extensions", {})
+        extensions["trace"] = self._trace
+        host = urlsplit(url).hostname or ""
+
+        async def send() -> httpx.Response:
+            self._stats["requests"] += 1
+            request = self.client.build_request(method, url, extensions=extensions, **kwargs)
+            return await self.client.send(request, stream=stream)
+
+        return await self.scheduler.run(host, send, consume)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def fetch_html(
+        self,
+        url: str,
+        max_bytes: int,
+        content_types: tuple[str, ...],
+        stop_marker: Optional[str] = None,
+    ) -> str:
+        """
+        HTML 문서를 스트리밍으로 내려받습니다.
+        - 허용되지 않은 Content-Type은 본문을 읽기 전에 거부합니다.
+        - max_bytes를 넘으면 그때까지 받은 내용만 사용합니다.
+        - stop_marker가 나타난 뒤 해당 <script>가 닫히면 나머지는 받지 않습니다.
+        """
+
+        async def read(response: httpx.Response) -> str:
+            try:
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "").split(";")[0].strip()
+                if content_type and content_type not in content_types:
+                    self._stats["rejected"] += 1
+                    raise ValueError(f"HTML이 아닌 응답입니다: {content_type}")
+
+                marker = stop_marker.encode() if stop_marker else None
+                marker_at = -1
+                buffer = bytearray()
+
+                async for chunk in response.aiter_bytes():
+                    search_from = max(len(buffer) - len(marker or b""), 0)
+                    buffer.extend(chunk)
+
+                    if marker:
+                        if marker_at < 0:
+                            marker_at = buffer.find(marker, search_from)
+                        if marker_at >= 0 and (end := buffer.find(b"</script>", marker_at)) >= 0:
+                            del buffer[end + len(b"</script>") :]
+                            self._stats["early_stops"] += 1
+                            break
+                    if len(buffer) >= max_bytes:
+                        del buffer[max_bytes:]
+                        self._stats["truncated"] += 1
+                        break
+
+                self._stats["bytes_read"] += len(buffer)
+                return buffer.decode(response.encoding or "utf-8", errors="replace")
+            finally:
+                await response.aclose()
+
+        # 본문을 다 읽거나 닫을 때까지 호스트별/전역 슬롯을 쥐도록 스케줄러 안에서 읽음
+        return await self.request("GET", url, stream=True, consume=read)
+
+    def stats(self) -> dict[str, Any]:
+        """연결 풀 통계 (재사용 연결 수, 핸드셰이크 수 등)"""
+        stats = dict(self._stats)
+        stats["reused_connections"] = max(
+            stats["requests"] - stats["new_connections"], 0
+        )
+        return stats
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,103 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Optional
+
+
+class NewsLedger:
+    """피드 조건부 요청 정보와 처리 완료된 기사를 실행 간에 보관하는 장부"""
+
+    def __init__(self, path: str, retention: float):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.retention = retention
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS feed_state (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                entry_ids TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                entry_id TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                news TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self.conn.commit()
+
+    def get_feed_state(self, url: str) -> Optional[dict[str, Any]]:
+        """이전 실행의 ETag, Last-Modified, 항목 ID 목록"""
+        row = self.conn.execute(
+            "SELECT etag, last_modified, entry_ids FROM feed_state WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "entry_ids": json.loads(row[2])}
+
+    def save_feed_state(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        entry_ids: list[str],
+    ) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO feed_state VALUES (?, ?, ?, ?, ?)",
+            (url, etag, last_modified, json.dumps(entry_ids), time.time()),
+        )
+        self.conn.commit()
+
+    def lookup(self, entry_id: str, fingerprint: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """처리된 기사를 조회합니다. fingerprint가 다르면(기사 변경) None"""
+        row = self.conn.execute(
+            "SELECT fingerprint, news FROM articles WHERE entry_id = ?", (entry_id,)
+        ).fetchone()
+        if row is None or (fingerprint is not None and row[0] != fingerprint):
+            return None
+        return json.loads(row[1])
+
+    def record(self, news_items: list[dict[str, Any]]) -> None:
+        """요약/분류가 끝난 기사를 기록하고 보관 기간이 지난 기록을 지웁니다."""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?)",
+            [
+                (
+                    item["entry_id"],
+                    item["fingerprint"],
+                    json.dumps(
+                        {k: v for k, v in item.items() if k != "content"},
+                        ensure_ascii=False,
+                    ),
+                    now,
+                )
+                for item in news_items
+            ],
+        )
+        self.conn.execute(
+            "DELETE FROM articles WHERE updated_at < ?", (now - self.retention,)
+        )
+        self.conn.commit()
+
+    def category_labels(self, source: str) -> list[tuple[str, str]]:
+        """source가 분류한 대표 기사의 (제목, 카테고리) 목록 (중복/같은 사건 기사는 제외)"""
+        rows = self.conn.execute(
+            """SELECT json_extract(news, '$.title'), json_extract(news, '$.category')
+            FROM articles
+            WHERE json_extract(news, '$.category_source') = ?
+            AND json_extract(news, '$.duplicate_of') IS NULL""",
+            (source,),
+        ).fetchall()
+        return [(title, category) for title, category in rows if title and category]
+
+    def close(self) -> None:
+        self.conn.close()
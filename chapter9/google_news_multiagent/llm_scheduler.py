@@ -0,0 +1,113 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, TypeVar
+
+from config import Config
+
+T = TypeVar("T")
+
+WINDOW_SECONDS = 60.0
+
+
+def estimate_tokens(*texts: str) -> int:
+    """프롬프트 토큰 수 추정 (한국어는 대략 2자당 1토큰) + 최대 출력 토큰"""
+    return sum(len(text) for text in texts) // 2 + Config.MAX_TOKENS
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """OpenAI RateLimitError 또는 HTTP 429 계열 오류인지 확인"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return "RateLimit" in type(error).__name__
+
+
+class LLMScheduler:
+    """
+    요약/분류 에이전트가 함께 쓰는 LLM 호출 스케줄러
+    - 슬라이딩 윈도우: 호출 하나가 끝나는 즉시 다음 호출이 시작되어 배치 단위 대기가 없습니다.
+    - 최근 60초 동안의 요청 수(RPM)와 토큰 수(TPM) 예산을 넘지 않도록 대기합니다.
+    - 속도 제한 오류는 지터를 준 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        requests_per_minute: int = None,
+        tokens_per_minute: int = None,
+    ):
+        self.max_concurrency = max_concurrency or Config.LLM_MAX_CONCURRENCY
+        self.requests_per_minute = requests_per_minute or Config.LLM_REQUESTS_PER_MINUTE
+        self.tokens_per_minute = tokens_per_minute or Config.LLM_TOKENS_PER_MINUTE
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._budget_lock = asyncio.Lock()
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """실행별 통계를 초기화합니다. (RPM/TPM 예산 창은 실행 간에도 유지)"""
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rate_limited": 0,
+            "budget_wait_seconds": 0.0,
+        }
+
+    def _expire(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            self._window_tokens -= self._window.popleft()[1]
+
+    async def _reserve(self, tokens: int) -> None:
+        """RPM/TPM 예산이 생길 때까지 기다린 뒤 예약합니다."""
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._budget_lock:
+            start = time.monotonic()
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if (
+                    len(self._window) < self.requests_per_minute
+                    and self._window_tokens + tokens <= self.tokens_per_minute
+                ):
+                    break
+                await asyncio.sleep(WINDOW_SECONDS - (now - self._window[0][0]))
+
+            self._window.append((time.monotonic(), tokens))
+            self._window_tokens += tokens
+            self.stats["budget_wait_seconds"] += time.monotonic() - start
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """전체 지터(full jitter)를 적용한 지수 백오프"""
+        return random.uniform(0, min(Config.LLM_BACKOFF_BASE * 2**attempt, Config.LLM_BACKOFF_MAX))
+
+    async def submit(
+        self, call: Callable[[], Awaitable[T]], estimated_tokens: int = 0
+    ) -> T:
+        """LLM 호출을 예산과 동시성 제한 안에서 실행합니다."""
+        self.stats["submitted"] += 1
+
+        for attempt in range(Config.LLM_MAX_RETRIES + 1):
+            await self._reserve(estimated_tokens)
+            try:
+                async with self._slots:
+                    result = await call()
+                self.stats["completed"] += 1
+                return result
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == Config.LLM_MAX_RETRIES:
+                    self.stats["failed"] += 1
+                    raise
+                self.stats["rate_limited"] += 1
+                await asyncio.sleep(self._backoff(attempt))
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            **self.stats,
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+        }
@@ -0,0 +1,81 @@
+import math
+import re
+import zlib
+from collections import defaultdict
+from typing import Optional
+
+from dedup import normalize_title
+
+
+class LocalNewsClassifier:
+    """
+    해시 문자 n-gram 특징을 쓰는 다항 나이브 베이즈 분류기 (로그 공간에서 선형 모델)
+    제목만으로 판단하며, 사후 확률을 신뢰도로 사용합니다.
+    """
+
+    def __init__(self, n_features: int = 2**18, alpha: float = 0.1):
+        self.n_features = n_features
+        self.alpha = alpha
+        self.examples = 0
+        self._class_log_prior: dict[str, float] = {}
+        self._feature_log_prob: dict[str, dict[int, float]] = {}
+        self._unseen_log_prob: dict[str, float] = {}
+
+    def features(self, title: str) -> dict[int, int]:
+        """공백을 제거한 제목의 문자 2/3-gram과 어절을 해시한 특징 벡터"""
+        text = normalize_title(title).lower()
+        compact = re.sub(r"\s+", "", text)
+        grams = [compact[i : i + n] for n in (2, 3) for i in range(len(compact) - n + 1)]
+        grams += re.findall(r"\w+", text)
+
+        counts: dict[int, int] = defaultdict(int)
+        for gram in grams:
+            counts[zlib.crc32(gram.encode("utf-8")) % self.n_features] += 1
+        return counts
+
+    def fit(self, examples: list[tuple[str, str]]) -> "LocalNewsClassifier":
+        """(제목, 카테고리) 예제로 학습합니다."""
+        class_counts: dict[str, int] = defaultdict(int)
+        feature_counts: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        vocabulary: set[int] = set()
+
+        for title, category in examples:
+            class_counts[category] += 1
+            for feature, count in self.features(title).items():
+                feature_counts[category][feature] += count
+                vocabulary.add(feature)
+
+        self.examples = len(examples)
+        vocabulary_size = max(len(vocabulary), 1)
+        for category, count in class_counts.items():
+            self._class_log_prior[category] = math.log(count / self.examples)
+            total = sum(feature_counts[category].values()) + self.alpha * vocabulary_size
+            self._feature_log_prob[category] = {
+                feature: math.log((value + self.alpha) / total)
+                for feature, value in feature_counts[category].items()
+            }
+            self._unseen_log_prob[category] = math.log(self.alpha / total)
+        return self
+
+    def predict(self, title: str) -> Optional[tuple[str, float]]:
+        """가장 가능성 높은 카테고리와 사후 확률. 학습되지 않았으면 None"""
+        if not self._class_log_prior:
+            return None
+
+        features = self.features(title)
+        scores = {
+            category: prior
+            + sum(
+                count * self._feature_log_prob[category].get(feature, self._unseen_log_prob[category])
+                for feature, count in features.items()
+            )
+            for category, prior in self._class_log_prior.items()
+        }
+        best = max(scores, key=scores.get)
+        normalizer = sum(math.exp(score - scores[best]) for score in scores.values())
+        return best, 1 / normalizer
+
+
+def should_audit(title: str, rate: float) -> bool:
+    """로컬 분류 결과 중 LLM과 비교할 표본을 제목 해시로 고정적으로 고릅니다."""
+    return zlib.crc32(title.encode("utf-8")) % 10_000 < rate * 10_000
@@ -1,11 +1,19 @@
 import os
 import logging
 import asyncio
+import argparse
 from datetime import datetime
+from typing import Optional
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 
 from workflow import create_news_workflow
+from checkpoint import open_checkpointer
+from metrics import MetricsCollector
+from daemon import NewsDaemon
+from batch_api import BatchJobClient
+from utils import write_atomic
+from agents.collector import RSSCollectorAgent
 from config import Config
 from state import NewsState
 
@@ -14,7 +22,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Google News AI 멀티에이전트 시스템")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=Config.INCREMENTAL,
+        help="이전 실행에서 처리한 기사는 건너뛰고 저장된 요약을 재사용합니다.",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=Config.STREAMING,
+        help="수집/요약/분류 단계를 기사 단위로 겹쳐 실행합니다.",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        default=Config.BATCH_MODE,
+        help="요약/분류 요청을 Batch API 일괄 작업으로 제출하고 완료될 때까지 기다립니다. (야간 보관용)",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="중단된 실행을 마지막으로 완료된 단계 다음부터 이어서 실행합니다.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="프로세스를 유지하며 --interval 주기로 반복 실행합니다. (/health, /metrics 제공)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=Config.SERVE_INTERVAL,
+        help="상주 모드의 실행 주기(초)",
+    )
+    return parser.parse_args()
+
+async def run_workflow(app, run_id: str, checkpointer=None, resume: bool = False) -> dict:
+    """워크플로를 한 번 실행합니다. resume이면 체크포인트의 다음 단계부터 이어갑니다."""
+    run_config = {"configurable": {"thread_id": run_id}}
+    # 노드가 기사 레코드를 제자리에서 고치므로, 다음 노드가 시작되기 전에 체크포인트를 기록
+    durability = "sync"
+
+    if resume:
+        if checkpointer is None:
+            raise ValueError("체크포인트가 비활성화되어 있어 이어서 실행할 수 없습니다.")
+        snapshot = await app.aget_state(run_config)
+        if not snapshot.values:
+            raise ValueError(f"실행 ID {run_id}의 체크포인트가 없습니다.")
+        remaining = ", ".join(snapshot.next) or "없음"
+        print(f"실행 {run_id} 이어서 실행 - 남은 단계: {remaining}")
+        return await app.ainvoke(None, run_config, durability=durability)
+
+    if checkpointer:
+        print(f"실행 ID: {run_id} (중단되면 --resume {run_id} 로 이어서 실행)")
+    initial_state = NewsState(
+        messages=[HumanMessage(content="Google News RSS 처리를 시작합니다.")]
+    )
+    return await app.ainvoke(initial_state, run_config, durability=durability)
+
+def save_report(final_state: dict, metrics: MetricsCollector) -> tuple[str, str]:
+    """보고서와 계측 결과를 OUTPUT_DIR에 원자적으로 저장하고 경로를 반환합니다."""
+    os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = os.path.join(Config.OUTPUT_DIR, f"news_report_{timestamp}.md")
+
+    write_atomic(filename, final_state["final_report"])
+    metrics_filename = metrics.write(
+        filename, final_state.get("metrics"), prometheus=Config.METRICS_PROMETHEUS
+    )
+    return filename, metrics_filename
+
+async def main(args: argparse.Namespace):
     """Google News AI 멀티에이전트 시스템의 메인 실행 함수"""
     print(
         """
@@ -23,6 +105,8 @@ RSS 수집 → AI 요약 → 카테고리 분류 → 리포트 생성
 """
     )
 
+    collector = None
+    batch_client = None
     try:
         if not Config.validate():
             raise ValueError("API 키가 설정되지 않았습니다. .env 파일을 확인해주세요")
@@ -35,38 +119,62 @@ RSS 수집 → AI 요약 → 카테고리 분류 → 리포트 생성
             max_tokens=Config.MAX_TOKENS,
             api_key=Config.OPENAI_API_KEY,
         )
-        app = create_news_workflow(llm)
+        metrics = MetricsCollector()
+        collector = RSSCollectorAgent(incremental=args.incremental, metrics=metrics)
+        if args.batch:
+            batch_client = BatchJobClient()
 
-        initial_state = NewsState(
-            messages=[HumanMessage(content="Google News RSS 처리를 시작합니다.")]
-        )
-        final_state = await app.ainvoke(initial_state)
+        async with open_checkpointer() as checkpointer:
+            app = create_news_workflow(
+                llm,
+                collector,
+                streaming=args.streaming,
+                checkpointer=checkpointer,
+                metrics=metrics,
+                batch_client=batch_client,
+            )
+
+            async def run(run_id: str, resume: bool = False) -> tuple[dict, Optional[str]]:
+                final_state = await run_workflow(app, run_id, checkpointer, resume)
+                if not final_state.get("final_report"):
+                    print("\n 생성된 보고서가 없습니다.")
+                    return final_state, None
+
+                filename, metrics_filename = save_report(final_state, metrics)
+                # 보고서까지 저장된 실행은 이어서 실행할 필요가 없으므로 체크포인트 정리
+                if checkpointer:
+                    await checkpointer.adelete_thread(run_id)
+                print(f"\n 보고서가 저장되었습니다: {filename}")
+                print(f" 계측 결과가 저장되었습니다: {metrics_filename}")
+                return final_state, filename
 
-        if not final_state.get("final_report"):
-            print("\n 생성된 보고서가 없습니다.")
-            return
-        
-        os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(Config.OUTPUT_DIR, f"news_report_{timestamp}.md")
+            if args.serve:
+                await NewsDaemon(run, metrics, interval=args.interval).serve()
+                return
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(final_state["final_report"])
+            run_id = args.resume or datetime.now().strftime("%Y%m%d_%H%M%S")
+            final_state, filename = await run(run_id, resume=bool(args.resume))
+            if not filename:
+                return
 
         print("\n" + "=" * 60)
         print("처리 완료")
         print("=" * 60)
-        print(f"\n 보고서가 저장되었습니다: {filename}")
         print(f"처리된 뉴스: {len(final_state.get('summarized_news', []))}건")
         print("\n보고서 미리보기:")
         print("-" * 60)
         print(final_state["final_report"][:500] + "...")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\n 사용자에 의해 중단되었습니다.")
     except Exception as e:
         logger.exception("실행 중 오류 발생")
         print(f"\n오류 발생: {e}")
+    finally:
+        if collector:
+            await collector.aclose()
+        if batch_client:
+            await batch_client.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(parse_args()))
\ No newline at end of file
@@ -0,0 +1,223 @@
+import bisect
+import functools
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from state import NewsState
+from utils import write_atomic
+
+# 모델에 붙인 이 메타데이터 값(fast/strong 등)별로 LLM 호출 지연 시간을 llm_<값>에 기록
+TIER_METADATA_KEY = "model_tier"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """기사 단위 지연 시간 히스토그램 (Prometheus 누적 버킷 + 백분위수)"""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.values: list[float] = []
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.values.append(value)
+
+    def percentile(self, q: float) -> float:
+        if not self.values:
+            return 0.0
+        ordered = sorted(self.values)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def summary(self) -> dict[str, float]:
+        count = len(self.values)
+        return {
+            "count": count,
+            "sum": sum(self.values),
+            "avg": sum(self.values) / count if count else 0.0,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": max(self.values, default=0.0),
+        }
+
+
+class TokenUsageHandler(BaseCallbackHandler):
+    """LLM 응답의 usage_metadata에서 토큰 사용량을 모으는 콜백"""
+
+    def __init__(self, collector: "MetricsCollector"):
+        self.collector = collector
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    self.collector.add_tokens(usage)
+
+
+class ModelLatencyHandler(BaseCallbackHandler):
+    """모델 단계(TIER_METADATA_KEY 메타데이터)별 LLM 호출 지연 시간 콜백 (스케줄러 대기 시간 제외)"""
+
+    def __init__(self, collector: "MetricsCollector"):
+        self.collector = collector
+        self.started: dict[UUID, tuple[str, float]] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        metadata: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        tier = (metadata or {}).get(TIER_METADATA_KEY)
+        if tier:
+            self.started[run_id] = (tier, time.perf_counter())
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        if started := self.started.pop(run_id, None):
+            tier, start = started
+            self.collector.observe(f"llm_{tier}", time.perf_counter() - start)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self.started.pop(run_id, None)
+
+
+class MetricsCollector:
+    """
+    실행 단위 계측 수집기 - 에이전트에 주입해서 사용합니다.
+    - 단계별 실행 시간과 오류 수
+    - 기사 단위 지연 시간 히스토그램 (fetch, extract, summarize, classify ...)
+    - 모델 단계별 LLM 호출 지연 시간 (llm_fast, llm_strong)
+    - LLM 토큰 사용량 (응답 메타데이터 기준)
+    """
+
+    def __init__(self):
+        self.callbacks = [TokenUsageHandler(self), ModelLatencyHandler(self)]
+        self.reset()
+
+    def reset(self) -> None:
+        """새 실행을 시작할 때 모든 값을 초기화합니다."""
+        self.stages: dict[str, float] = {}
+        self.histograms: dict[str, Histogram] = defaultdict(Histogram)
+        self.tokens: dict[str, int] = defaultdict(int)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.started_at = time.time()
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.histograms[name].observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """with 블록의 실행 시간을 name 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def count_error(self, stage: str, count: int = 1) -> None:
+        self.errors[stage] += count
+
+    def add_tokens(self, usage: dict[str, Any]) -> None:
+        self.tokens["llm_calls"] += 1
+        for key in ("input_tokens", "output_tokens", "total_tokens"):
+            self.tokens[key] += usage.get(key, 0) or 0
+
+    def timed_stage(
+        self, name: str, node: Callable[[NewsState], Awaitable[NewsState]]
+    ) -> Callable[[NewsState], Awaitable[NewsState]]:
+        """워크플로 노드를 감싸 단계 실행 시간과 단계 중 추가된 오류 수를 기록합니다."""
+
+        @functools.wraps(node)
+        async def wrapper(state: NewsState) -> NewsState:
+            start = time.perf_counter()
+            errors_before = len(state.error_log)
+            try:
+                return await node(state)
+            finally:
+                self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+                if len(state.error_log) > errors_before:
+                    self.count_error(name, len(state.error_log) - errors_before)
+
+        return wrapper
+
+    def snapshot(self, state_metrics: dict[str, Any] = None) -> dict[str, Any]:
+        """에이전트가 상태에 남긴 통계(캐시, 요청 등)와 합친 전체 계측 결과"""
+        state_metrics = state_metrics or {}
+        return {
+            "started_at": self.started_at,
+            "wall_time": time.time() - self.started_at,
+            "stages": dict(self.stages),
+            "latency": {name: hist.summary() for name, hist in self.histograms.items()},
+            "tokens": dict(self.tokens),
+            "errors": dict(self.errors),
+            "cache_hit_rates": {
+                name: value["hit_rate"]
+                for name, value in state_metrics.items()
+                if isinstance(value, dict) and "hit_rate" in value
+            },
+            "agents": state_metrics,
+        }
+
+    def to_prometheus(self, state_metrics: dict[str, Any] = None) -> str:
+        """Prometheus 텍스트 형식으로 변환"""
+        snapshot = self.snapshot(state_metrics)
+        lines = ["# TYPE news_stage_seconds gauge"]
+        lines += [
+            f'news_stage_seconds{{stage="{name}"}} {value:.6f}'
+            for name, value in self.stages.items()
+        ]
+
+        lines.append("# TYPE news_article_latency_seconds histogram")
+        for name, hist in self.histograms.items():
+            cumulative = 0
+            bounds = [str(bound) for bound in hist.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, hist.counts):
+                cumulative += count
+                lines.append(
+                    f'news_article_latency_seconds_bucket{{op="{name}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'news_article_latency_seconds_sum{{op="{name}"}} {sum(hist.values):.6f}')
+            lines.append(f'news_article_latency_seconds_count{{op="{name}"}} {len(hist.values)}')
+
+        lines.append("# TYPE news_llm_tokens_total counter")
+        lines += [
+            f'news_llm_tokens_total{{type="{key}"}} {value}' for key, value in self.tokens.items()
+        ]
+        lines.append("# TYPE news_errors_total counter")
+        lines += [
+            f'news_errors_total{{stage="{stage}"}} {count}' for stage, count in self.errors.items()
+        ]
+        lines.append("# TYPE news_cache_hit_ratio gauge")
+        lines += [
+            f'news_cache_hit_ratio{{cache="{name}"}} {rate:.4f}'
+            for name, rate in snapshot["cache_hit_rates"].items()
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(
+        self, report_path: str, state_metrics: dict[str, Any] = None, prometheus: bool = False
+    ) -> str:
+        """보고서 옆에 <보고서 이름>.metrics.json (및 .prom)을 저장하고 JSON 경로를 반환합니다."""
+        base, _ = os.path.splitext(report_path)
+        json_path = f"{base}.metrics.json"
+        write_atomic(
+            json_path,
+            json.dumps(self.snapshot(state_metrics), ensure_ascii=False, indent=2, default=str),
+        )
+        if prometheus:
+            write_atomic(f"{base}.prom", self.to_prometheus(state_metrics))
+        return json_path
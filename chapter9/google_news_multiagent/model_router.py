@@ -0,0 +1,122 @@
+import logging
+from collections import defaultdict
+from typing import Any, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+
+from config import Config
+from cache import model_name
+from metrics import MetricsCollector, TIER_METADATA_KEY
+
+logger = logging.getLogger(__name__)
+
+FAST, STRONG = "fast", "strong"
+
+
+def tier_model(llm: BaseChatModel, tier: str) -> BaseChatModel:
+    """tier 메타데이터를 붙인 모델 사본 (원래 모델은 그대로 둠)"""
+    metadata = {**(llm.metadata or {}), TIER_METADATA_KEY: tier}
+    return llm.model_copy(update={"metadata": metadata})
+
+
+class ModelRouter:
+    """
+    비용/지연 시간 단계별 모델 라우터
+    - fast: 짧거나 이미 간결한 기사의 요약과 모든 분류 호출 (작은 모델, 낮은 추론 강도)
+    - strong: 길거나 여러 출처를 종합해야 하는 기사의 요약
+    단계별 호출 수와 지연 시간은 MetricsCollector가 모델 메타데이터로 나눠 기록합니다.
+    """
+
+    def __init__(self, fast: BaseChatModel, strong: BaseChatModel):
+        self.models = {FAST: tier_model(fast, FAST), STRONG: tier_model(strong, STRONG)}
+        self.reset()
+
+    @classmethod
+    def from_config(cls, strong: Optional[BaseChatModel] = None) -> "ModelRouter":
+        """Config의 모델 설정으로 라우터를 만듭니다. strong을 주면 강한 단계에 그 모델을 씁니다."""
+        fast = ChatOpenAI(
+            model=Config.FAST_MODEL_NAME,
+            max_tokens=Config.MAX_TOKENS,
+            reasoning_effort=Config.FAST_REASONING_EFFORT,
+            api_key=Config.OPENAI_API_KEY,
+        )
+        strong = strong or ChatOpenAI(
+            model=Config.STRONG_MODEL_NAME,
+            max_tokens=Config.MAX_TOKENS,
+            reasoning_effort=Config.STRONG_REASONING_EFFORT,
+            api_key=Config.OPENAI_API_KEY,
+        )
+        return cls(fast, strong)
+
+    @property
+    def fast(self) -> BaseChatModel:
+        return self.models[FAST]
+
+    @property
+    def strong(self) -> BaseChatModel:
+        return self.models[STRONG]
+
+    def reset(self) -> None:
+        """새 실행을 시작할 때 단계 선택 수를 초기화합니다."""
+        self.decisions: dict[str, dict[str, int]] = defaultdict(lambda: {FAST: 0, STRONG: 0})
+        # strong을 고른 이유별 건수 (작업 -> 이유 -> 건수)
+        self.strong_reasons: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def route_summary(self, title: str, contents: list[str]) -> BaseChatModel:
+        """
+        요약 호출에 쓸 단계의 모델을 고릅니다.
+        원문이 ROUTING_LONG_ARTICLE_CHARS 이상이거나 출처가 ROUTING_STRONG_SOURCES곳 이상인 사건만 strong,
+        나머지(짧거나 압축 예산 안에 그대로 들어가는 기사)는 fast로 보냅니다.
+        """
+        length = sum(len(content) for content in contents)
+        if len(contents) >= Config.ROUTING_STRONG_SOURCES:
+            tier, reason = STRONG, "여러 출처"
+        elif length >= Config.ROUTING_LONG_ARTICLE_CHARS:
+            tier, reason = STRONG, "긴 본문"
+        else:
+            tier, reason = FAST, "짧은 본문"
+        self.decisions["summarize"][tier] += 1
+        if tier == STRONG:
+            self.strong_reasons["summarize"][reason] += 1
+        # 기사별 결정은 디버그 로그로만 남기고, 실행마다 print_stats로 건수를 요약해 출력
+        logger.debug(
+            "모델 라우팅: summarize -> %s (%s, 출처 %d곳, 본문 %d자) %s",
+            tier, reason, len(contents), length, title[:40],
+        )
+        return self.models[tier]
+
+    def stats(self, metrics: MetricsCollector) -> dict[str, Any]:
+        """작업별 단계 선택 수와 단계별 LLM 지연 시간 (metrics의 llm_<tier> 히스토그램)"""
+        latency = {
+            tier: metrics.histograms[f"llm_{tier}"].summary()
+            for tier in self.models
+            if f"llm_{tier}" in metrics.histograms
+        }
+        return {
+            "models": {tier: model_name(llm) for tier, llm in self.models.items()},
+            "decisions": {task: dict(counts) for task, counts in self.decisions.items()},
+            "strong_reasons": {
+                task: dict(reasons) for task, reasons in self.strong_reasons.items()
+            },
+            "latency": latency,
+        }
+
+    def print_stats(self, metrics: MetricsCollector) -> dict[str, Any]:
+        """통계를 출력하고 반환합니다."""
+        stats = self.stats(metrics)
+        for task, counts in stats["decisions"].items():
+            reasons = ", ".join(
+                f"{reason} {count}건" for reason, count in stats["strong_reasons"].get(task, {}).items()
+            )
+            print(
+                f"  모델 라우팅({task}): fast {counts[FAST]}건, strong {counts[STRONG]}건"
+                + (f" ({reasons})" if reasons else "")
+            )
+        for tier, summary in stats["latency"].items():
+            print(
+                f"  {tier} 모델({stats['models'][tier]}) 지연 시간: "
+                f"p50 {summary['p50']:.2f}s, p90 {summary['p90']:.2f}s, "
+                f"p99 {summary['p99']:.2f}s ({summary['count']}회)"
+            )
+        return stats
@@ -0,0 +1,101 @@
+import logging
+from html import unescape
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup
+import lxml.html
+
+from config import Config
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # 선택 의존성
+    HTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+
+class RedirectParser:
+    """
+    Google News 리디렉션 페이지에서 c-wiz[data-p] 속성값을 꺼내는 파서
+    builds_tree가 True면 문서 전체를 파싱하므로 프로세스 풀에서 실행합니다.
+    """
+
+    def __init__(self, name: str, parse: Callable[[str], Optional[str]], builds_tree: bool):
+        self.name = name
+        self.parse = parse
+        self.builds_tree = builds_tree
+
+
+PARSERS: dict[str, RedirectParser] = {}
+
+
+def register_parser(
+    name: str, builds_tree: bool = True
+) -> Callable[[Callable[[str], Optional[str]]], Callable[[str], Optional[str]]]:
+    """리디렉션 페이지 파서를 이름으로 등록하는 데코레이터"""
+
+    def decorator(func: Callable[[str], Optional[str]]) -> Callable[[str], Optional[str]]:
+        PARSERS[name] = RedirectParser(name, func, builds_tree)
+        return func
+
+    return decorator
+
+
+@register_parser("scan", builds_tree=False)
+def scan_data_p(html_content: str) -> Optional[str]:
+    """트리를 만들지 않고 data-p 속성이 있는 c-wiz 태그만 찾아 값을 잘라냅니다."""
+    index = html_content.find("data-p=")
+    while index != -1:
+        value_start = index + len("data-p=") + 1
+        quote = html_content[value_start - 1 : value_start]
+        tag_start = html_content.rfind("<", 0, index)
+        if (
+            quote in ('"', "'")
+            and html_content[index - 1].isspace()
+            and html_content[tag_start + 1 : tag_start + 6].lower() == "c-wiz"
+        ):
+            end = html_content.find(quote, value_start)
+            return unescape(html_content[value_start:end]) if end != -1 else None
+        index = html_content.find("data-p=", index + 1)
+    return None
+
+
+@register_parser("lxml")
+def lxml_data_p(html_content: str) -> Optional[str]:
+    """lxml(libxml2) HTML 파서"""
+    values = lxml.html.document_fromstring(html_content).xpath("//c-wiz[@data-p]/@data-p")
+    return str(values[0]) if values else None
+
+
+if HTMLParser is not None:
+
+    @register_parser("selectolax")
+    def selectolax_data_p(html_content: str) -> Optional[str]:
+        """selectolax(Modest) HTML 파서"""
+        node = HTMLParser(html_content).css_first("c-wiz[data-p]")
+        return node.attributes.get("data-p") if node else None
+
+
+@register_parser("bs4")
+def bs4_data_p(html_content: str) -> Optional[str]:
+    """BeautifulSoup html.parser (순수 파이썬, 가장 느림)"""
+    element = BeautifulSoup(html_content, "html.parser").select_one("c-wiz[data-p]")
+    return element.get("data-p") if element else None
+
+
+def get_parser(name: Optional[str] = None) -> RedirectParser:
+    """설정된 파서를 반환합니다. 설치되지 않은 백엔드면 scan으로 대신합니다."""
+    name = name or Config.REDIRECT_PARSER
+    if name not in PARSERS:
+        logger.warning("리디렉션 파서 '%s'를 사용할 수 없어 scan으로 대신합니다.", name)
+        name = "scan"
+    return PARSERS[name]
+
+
+def find_data_p(html_content: str, parser_name: Optional[str] = None) -> Optional[str]:
+    """
+    리디렉션 페이지의 data-p 값을 반환합니다.
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 유지합니다.
+    """
+    return get_parser(parser_name).parse(html_content)
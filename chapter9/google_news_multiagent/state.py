@@ -1,15 +1,23 @@
 from typing import Annotated, Any
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+from articles import ArticleStore
+
 class NewsState(BaseModel):
-    """뉴스 처리 상태를 관리하는 데이터 모델"""
+    """
+    뉴스 처리 상태를 관리하는 데이터 모델
+    기사는 articles 저장소에 한 번만 두고, 단계별 목록은 기사 ID만 가집니다.
+    """
     model_config = ConfigDict(arbitrary_types_allowed=True)
     messages: Annotated[list[BaseMessage], add_messages] = []
-    raw_news: list[dict[str, Any]] = []
-    summarized_news: list[dict[str, Any]] = []
-    categorized_news: dict[str, list[dict[str, Any]]] = {}
+    articles: ArticleStore = Field(default_factory=ArticleStore)
+    raw_news: list[int] = []
+    reused_news: list[int] = []
+    summarized_news: list[int] = []
+    categorized_news: dict[str, list[int]] = {}
     final_report: str = ""
     error_log: list[str] = []
-    
\ No newline at end of file
+    metrics: dict[str, Any] = {}
+
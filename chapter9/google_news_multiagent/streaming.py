@@ -0,0 +1,191 @@
+import asyncio
+from collections import defaultdict
+from typing import Optional
+
+from langchain_core.messages import AIMessage
+
+from config import Config
+from state import NewsState
+from articles import Article, LLM_LABEL, LOCAL_LABEL
+from agents.collector import RSSCollectorAgent
+from agents.summarizer import NewsSummarizerAgent
+from agents.organizer import NewsOrganizerAgent
+from agents.deduplicator import NewsDeduplicatorAgent
+from dedup import attach_duplicate
+from local_classifier import should_audit
+
+_DONE = None
+
+
+class StreamingNewsPipeline:
+    """
+    수집 -> 요약 -> 분류 단계를 기사 단위로 겹쳐 실행하는 스트리밍 파이프라인
+    기사는 추출되는 즉시 요약되고, 요약되는 즉시 분류됩니다.
+    """
+
+    def __init__(
+        self,
+        collector: RSSCollectorAgent,
+        summarizer: NewsSummarizerAgent,
+        organizer: NewsOrganizerAgent,
+        deduplicator: Optional[NewsDeduplicatorAgent] = None,
+    ):
+        self.name = "Streaming Pipeline"
+        self.collector = collector
+        self.summarizer = summarizer
+        self.organizer = organizer
+        self.deduplicator = deduplicator
+
+    async def run(self, state: NewsState) -> NewsState:
+        """스트림이 모두 소진될 때까지 기사 단위로 처리합니다."""
+        print(f"--- [{self.name}] 스트리밍 처리 시작 ---")
+
+        self.collector.errors = []
+        # 상주 모드에서 통계가 실행 간에 누적되지 않도록 이번 실행 기준으로 초기화
+        self.collector.reset_stats()
+        self.organizer.scheduler.reset_stats()
+        for cache in (self.summarizer.summary_cache, self.organizer.category_cache):
+            if cache:
+                cache.reset_stats()
+        summarize_queue: asyncio.Queue = asyncio.Queue(Config.STREAM_QUEUE_SIZE)
+        classify_queue: asyncio.Queue = asyncio.Queue(Config.STREAM_QUEUE_SIZE)
+        summarized: list[tuple[int, Article]] = []
+        categorized: list[tuple[int, Article]] = []
+        detector = self.deduplicator.create_detector() if self.deduplicator else None
+        duplicates = 0
+        audit = {"local": 0, "audited": 0, "agreed": 0}
+        self.organizer.refresh_local_classifier()
+        router = self.summarizer.router
+        if router:
+            router.reset()
+
+        async def collect(index: int, entry) -> Optional[Article]:
+            nonlocal duplicates
+            news = await self.collector.parse_entry(entry)
+            # 먼저 도착한 기사가 대표가 되고, 이후 유사 기사는 다른 출처로만 붙음
+            if detector and (representative := detector.add(news)) is not None:
+                attach_duplicate(representative, news)
+                duplicates += 1
+                return None
+            state.articles.add(news)
+            await summarize_queue.put((index, news))
+            return news
+
+        async def summarize_worker() -> None:
+            while (item := await summarize_queue.get()) is not _DONE:
+                index, news = item
+                news = await self.summarizer.summarize_single_news(news)
+                summarized.append((index, news))
+                await classify_queue.put((index, news))
+
+        async def classify_worker() -> None:
+            while (item := await classify_queue.get()) is not _DONE:
+                index, news = item
+                category, source = self.organizer.classify_locally(news), LOCAL_LABEL
+                if category is not None:
+                    audit["local"] += 1
+                # 로컬 분류 표본은 LLM으로 다시 분류해 일치율을 측정하고 LLM 결과를 따름
+                if category is None or should_audit(news.title, Config.LOCAL_CLASSIFIER_AUDIT_RATE):
+                    local_category = category
+                    try:
+                        category = self.organizer.lookup_category(news)
+                        if category is None:
+                            category, news = await self.organizer.categorize_single_news(news)
+                    except Exception as e:
+                        self.organizer.metrics.count_error("classify")
+                        print(f"  분류 작업 실패: {e}")
+                        if local_category is None:
+                            continue
+                        category = local_category
+                    else:
+                        source = LLM_LABEL
+                        if local_category is not None:
+                            audit["audited"] += 1
+                            audit["agreed"] += (
+                                self.organizer.normalize_category(category) == local_category
+                            )
+                news.category = self.organizer.normalize_category(category)
+                news.category_source = source
+                categorized.append((index, news))
+
+        try:
+            entries, reused_news = await self.collector.select_entries()
+
+            summarizers = [
+                asyncio.create_task(summarize_worker())
+                for _ in range(Config.LLM_MAX_CONCURRENCY)
+            ]
+            classifiers = [
+                asyncio.create_task(classify_worker())
+                for _ in range(Config.LLM_MAX_CONCURRENCY)
+            ]
+
+            try:
+                collected = await asyncio.gather(
+                    *(collect(i, entry) for i, entry in enumerate(entries))
+                )
+                for _ in summarizers:
+                    await summarize_queue.put(_DONE)
+                await asyncio.gather(*summarizers)
+                for _ in classifiers:
+                    await classify_queue.put(_DONE)
+                await asyncio.gather(*classifiers)
+            finally:
+                for task in summarizers + classifiers:
+                    task.cancel()
+
+            # 완료 순서와 무관하게 피드 순서를 유지
+            summarized.sort(key=lambda x: x[0])
+            categorized.sort(key=lambda x: x[0])
+            categorized_news = defaultdict(list)
+            for _, news in categorized:
+                categorized_news[news.category].append(news.id)
+
+            state.raw_news = [news.id for news in collected if news is not None]
+            state.reused_news = [
+                state.articles.add(Article.from_record(news)) for news in reused_news
+            ]
+            state.summarized_news = [news.id for _, news in summarized]
+            state.categorized_news = dict(categorized_news)
+            print(f"총 {len(collected)}개의 뉴스 기사 수집/요약/분류 완료")
+            if reused_news:
+                print(f"이전 실행 요약 재사용: {len(reused_news)}건")
+
+            self.collector.report_stats(state)
+            if detector:
+                self.deduplicator.record_metrics(state, len(collected), duplicates)
+            state.metrics["llm_scheduler"] = self.organizer.scheduler.metrics()
+            state.metrics["classification"] = {
+                "local": audit["local"],
+                "audited": audit["audited"],
+                "agreement_rate": (
+                    audit["agreed"] / audit["audited"] if audit["audited"] else None
+                ),
+            }
+            if audit["audited"]:
+                print(
+                    f"  로컬/LLM 일치율: {audit['agreed']}/{audit['audited']} "
+                    f"({audit['agreed'] / audit['audited']:.0%})"
+                )
+            if router:
+                state.metrics["routing"] = router.print_stats(self.summarizer.metrics)
+            for name, cache in (
+                ("summary_cache", self.summarizer.summary_cache),
+                ("category_cache", self.organizer.category_cache),
+            ):
+                if cache:
+                    state.metrics[name] = cache.stats()
+            self.organizer.print_distribution(categorized_news)
+            state.messages.append(
+                AIMessage(
+                    content=f"{len(summarized)}개의 뉴스를 요약하고 "
+                    f"{len(categorized_news)}개 카테고리로 분류했습니다."
+                )
+            )
+
+        except Exception as e:
+            print(f"스트리밍 처리 중 오류 발생: {e}")
+            state.error_log.append(f"StreamingNewsPipeline: {str(e)}")
+
+        print(f"[{self.name}] 처리 완료\n")
+        return state
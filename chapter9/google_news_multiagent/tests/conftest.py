@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 프로젝트 모듈을 평면 import(from config import Config)로 불러오도록 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,40 @@
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
+
+from batch_api import chat_request_body
+
+
+class Category(BaseModel):
+    category: str
+
+
+MESSAGES = [SystemMessage(content="분류하세요."), HumanMessage(content="제목: 기준금리 동결")]
+
+
+def test_chat_request_body_uses_model_settings():
+    llm = ChatOpenAI(
+        model="gpt-5-nano", max_tokens=300, reasoning_effort="minimal", api_key="test"
+    )
+
+    body = chat_request_body(llm, MESSAGES)
+
+    assert body["model"] == "gpt-5-nano"
+    assert body["max_completion_tokens"] == 300
+    assert body["reasoning_effort"] == "minimal"
+    assert body["messages"] == [
+        {"role": "system", "content": "분류하세요."},
+        {"role": "user", "content": "제목: 기준금리 동결"},
+    ]
+    assert "response_format" not in body
+
+
+def test_chat_request_body_includes_bound_response_format():
+    llm = ChatOpenAI(model="gpt-5-nano", api_key="test").bind(response_format=Category)
+
+    body = chat_request_body(llm, MESSAGES)
+
+    assert body["model"] == "gpt-5-nano"
+    assert body["response_format"]["type"] == "json_schema"
+    assert body["response_format"]["json_schema"]["name"] == "Category"
+    assert "category" in body["response_format"]["json_schema"]["schema"]["properties"]
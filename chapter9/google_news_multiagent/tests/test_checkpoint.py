@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from langgraph.checkpoint.serde import _msgpack
+from langgraph.graph import END, StateGraph
+
+from articles import Article
+from checkpoint import open_checkpointer
+from config import Config
+from state import NewsState
+
+CONTENT = "서울시는 18일 내년도 대중교통 요금 체계 개편안을 발표했다. " * 20
+
+
+def build_workflow(checkpointer, fail: bool):
+    async def collect(state: NewsState) -> NewsState:
+        state.raw_news = [state.articles.add(Article(title="요금 인상", content=CONTENT))]
+        return state
+
+    async def summarize(state: NewsState) -> NewsState:
+        if fail:
+            raise RuntimeError("요약 중 중단")
+        news = state.articles[state.raw_news[0]]
+        news.ai_summary = news.content[:20]
+        state.summarized_news = [news.id]
+        return state
+
+    workflow = StateGraph(NewsState)
+    workflow.add_node("collect", collect)
+    workflow.add_node("summarize", summarize)
+    workflow.set_entry_point("collect")
+    workflow.add_edge("collect", "summarize")
+    workflow.add_edge("summarize", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+async def crash_and_resume() -> dict:
+    run_config = {"configurable": {"thread_id": "strict"}}
+    async with open_checkpointer() as checkpointer:
+        with pytest.raises(RuntimeError):
+            await build_workflow(checkpointer, fail=True).ainvoke(
+                NewsState(), run_config, durability="sync"
+            )
+    async with open_checkpointer() as checkpointer:
+        return await build_workflow(checkpointer, fail=False).ainvoke(
+            None, run_config, durability="sync"
+        )
+
+
+def test_resume_restores_articles_in_strict_msgpack_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(_msgpack, "STRICT_MSGPACK_ENABLED", True)
+    monkeypatch.setattr(Config, "CHECKPOINT_ENABLED", True)
+    monkeypatch.setattr(Config, "CACHE_DB_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(Config, "CHECKPOINT_DB_PATH", str(tmp_path / "checkpoints.sqlite3"))
+
+    final_state = asyncio.run(crash_and_resume())
+
+    news = final_state["articles"][final_state["summarized_news"][0]]
+    assert isinstance(news, Article)
+    assert news.content == CONTENT
+    assert news.ai_summary == CONTENT[:20]
@@ -0,0 +1,42 @@
+from clustering import IncrementalClusterer, tfidf_vectors
+from config import Config
+
+# 주제와 관계없이 기사마다 들어가는 흔한 문장 (공통 문자 2-gram)
+COMMON = " 관계자는 이날 서울에서 열린 기자회견에서 이같이 밝혔다."
+
+RATE = [
+    "한국은행 기준금리 연 2.50% 동결 금융통화위원회는 물가 안정을 위해 기준금리를 동결했다.",
+    "한은 금통위 기준금리 동결 금융통화위원회는 물가와 가계부채를 고려해 기준금리를 유지했다.",
+]
+# 두 주제의 단어가 섞인 기사 - 군집 중심이 이 기사를 거쳐 다른 주제 쪽으로 넓어질 수 있음
+BRIDGES = [
+    "기준금리 동결 소식에 서울 아파트 시장과 프로축구 구단 재정 모두 관망세",
+    "프로축구 구단 재정난 속 축구 대표팀 월드컵 예선 2연승",
+]
+FOOTBALL = [
+    "축구 대표팀 월드컵 예선 2연승 손흥민 결승골로 대표팀 승리",
+    "축구 대표팀 감독 월드컵 예선 승리 후 선수들 경기력 칭찬",
+]
+
+
+def cluster(texts: list[str]) -> list[list[int]]:
+    clusterer = IncrementalClusterer(Config.CLUSTER_SIMILARITY)
+    for i, vector in enumerate(tfidf_vectors([text + COMMON for text in texts])):
+        clusterer.add(i, vector)
+    return clusterer.clusters
+
+
+def test_unrelated_topics_sharing_common_bigrams_do_not_merge():
+    clusters = cluster(RATE + BRIDGES + FOOTBALL)
+
+    rate = set(range(len(RATE)))
+    football = set(range(len(RATE) + len(BRIDGES), len(RATE) + len(BRIDGES) + len(FOOTBALL)))
+    for members in clusters:
+        assert not (rate & set(members) and football & set(members)), clusters
+
+
+def test_same_event_articles_merge():
+    clusters = cluster(RATE + FOOTBALL)
+
+    assert [0, 1] in clusters
+    assert [2, 3] in clusters
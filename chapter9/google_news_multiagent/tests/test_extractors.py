@@ -0,0 +1,40 @@
+import pytest
+
+from extractors import extract_content
+
+PARAGRAPHS = [
+    "서울시는 18일 내년도 대중교통 요금 체계 개편안을 발표하고 다음 달부터 시민 의견 수렴에 들어간다고 밝혔다.",
+    "개편안에 따르면 지하철 기본요금은 현행 1400원에서 1550원으로 150원 오르며, 버스 요금도 같은 폭으로 조정된다.",
+    "서울시는 공청회와 시의회 의견 청취를 거쳐 이르면 내년 3월부터 새 요금을 적용할 계획이다.",
+]
+
+
+def chosun_page(global_content: str) -> str:
+    body = "".join(f"<p>{paragraph}</p>" for paragraph in PARAGRAPHS)
+    return (
+        '<html lang="ko"><head><meta charset="utf-8"><title>요금 인상 추진</title>'
+        f"<script>Fusion.globalContent={global_content};</script></head>"
+        f'<body><article><h1>요금 인상 추진</h1><div class="article-body">{body}</div>'
+        "</article></body></html>"
+    )
+
+
+@pytest.mark.parametrize(
+    "global_content",
+    [
+        '["content_elements"]',  # 객체가 아닌 JSON
+        '{"content_elements": ["text"]}',  # 객체가 아닌 본문 요소
+    ],
+)
+def test_malformed_chosun_json_falls_back_to_trafilatura(global_content):
+    content = extract_content(chosun_page(global_content), "https://www.chosun.com/national/abc/")
+
+    assert PARAGRAPHS[0] in content
+
+
+def test_chosun_json_is_used_when_valid():
+    global_content = '{"content_elements": [{"type": "text", "content": "본문 첫 문단"}]}'
+
+    assert extract_content(chosun_page(global_content), "https://www.chosun.com/national/abc/") == (
+        "본문 첫 문단"
+    )
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
+import os
 import re
+import tempfile
 
 def clean_html(html_text: str) -> str:
     """HTML 태그 제거"""
@@ -34,3 +36,16 @@ def convert_gmt_to_kst(gmt_time_str: str) -> str:
     gmt_time = datetime.strptime(gmt_time_str, "%a, %d %b %Y %H:%M:%S GMT")
     kst_time = gmt_time + timedelta(hours=KST_OFFSET_HOURS)
     return kst_time.strftime("%Y-%m-%d %H:%M:%S")
+
+def write_atomic(path: str, text: str) -> None:
+    """임시 파일에 쓴 뒤 교체해서, 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 저장합니다."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
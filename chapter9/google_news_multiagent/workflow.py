@@ -3,28 +3,108 @@ from langgraph.graph import StateGraph, END
 
 from state import NewsState
 from agents.collector import RSSCollectorAgent
+from agents.deduplicator import NewsDeduplicatorAgent
+from agents.clusterer import NewsClusterAgent
 from agents.summarizer import NewsSummarizerAgent
 from agents.organizer import NewsOrganizerAgent
+from agents.analyzer import NewsAnalyzerAgent
 from agents.reporter import ReportGeneratorAgent
+from streaming import StreamingNewsPipeline
+from llm_scheduler import LLMScheduler
+from metrics import MetricsCollector
+from model_router import ModelRouter
+from batch_api import BatchJobClient
+from config import Config
 
-def create_news_workflow(llm: ChatOpenAI = None) -> StateGraph:
-    """뉴스 처리 워크플로 생성 - RSS 수집 -> AI 요약 -> 카테고리 분류 -> 보고서 생성"""
+def create_news_workflow(
+    llm: ChatOpenAI = None,
+    collector: RSSCollectorAgent = None,
+    streaming: bool = None,
+    checkpointer=None,
+    metrics: MetricsCollector = None,
+    router: ModelRouter = None,
+    batch_client: BatchJobClient = None,
+) -> StateGraph:
+    """
+    뉴스 처리 워크플로 생성 - RSS 수집 -> AI 요약 -> 카테고리 분류 -> 보고서 생성
+    metrics를 주면 모든 에이전트와 노드가 같은 계측 수집기에 기록합니다.
+    checkpointer를 주면 노드가 끝날 때마다 상태를 저장해 중단된 실행을 이어갈 수 있습니다.
+    Config.FUSED_ANALYSIS가 True면 요약과 분류를 하나의 노드에서 한 번의 호출로 처리합니다.
+    Config.CLUSTER_ENABLED면 같은 사건의 기사를 묶어 사건마다 한 번만 요약합니다.
+    Config.ROUTING_ENABLED면 짧은 기사 요약과 모든 분류는 fast 모델, 길거나 여러 출처를 종합하는
+    요약만 strong 모델(llm)로 보냅니다. router를 주면 그 라우터의 모델 구성을 그대로 씁니다.
+    streaming 모드에서는 수집/요약/분류를 기사 단위로 겹쳐 실행하는 단일 노드를 사용합니다.
+    (사건 군집화는 전체 기사가 모여야 하므로 streaming 모드에서는 사용하지 않습니다.)
+    batch_client를 주면 요약과 분류 요청을 Batch API 일괄 작업으로 처리합니다.
+    일괄 작업은 기사 단위로 겹쳐 실행하거나 한 호출로 합칠 수 없으므로 streaming과 FUSED_ANALYSIS는 무시합니다.
+    """
+    streaming = Config.STREAMING if streaming is None else streaming
+    streaming = streaming and batch_client is None
 
-    collector = RSSCollectorAgent()
-    summarizer = NewsSummarizerAgent(llm)
-    organizer = NewsOrganizerAgent(llm)
+    metrics = metrics or MetricsCollector()
+    collector = collector or RSSCollectorAgent(metrics=metrics)
+    deduplicator = NewsDeduplicatorAgent() if Config.DEDUP_ENABLED else None
+    # 요약과 분류가 같은 동시 호출/RPM/TPM 예산을 나눠 쓰도록 스케줄러를 공유
+    scheduler = LLMScheduler()
+    if router is None and Config.ROUTING_ENABLED:
+        router = ModelRouter.from_config(llm)
+    if router:
+        llm = router.strong
+    summarizer = NewsSummarizerAgent(
+        llm, scheduler, metrics=metrics, router=router, batch_client=batch_client
+    )
+    # 분류는 정해진 카테고리 중 하나를 고르는 짧은 작업이므로 라우팅 시 항상 fast 모델
+    organizer = NewsOrganizerAgent(
+        router.fast if router else llm,
+        scheduler,
+        metrics=metrics,
+        batch_client=batch_client,
+        ledger=collector.ledger,
+    )
     reporter = ReportGeneratorAgent(llm)
 
     workflow = StateGraph(NewsState)
 
-    workflow.add_node("collect", collector.collect_rss)
-    workflow.add_node("summarize", summarizer.summarize_news)
-    workflow.add_node("organize", organizer.organize_news)
-    workflow.add_node("report", reporter.generate_report)
+    def add_node(name: str, node) -> None:
+        """단계별 실행 시간과 오류 수를 기록하도록 감싼 노드 추가"""
+        workflow.add_node(name, metrics.timed_stage(name, node))
 
-    workflow.set_entry_point("collect")
-    workflow.add_edge("collect", "summarize")
-    workflow.add_edge("summarize", "organize")
-    workflow.add_edge("organize", "report")
+    add_node("record", collector.record_ledger)
+    add_node("report", reporter.generate_report)
+
+    if streaming:
+        pipeline = StreamingNewsPipeline(collector, summarizer, organizer, deduplicator)
+        add_node("stream", pipeline.run)
+        workflow.set_entry_point("stream")
+        workflow.add_edge("stream", "record")
+    else:
+        add_node("collect", collector.collect_rss)
+        if Config.FUSED_ANALYSIS and not batch_client:
+            analyzer = NewsAnalyzerAgent(
+                llm, organizer, scheduler, metrics=metrics, router=router
+            )
+            add_node("analyze", analyzer.analyze_news)
+            first_llm_node, last_llm_node = "analyze", "analyze"
+        else:
+            add_node("summarize", summarizer.summarize_news)
+            add_node("organize", organizer.organize_news)
+            workflow.add_edge("summarize", "organize")
+            first_llm_node, last_llm_node = "summarize", "organize"
+
+        workflow.set_entry_point("collect")
+        # 수집 -> (중복 제거) -> (사건 군집화) -> LLM 단계
+        previous = "collect"
+        if deduplicator:
+            add_node("dedup", deduplicator.deduplicate_news)
+            workflow.add_edge(previous, "dedup")
+            previous = "dedup"
+        if Config.CLUSTER_ENABLED:
+            add_node("cluster", NewsClusterAgent().cluster_news)
+            workflow.add_edge(previous, "cluster")
+            previous = "cluster"
+        workflow.add_edge(previous, first_llm_node)
+        workflow.add_edge(last_llm_node, "record")
+
+    workflow.add_edge("record", "report")
     workflow.add_edge("report", END)
-    return workflow.compile()
+    return workflow.compile(checkpointer=checkpointer)